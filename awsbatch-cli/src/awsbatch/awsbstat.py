@@ -13,22 +13,27 @@
 import re
 import sys
 from builtins import range
-from collections import OrderedDict
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import argparse
 
-from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, Output, config_logger
+from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, Output, config_logger, retry_on_throttling
 from awsbatch.utils import (
     convert_to_date,
     fail,
     get_job_definition_name_by_arn,
     get_job_type,
     is_job_array,
-    is_mnp_job,
     shell_join,
 )
 
 AWS_BATCH_JOB_STATUS = ["SUBMITTED", "PENDING", "RUNNABLE", "STARTING", "RUNNING", "SUCCEEDED", "FAILED"]
+# describe_jobs accepts up to 100 jobs per call
+DESCRIBE_JOBS_CHUNK_SIZE = 100
+DESCRIBE_JOBS_MAX_WORKERS = 10
+LIST_JOBS_MAX_WORKERS = len(AWS_BATCH_JOB_STATUS)
+PROGRESS_BAR_WIDTH = 20
 
 
 def _get_parser():
@@ -60,6 +65,14 @@ def _get_parser():
         "-e", "--expand-children", help="Expand jobs with children (array and MNP)", action="store_true"
     )
     parser.add_argument("-d", "--details", help="Show jobs details", action="store_true")
+    parser.add_argument(
+        "-S",
+        "--summary",
+        help="Show the number of children in each status and the progress of the jobs with children (array and MNP) "
+        "without listing the children. Combined with --expand-children, only the children in the requested status "
+        "are listed",
+        action="store_true",
+    )
     parser.add_argument("-ll", "--log-level", help=argparse.SUPPRESS, default="ERROR")
     parser.add_argument(
         "job_ids",
@@ -116,6 +129,36 @@ class Job:
         self.s3_folder_url = s3_folder_url
 
 
+class JobStatusSummary:
+    """Number of children in each status of a job."""
+
+    def __init__(self, job_id, name, status, size, status_summary):
+        """
+        Initialize the object.
+
+        :param job_id: job id
+        :param name: job name
+        :param status: job status
+        :param size: number of children of the job, 1 for simple jobs
+        :param status_summary: dictionary with the number of children in each status
+        """
+        self.id = job_id
+        self.name = name
+        self.status = status
+        self.size = size
+        for child_status in AWS_BATCH_JOB_STATUS:
+            setattr(self, child_status.lower(), status_summary.get(child_status, 0))
+        completed = status_summary.get("SUCCEEDED", 0) + status_summary.get("FAILED", 0)
+        self.progress = _get_progress_bar(completed, size)
+
+
+def _get_progress_bar(completed, total):
+    """Return a textual progress bar, e.g. [##########..........]  50%."""
+    ratio = float(completed) / total if total else 0.0
+    filled = int(ratio * PROGRESS_BAR_WIDTH)
+    return "[{0}{1}] {2:3d}%".format("#" * filled, "." * (PROGRESS_BAR_WIDTH - filled), int(ratio * 100))
+
+
 class JobConverter:
     """Converter for AWS Batch simple job data object."""
 
@@ -306,6 +349,40 @@ class AWSBstatCommand:
                 sort_keys_function=sort_keys_function,
             )
 
+    def run_summary(self, job_status, expand_children, job_queue=None, job_ids=None):
+        """
+        Print the number of children in each status of the jobs, by filtering by queue or by ids.
+
+        Children are counted from the arrayProperties.statusSummary of the array jobs, so that they are not described.
+        If expand_children is True, the children in the given job status are listed in a second table.
+        """
+        if job_ids:
+            jobs = self.__describe_jobs_for_summary(job_ids)
+        elif job_queue:
+            jobs = self.__list_jobs_for_summary(job_queue, job_status)
+        else:
+            fail("Error listing jobs from AWS Batch. job_ids or job_queue must be defined")
+
+        summary_output = Output(
+            mapping=OrderedDict(
+                [("jobId", "id"), ("jobName", "name"), ("status", "status"), ("size", "size")]
+                + [(child_status, child_status.lower()) for child_status in AWS_BATCH_JOB_STATUS]
+                + [("progress", "progress")]
+            )
+        )
+        for job in jobs:  # pylint: disable=E0606
+            summary_output.add(self.__get_job_status_summary(job, job_status if expand_children else []))
+
+        summary_output.show_table(
+            sort_keys_function=self.__sort_by_status_jobid() if not job_ids else self.__sort_by_key(job_ids)
+        )
+        if expand_children:
+            print()
+            self.output.show_table(
+                keys=["jobId", "jobName", "status", "startedAt", "stoppedAt", "exitCode"],
+                sort_keys_function=self.__sort_by_status_startedat_jobid(),
+            )
+
     @staticmethod
     def __sort_by_key(ordered_keys):  # noqa: D202
         """
@@ -351,6 +428,86 @@ class AWSBstatCommand:
             item.id,
         )
 
+    @staticmethod
+    def __sort_by_status_jobid():
+        """
+        Build a function to sort the output by (status, jobId).
+
+        :return: a function to be used as key argument of the sorted function.
+        """
+        return lambda item: (AWS_BATCH_JOB_STATUS.index(item.status), item.id)
+
+    def __describe_jobs_for_summary(self, job_ids):
+        """
+        Describe the given jobs to summarize the status of their children.
+
+        :param job_ids: job ids or ARNs
+        :return: list of described jobs
+        """
+        try:
+            self.log.info("Describing jobs (%s) for summary" % job_ids)
+            return self.__chunked_describe_jobs(job_ids)
+        except Exception as e:
+            fail("Error describing jobs from AWS Batch. Failed with exception: %s" % e)
+
+    def __list_jobs_for_summary(self, job_queue, job_status):
+        """
+        List the jobs of the queue in the given status and describe the ones with children.
+
+        The job summaries returned by list_jobs do not include the status of the children, hence only the jobs with
+        children are described.
+
+        :param job_queue: job queue name or ARN
+        :param job_status: list of job status to ask
+        :return: list of jobs
+        """
+        try:
+            single_jobs = []
+            jobs_with_children = []
+            for job in self.__list_jobs_by_status(job_queue, job_status):
+                if get_job_type(job) == "SIMPLE":
+                    single_jobs.append(job)
+                else:
+                    jobs_with_children.append(job["jobId"])
+            return single_jobs + self.__chunked_describe_jobs(jobs_with_children)
+        except Exception as e:
+            fail("Error listing jobs from AWS Batch. Failed with exception: %s" % e)
+
+    def __get_job_status_summary(self, job, drill_down_status):
+        """
+        Build the status summary of the job and add its children in the given status to the output.
+
+        Array children are counted from the statusSummary of the parent and listed only if they are in one of the
+        drill down status. MNP jobs do not expose a status summary, so their nodes are described.
+
+        :param job: job dictionary returned by AWS Batch api
+        :param drill_down_status: list of status of the children to add to the output
+        :return: a JobStatusSummary object
+        """
+        try:
+            job_type = get_job_type(job)
+            if job_type == "ARRAY":
+                size = job["arrayProperties"]["size"]
+                status_summary = job["arrayProperties"].get("statusSummary", {})
+                for status in drill_down_status:
+                    if status_summary.get(status):
+                        self.__add_jobs(self.__list_jobs(jobStatus=status, arrayJobId=job["jobId"]))
+            elif job_type == "MNP":
+                size = job["nodeProperties"]["numNodes"]
+                nodes = self.__chunked_describe_jobs(
+                    ["{JOB_ID}#{INDEX}".format(JOB_ID=job["jobId"], INDEX=i) for i in range(0, size)]
+                )
+                status_summary = Counter(node["status"] for node in nodes)
+                self.__add_jobs([node for node in nodes if node["status"] in drill_down_status])
+            else:
+                size = 1
+                status_summary = {job["status"]: 1}
+            return JobStatusSummary(job["jobId"], job["jobName"], job["status"], size, status_summary)
+        except KeyError as e:
+            fail("Error building job summary. Key (%s) not found." % e)
+        except Exception as e:
+            fail("Error summarizing job children. Failed with exception: %s" % e)
+
     def __populate_output_by_job_ids(self, job_ids, details, include_parents=False):
         """
         Add Job item or jobs array children to the output.
@@ -368,10 +525,8 @@ class AWSBstatCommand:
                     # always add parent job
                     if include_parents or get_job_type(job) == "SIMPLE":
                         parent_jobs.append(job)
-                    if is_job_array(job):
-                        jobs_with_children.append((job["jobId"], ":", job["arrayProperties"]["size"]))
-                    elif is_mnp_job(job):
-                        jobs_with_children.append((job["jobId"], "#", job["nodeProperties"]["numNodes"]))
+                    if get_job_type(job) != "SIMPLE":
+                        jobs_with_children.append(self.__get_children_triplet(job))
 
                 # add parent jobs to the output
                 self.__add_jobs(parent_jobs)
@@ -381,6 +536,17 @@ class AWSBstatCommand:
         except Exception as e:
             fail("Error describing jobs from AWS Batch. Failed with exception: %s" % e)
 
+    @staticmethod
+    def __get_children_triplet(job):
+        """
+        Return the (job_id, job_id_separator, job_size) triplet used to expand the children of the job.
+
+        :param job: array or MNP job, either described or returned by list_jobs
+        """
+        if is_job_array(job):
+            return job["jobId"], ":", job["arrayProperties"]["size"]
+        return job["jobId"], "#", job["nodeProperties"]["numNodes"]
+
     def __populate_output_by_parent_ids(self, parent_jobs):
         """
         Add jobs children to the output.
@@ -397,10 +563,9 @@ class AWSBstatCommand:
                     ]
                 )
 
-            if expanded_job_ids:
-                jobs = self.__chunked_describe_jobs(expanded_job_ids)
-
-                # forcing details to be False since already retrieved.
+            # add children to the output as soon as each chunk is described,
+            # forcing details to be False since already retrieved.
+            for jobs in self.__describe_jobs_chunks(expanded_job_ids, ordered=False):
                 self.__add_jobs(jobs)
         except Exception as e:
             fail("Error listing job children. Failed with exception: %s" % e)
@@ -411,17 +576,78 @@ class AWSBstatCommand:
 
         describe_jobs API call has a hard limit on the number of job that can be
         retrieved with a single call. In case job_ids has more than 100 items, this function
-        distributes the describe_jobs call across multiple requests.
+        distributes the describe_jobs call across multiple concurrent requests.
+
+        :param job_ids: list of ids for the jobs to describe.
+        :return: list of described jobs, in the order of the requested chunks.
+        """
+        jobs = []
+        for jobs_chunk in self.__describe_jobs_chunks(job_ids):
+            jobs.extend(jobs_chunk)
+        return jobs
+
+    def __describe_jobs_chunks(self, job_ids, ordered=True):
+        """
+        Describe the given jobs in chunks of DESCRIBE_JOBS_CHUNK_SIZE elements, fetched concurrently.
+
+        Up to DESCRIBE_JOBS_MAX_WORKERS chunks are described at the same time, and throttled calls are retried
+        with exponential backoff and full jitter by retry_on_throttling.
 
         :param job_ids: list of ids for the jobs to describe.
-        :return: list of described jobs.
+        :param ordered: if True yield the chunks in the request order, otherwise as soon as they are described.
+        :return: a generator of lists of described jobs.
+        """
+        describe_jobs = retry_on_throttling(self.batch_client.describe_jobs)
+        chunks = [
+            job_ids[index : index + DESCRIBE_JOBS_CHUNK_SIZE]  # noqa: E203
+            for index in range(0, len(job_ids), DESCRIBE_JOBS_CHUNK_SIZE)
+        ]
+        if len(chunks) <= 1:
+            for jobs_chunk in chunks:
+                yield describe_jobs(jobs=jobs_chunk)["jobs"]
+            return
+
+        self.log.info("Describing %s jobs in %s chunks" % (len(job_ids), len(chunks)))
+        with ThreadPoolExecutor(max_workers=min(DESCRIBE_JOBS_MAX_WORKERS, len(chunks))) as executor:
+            futures = [executor.submit(describe_jobs, jobs=jobs_chunk) for jobs_chunk in chunks]
+            try:
+                for future in futures if ordered else as_completed(futures):
+                    yield future.result()["jobs"]
+            finally:
+                # do not wait for the pending chunks in case of failure
+                for future in futures:
+                    future.cancel()
+
+    def __list_jobs(self, **list_jobs_kwargs):
         """
+        List all the jobs matching the given filters, by following the pagination.
+
+        :param list_jobs_kwargs: filters of the list_jobs call, e.g. jobStatus and jobQueue or arrayJobId
+        :return: list of job summaries
+        """
+        list_jobs = retry_on_throttling(self.batch_client.list_jobs)
         jobs = []
-        for index in range(0, len(job_ids), 100):
-            jobs_chunk = job_ids[index : index + 100]  # noqa: E203
-            jobs.extend(self.batch_client.describe_jobs(jobs=jobs_chunk)["jobs"])
+        next_page = ""
+        while next_page is not None:
+            response = list_jobs(nextToken=next_page, **list_jobs_kwargs)
+            jobs.extend(response["jobSummaryList"])
+            next_page = response.get("nextToken")
         return jobs
 
+    def __list_jobs_by_status(self, job_queue, job_status):
+        """
+        List the jobs of the queue in each of the given status, with a concurrent request per status.
+
+        :param job_queue: job queue name or ARN
+        :param job_status: list of job status to ask
+        :return: list of job summaries, in the order of the given status
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(LIST_JOBS_MAX_WORKERS, len(job_status)))) as executor:
+            jobs_by_status = executor.map(
+                lambda status: self.__list_jobs(jobStatus=status, jobQueue=job_queue), job_status
+            )
+            return [job for jobs in jobs_by_status for job in jobs]
+
     def __add_jobs(self, jobs, details=False):
         """
         Get job info from AWS Batch and add to the output.
@@ -461,20 +687,15 @@ class AWSBstatCommand:
         try:
             single_jobs = []
             jobs_with_children = []
-            for status in job_status:
-                next_page = ""
-                while next_page is not None:
-                    response = self.batch_client.list_jobs(jobStatus=status, jobQueue=job_queue, nextToken=next_page)
-
-                    for job in response["jobSummaryList"]:
-                        if get_job_type(job) != "SIMPLE" and expand_children is True:
-                            jobs_with_children.append(job["jobId"])
-                        else:
-                            single_jobs.append(job)
-                    next_page = response.get("nextToken")
+            for job in self.__list_jobs_by_status(job_queue, job_status):
+                if get_job_type(job) != "SIMPLE" and expand_children is True:
+                    # the size of the job is already part of the list_jobs output, no need to describe it
+                    jobs_with_children.append(self.__get_children_triplet(job))
+                else:
+                    single_jobs.append(job)
 
-            # create output items for job array children
-            self.__populate_output_by_job_ids(jobs_with_children, details)
+            # create output items for job array children, already described with all their details
+            self.__populate_output_by_parent_ids(jobs_with_children)
 
             # add single jobs to the output
             self.__add_jobs(single_jobs, details)
@@ -499,13 +720,21 @@ def main(argv=None):
             job_status_set = OrderedDict((status, "") for status in AWS_BATCH_JOB_STATUS)
         job_status = list(job_status_set)
 
-        AWSBstatCommand(log, boto3_factory).run(
-            job_status=job_status,
-            expand_children=args.expand_children,
-            job_ids=args.job_ids,
-            job_queue=config.job_queue,
-            show_details=args.details,
-        )
+        if args.summary:
+            AWSBstatCommand(log, boto3_factory).run_summary(
+                job_status=job_status,
+                expand_children=args.expand_children,
+                job_ids=args.job_ids,
+                job_queue=config.job_queue,
+            )
+        else:
+            AWSBstatCommand(log, boto3_factory).run(
+                job_status=job_status,
+                expand_children=args.expand_children,
+                job_ids=args.job_ids,
+                job_queue=config.job_queue,
+                show_details=args.details,
+            )
 
     except KeyboardInterrupt:
         print("Exiting...")
@@ -10,19 +10,36 @@
 # This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, express or implied.
 # See the License for the specific language governing permissions and limitations under the License.
 
+import csv
+import hashlib
+import json
 import os
 import pipes
 import re
+import shlex
 import shutil
 import sys
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import argparse
 
-from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, config_logger
+from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, RateLimiter, config_logger, retry_on_throttling
 from awsbatch.utils import S3Uploader, fail, shell_join
 
+# manifest fields, named after the corresponding command line parameters
+MANIFEST_INT_FIELDS = ["vcpus", "memory", "nodes", "array_size", "retry_attempts", "timeout"]
+MANIFEST_FIELDS = [
+    "job_name",
+    "command",
+    "command_file",
+    "arguments",
+    "working_dir",
+    "parent_working_dir",
+    "depends_on",
+] + MANIFEST_INT_FIELDS
+
 
 def _get_parser():
     """
@@ -141,6 +158,30 @@ def _get_parser():
         "with a job ID for array jobs so that each index child of this job must wait for the corresponding index "
         "child of each dependency to complete before it can begin. Syntax: jobId=<string>,type=<string>;...",
     )
+    parser.add_argument(
+        "-mf",
+        "--manifest",
+        help="JSON or CSV file describing the jobs to submit, one job per element or row. Accepted fields are: "
+        "job_name, command, command_file, arguments, working_dir, parent_working_dir, depends_on, vcpus, memory, "
+        "nodes, array_size, retry_attempts and timeout, with the same meaning of the corresponding parameters, "
+        "which are used as default values. command is the command line to execute, command_file the script to "
+        "transfer to the compute instances, uploaded once for all the jobs using it. "
+        "The jobs are submitted concurrently and their IDs are printed as JSON lines",
+    )
+    parser.add_argument(
+        "-cc",
+        "--concurrency",
+        help="The maximum number of concurrent job submissions when using --manifest. Default is 10",
+        type=int,
+        default=10,
+    )
+    parser.add_argument(
+        "-sr",
+        "--submission-rate",
+        help="The maximum number of job submissions per second when using --manifest. Default is 10",
+        type=float,
+        default=10,
+    )
     parser.add_argument("-aws", "--awscli", help=argparse.SUPPRESS, action="store_true")
     parser.add_argument("-ll", "--log-level", help=argparse.SUPPRESS, default="ERROR")
     parser.add_argument(
@@ -160,7 +201,9 @@ def _validate_parameters(args):
 
     :param args: args variable
     """
-    if args.command_file:
+    if args.manifest:
+        _validate_manifest_parameters(args)
+    elif args.command_file:
         if not isinstance(args.command, str):
             fail("The command parameter is required with --command-file option")
         elif not os.path.isfile(args.command):
@@ -172,8 +215,7 @@ def _validate_parameters(args):
     elif not isinstance(args.command, str):
         fail("Parameters validation error: command parameter is required.")
 
-    if args.depends_on and not re.match(r"^(jobId|type)=[^\s,]+([\s,]?(jobId|type)=[^\s]+)*$", args.depends_on):
-        fail("Parameters validation error: please double check --depends-on parameter syntax.")
+    _validate_depends_on(args.depends_on)
 
     if args.env_blacklist and (not args.env or args.env != "all"):
         fail('--env-blacklist parameter can be used only associated with --env "all"')
@@ -182,6 +224,87 @@ def _validate_parameters(args):
         fail("--parent-working-dir and --working-dir parameters cannot be used at the same time")
 
 
+def _validate_depends_on(depends_on):
+    """
+    Validate the syntax of the depends_on parameter.
+
+    :param depends_on: dependencies, as passed to the --depends-on parameter
+    """
+    if depends_on and not re.match(r"^(jobId|type)=[^\s,]+([\s,]?(jobId|type)=[^\s]+)*$", depends_on):
+        fail("Parameters validation error: please double check --depends-on parameter syntax.")
+
+
+def _validate_manifest_parameters(args):
+    """
+    Validate input parameters used together with the --manifest parameter.
+
+    :param args: args variable
+    """
+    if not os.path.isfile(args.manifest):
+        fail("The manifest parameter (%s) must be an existing file" % args.manifest)
+    if isinstance(args.command, str) or args.arguments or args.command_file:
+        fail("Parameters validation error: command and --command-file cannot be specified with --manifest.")
+    if args.job_name or args.input_file:
+        fail("Parameters validation error: --job-name and --input-file cannot be specified with --manifest.")
+    if args.concurrency < 1 or args.submission_rate <= 0:
+        fail("Parameters validation error: --concurrency and --submission-rate must be positive.")
+
+
+def _read_manifest(manifest):
+    """
+    Read the jobs from a JSON or CSV manifest.
+
+    Empty fields are ignored, so that the default value from the command line parameters is used.
+
+    :param manifest: path of the manifest, a JSON list of objects or a CSV file with a header row
+    :return: list of dictionaries with the manifest fields of each job
+    """
+    try:
+        with open(manifest, encoding="utf-8", newline="") as manifest_file:
+            if manifest.lower().endswith(".csv"):
+                jobs = list(csv.DictReader(manifest_file))
+            else:
+                jobs = json.load(manifest_file)
+    except (OSError, ValueError, csv.Error) as e:
+        fail("Error reading manifest (%s). Failed with exception: %s" % (manifest, e))
+
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        fail("Manifest validation error: the manifest must contain a list of jobs.")
+    if not jobs:
+        fail("Manifest validation error: the manifest does not contain any job.")
+
+    return [_parse_manifest_job(job, index) for index, job in enumerate(jobs)]
+
+
+def _parse_manifest_job(job, index):
+    """
+    Validate the fields of a job of the manifest and convert them to the type of the command line parameters.
+
+    :param job: dictionary with the manifest fields of the job
+    :param index: position of the job in the manifest
+    :return: dictionary with the non empty fields of the job
+    """
+    unknown_fields = set(job.keys()) - set(MANIFEST_FIELDS)
+    if unknown_fields:
+        fail("Manifest validation error: unknown fields %s for job %s." % (sorted(unknown_fields), index))
+    job = {field: value for field, value in job.items() if value not in (None, "")}
+    if ("command" in job) == ("command_file" in job):
+        fail("Manifest validation error: either command or command_file is required for job %s." % index)
+    try:
+        for field in MANIFEST_INT_FIELDS:
+            if field in job:
+                job[field] = int(job[field])
+        for field in ["command", "arguments"]:
+            if isinstance(job.get(field), str):
+                job[field] = shlex.split(job[field])
+    except ValueError as e:
+        fail("Manifest validation error: invalid value for job %s. Failed with exception: %s" % (index, e))
+    if "command_file" in job and not os.path.isfile(job["command_file"]):
+        fail("The command_file (%s) of job %s must be an existing file" % (job["command_file"], index))
+    _validate_depends_on(job.get("depends_on"))
+    return job
+
+
 def _generate_unique_job_key(job_name):
     """
     Generate an unique job key to use as identifier.
@@ -417,6 +540,112 @@ def _get_depends_on(args):
     return depends_on
 
 
+def _get_job_definition_and_nodes(config, nodes):
+    """
+    Select the job definition for a standard or MNP submission.
+
+    :param config: config object
+    :param nodes: number of nodes requested for the job
+    :return: job definition and number of nodes, None for standard submissions
+    """
+    if nodes and nodes > 1:
+        if not hasattr(config, "job_definition_mnp"):
+            fail("Current cluster does not support MNP jobs submission")
+        return config.job_definition_mnp, nodes
+    return config.job_definition, None
+
+
+def _upload_script(s3_uploader, script_path, uploaded_scripts):
+    """
+    Upload a job script named after the hash of its content, if not already uploaded.
+
+    :param s3_uploader: S3Uploader object
+    :param script_path: path of the script to upload
+    :param uploaded_scripts: dictionary of the scripts already uploaded, by path, updated by the function
+    :return: the name of the uploaded script
+    """
+    if script_path not in uploaded_scripts:
+        try:
+            with open(script_path, "rb") as script_file:
+                script_hash = hashlib.sha256(script_file.read()).hexdigest()
+            script_name = "script-{0}.sh".format(script_hash)
+            if script_name not in uploaded_scripts.values():
+                s3_uploader.put_file(script_path, script_name)
+        except Exception as e:
+            fail("Error creating job script. Failed with exception: %s" % e)
+        uploaded_scripts[script_path] = script_name
+    return uploaded_scripts[script_path]
+
+
+def _get_manifest_submissions(args, manifest_jobs, boto3_factory, config, log):
+    """
+    Upload the files shared by the jobs of the manifest and compute the parameters of each submission.
+
+    All the jobs share the same S3 folder, containing the environment file and a single copy of each job script.
+
+    :param args: input arguments, used as default values of the manifest fields
+    :param manifest_jobs: jobs read from the manifest
+    :param boto3_factory: initialized Boto3ClientFactory object
+    :param config: config object
+    :param log: log
+    :return: list of the keyword arguments of AWSBsubCommand.get_submission_args for each job
+    """
+    manifest_name = re.sub(r"\W+", "_", os.path.splitext(os.path.basename(args.manifest))[0])
+    job_s3_folder = "{prefix}/batch/{job_key}/".format(
+        prefix=config.artifact_directory, job_key=_generate_unique_job_key(manifest_name)
+    )
+    if args.env and any("command_file" not in manifest_job for manifest_job in manifest_jobs):
+        fail("Parameters validation error: --env can be used with --manifest only for jobs with a command_file.")
+    jobs_args = [argparse.Namespace(**dict(vars(args), **manifest_job)) for manifest_job in manifest_jobs]
+    for index, job_args in enumerate(jobs_args):
+        # The fields of the job are merged with the input arguments, that are validated alone
+        if job_args.working_dir and job_args.parent_working_dir:
+            fail(
+                "Manifest validation error: working_dir and parent_working_dir cannot be used at the same time "
+                "for job %s." % index
+            )
+    s3_uploader = S3Uploader(boto3_factory, config.s3_bucket, job_s3_folder)
+
+    env_file = None
+    if args.env:
+        env_file = manifest_name + ".env.sh"
+        env_blacklist = args.env_blacklist if args.env_blacklist else config.env_blacklist
+        _get_env_and_upload(s3_uploader, args.env, env_blacklist, env_file, log)
+
+    submissions = []
+    uploaded_scripts = {}
+    for manifest_job, job_args in zip(manifest_jobs, jobs_args):
+        if "command_file" in manifest_job:
+            job_script = _upload_script(s3_uploader, manifest_job["command_file"], uploaded_scripts)
+            bash_command = _compose_bash_command(
+                job_args, config.s3_bucket, config.region, job_s3_folder, job_script, env_file
+            )
+            command = ["/bin/bash", "-c", bash_command]
+            default_job_name = os.path.basename(manifest_job["command_file"])
+        else:
+            command = manifest_job["command"] + list(job_args.arguments)
+            default_job_name = os.path.basename(command[0])
+        job_definition, nodes = _get_job_definition_and_nodes(config, job_args.nodes)
+        submissions.append(
+            {
+                "job_definition": job_definition,
+                "job_name": manifest_job.get("job_name", re.sub(r"\W+", "_", default_job_name)),
+                "job_queue": config.job_queue,
+                "command": command,
+                "nodes": nodes,
+                "vcpus": job_args.vcpus,
+                "memory": job_args.memory,
+                "array_size": job_args.array_size,
+                "retry_attempts": job_args.retry_attempts,
+                "timeout": job_args.timeout,
+                "dependencies": _get_depends_on(job_args),
+                "env": [("PCLUSTER_JOB_S3_URL", f"s3://{config.s3_bucket}/{job_s3_folder}")],
+            }
+        )
+    log.info("Uploaded %s job scripts for %s jobs", len(set(uploaded_scripts.values())), len(submissions))
+    return submissions
+
+
 class AWSBsubCommand:
     """awsbsub command."""
 
@@ -430,7 +659,7 @@ class AWSBsubCommand:
         self.log = log
         self.batch_client = boto3_factory.get_client("batch")
 
-    def run(  # noqa: C901 FIXME
+    def run(
         self,
         job_definition,
         job_name,
@@ -447,73 +676,147 @@ class AWSBsubCommand:
     ):  # pylint: disable=too-many-positional-arguments
         """Submit the job."""
         try:
-            # array properties
-            array_properties = {}
-            if array_size:
-                array_properties.update(size=array_size)
-
-            retry_strategy = {"attempts": retry_attempts}
-
-            depends_on = dependencies if dependencies else []
-
-            # populate container overrides
-            container_overrides = {"command": command}
-            if vcpus:
-                container_overrides.update(vcpus=vcpus)
-            if memory:
-                container_overrides.update(memory=memory)
-            # populate environment variables
-            environment = []
-            for env_var in env:
-                environment.append({"name": env_var[0], "value": env_var[1]})
-            container_overrides.update(environment=environment)
-
-            # common submission arguments
-            submission_args = {
-                "jobName": job_name,
-                "jobQueue": job_queue,
-                "dependsOn": depends_on,
-                "retryStrategy": retry_strategy,
-            }
-
-            if nodes:
-                submission_args.update({"jobDefinition": job_definition})
-
-                target_nodes = "0:"
-                # populate node overrides
-                node_overrides = {
-                    "numNodes": nodes,
-                    "nodePropertyOverrides": [{"targetNodes": target_nodes, "containerOverrides": container_overrides}],
-                }
-                submission_args.update({"nodeOverrides": node_overrides})
-                if timeout:
-                    submission_args.update({"timeout": {"attemptDurationSeconds": timeout}})
-            else:
-                # Standard submission
-                submission_args.update({"jobDefinition": job_definition})
-                submission_args.update({"containerOverrides": container_overrides})
-                submission_args.update({"arrayProperties": array_properties})
-                if timeout:
-                    submission_args.update({"timeout": {"attemptDurationSeconds": timeout}})
-
+            submission_args = self.get_submission_args(
+                job_definition=job_definition,
+                job_name=job_name,
+                job_queue=job_queue,
+                command=command,
+                nodes=nodes,
+                vcpus=vcpus,
+                memory=memory,
+                array_size=array_size,
+                retry_attempts=retry_attempts,
+                timeout=timeout,
+                dependencies=dependencies,
+                env=env,
+            )
             self.log.debug("Job submission args: %s", submission_args)
             response = self.batch_client.submit_job(**submission_args)
             print("Job %s (%s) has been submitted." % (response["jobId"], response["jobName"]))
         except Exception as e:
             fail("Error submitting job to AWS Batch. Failed with exception: %s" % e)
 
+    def run_bulk(self, submissions, concurrency, submission_rate):
+        """
+        Submit the jobs concurrently, printing a JSON line with the ID of each job as soon as it is submitted.
 
-def main():
+        :param submissions: list of the keyword arguments of get_submission_args for each job
+        :param concurrency: maximum number of concurrent submissions
+        :param submission_rate: maximum number of submissions per second
+        """
+        submit_job = retry_on_throttling(self.batch_client.submit_job)
+        rate_limiter = RateLimiter(submission_rate)
+
+        def _submit_job(submission_args):
+            rate_limiter.acquire()
+            self.log.debug("Job submission args: %s", submission_args)
+            return submit_job(**submission_args)
+
+        failed_jobs = 0
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(_submit_job, self.get_submission_args(**submission)): index
+                for index, submission in enumerate(submissions)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                job = {"index": index, "jobName": submissions[index]["job_name"]}
+                try:
+                    response = future.result()
+                    job.update(jobId=response["jobId"], jobArn=response.get("jobArn"))
+                except Exception as e:
+                    self.log.error("Error submitting job %s: %s", index, e)
+                    job.update(error=str(e))
+                    failed_jobs += 1
+                print(json.dumps(job), flush=True)
+
+        if failed_jobs:
+            fail("Error submitting %s of %s jobs to AWS Batch." % (failed_jobs, len(submissions)))
+
+    @staticmethod
+    def get_submission_args(
+        job_definition,
+        job_name,
+        job_queue,
+        command,
+        nodes=None,
+        vcpus=None,
+        memory=None,
+        array_size=None,
+        retry_attempts=1,
+        timeout=None,
+        dependencies=None,
+        env=None,
+    ):  # pylint: disable=too-many-positional-arguments
+        """Return the arguments of the submit_job request."""
+        # array properties
+        array_properties = {}
+        if array_size:
+            array_properties.update(size=array_size)
+
+        retry_strategy = {"attempts": retry_attempts}
+
+        depends_on = dependencies if dependencies else []
+
+        # populate container overrides
+        container_overrides = {"command": command}
+        if vcpus:
+            container_overrides.update(vcpus=vcpus)
+        if memory:
+            container_overrides.update(memory=memory)
+        # populate environment variables
+        environment = []
+        for env_var in env:
+            environment.append({"name": env_var[0], "value": env_var[1]})
+        container_overrides.update(environment=environment)
+
+        # common submission arguments
+        submission_args = {
+            "jobName": job_name,
+            "jobQueue": job_queue,
+            "dependsOn": depends_on,
+            "retryStrategy": retry_strategy,
+        }
+
+        if nodes:
+            submission_args.update({"jobDefinition": job_definition})
+
+            target_nodes = "0:"
+            # populate node overrides
+            node_overrides = {
+                "numNodes": nodes,
+                "nodePropertyOverrides": [{"targetNodes": target_nodes, "containerOverrides": container_overrides}],
+            }
+            submission_args.update({"nodeOverrides": node_overrides})
+            if timeout:
+                submission_args.update({"timeout": {"attemptDurationSeconds": timeout}})
+        else:
+            # Standard submission
+            submission_args.update({"jobDefinition": job_definition})
+            submission_args.update({"containerOverrides": container_overrides})
+            submission_args.update({"arrayProperties": array_properties})
+            if timeout:
+                submission_args.update({"timeout": {"attemptDurationSeconds": timeout}})
+        return submission_args
+
+
+def main(argv=None):
     """Command entrypoint."""
     try:
         # parse input parameters and config file
-        args = _get_parser().parse_args()
+        args = _get_parser().parse_args(argv)
         _validate_parameters(args)
         log = config_logger(args.log_level)
         log.info("Input parameters: %s", args)
         config = AWSBatchCliConfig(log=log, cluster=args.cluster)
         boto3_factory = Boto3ClientFactory(region=config.region, proxy=config.proxy)
 
+        if args.manifest:
+            # bulk submission, sharing the clients and the uploaded files among all the jobs
+            submissions = _get_manifest_submissions(args, _read_manifest(args.manifest), boto3_factory, config, log)
+            AWSBsubCommand(log, boto3_factory).run_bulk(submissions, args.concurrency, args.submission_rate)
+            return
+
         # define job name
         if args.job_name:
             job_name = args.job_name
@@ -536,14 +839,7 @@ def main():
         depends_on = _get_depends_on(args)
 
         # select submission (standard vs MNP)
-        if args.nodes and args.nodes > 1:
-            if not hasattr(config, "job_definition_mnp"):
-                fail("Current cluster does not support MNP jobs submission")
-            job_definition = config.job_definition_mnp
-            nodes = args.nodes
-        else:
-            job_definition = config.job_definition
-            nodes = None
+        job_definition, nodes = _get_job_definition_and_nodes(config, args.nodes)
 
         AWSBsubCommand(log, boto3_factory).run(
             job_definition=job_definition,
@@ -11,10 +11,15 @@
 # See the License for the specific language governing permissions and limitations under the License.
 
 import errno
+import json
 import logging
 import operator
 import os
+import random
 import re
+import tempfile
+import threading
+import time
 from collections import namedtuple
 from logging.handlers import RotatingFileHandler
 
@@ -27,6 +32,24 @@ from tabulate import tabulate
 
 from awsbatch.utils import fail, get_installed_version, get_region_by_stack_id
 
+THROTTLING_ERROR_CODES = ["Throttling", "ThrottlingException", "TooManyRequestsException", "RequestLimitExceeded"]
+THROTTLING_MAX_ATTEMPTS = 8
+THROTTLING_BASE_BACKOFF = 0.5
+THROTTLING_MAX_BACKOFF = 20
+STACK_CACHE_DEFAULT_TTL = 300
+STACK_CACHE_ATTRIBUTES = [
+    "region",
+    "proxy",
+    "s3_bucket",
+    "artifact_directory",
+    "batch_cli_requirements",
+    "compute_environment",
+    "job_queue",
+    "job_definition",
+    "job_definition_mnp",
+    "head_node_ip",
+]
+
 
 class Output:
     """Generic Output object."""
@@ -117,6 +140,53 @@ class Boto3ClientFactory:
             fail("AWS %s service failed with exception: %s" % (service, e))
 
 
+def retry_on_throttling(function, max_attempts=THROTTLING_MAX_ATTEMPTS):
+    """
+    Wrap a boto3 client method to retry it with exponential backoff and full jitter when throttled.
+
+    :param function: the boto3 client method to call
+    :param max_attempts: maximum number of attempts before raising the throttling error
+    :return: the wrapped function
+    """
+
+    def _retry_on_throttling(*args, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                return function(*args, **kwargs)
+            except ClientError as e:
+                attempt += 1
+                if e.response.get("Error", {}).get("Code") not in THROTTLING_ERROR_CODES or attempt >= max_attempts:
+                    raise
+                backoff = min(THROTTLING_MAX_BACKOFF, THROTTLING_BASE_BACKOFF * 2 ** (attempt - 1))
+                time.sleep(random.uniform(0, backoff))  # nosec B311
+
+    return _retry_on_throttling
+
+
+class RateLimiter:
+    """Thread safe limiter of the number of requests per second."""
+
+    def __init__(self, rate):
+        """
+        Initialize the object.
+
+        :param rate: maximum number of requests per second, 0 to not limit the requests
+        """
+        self.interval = 1.0 / rate if rate else 0
+        self.next_request_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until the next request can be sent."""
+        with self.lock:
+            now = time.monotonic()
+            wait_time = self.next_request_time - now
+            self.next_request_time = max(now, self.next_request_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
 CliRequirement = namedtuple("Requirement", "package operator version")
 
 
@@ -153,6 +223,74 @@ class CliRequirementsMatcher:
                 fail(f"The cluster requires {req.package}{req.operator}{req.version}")
 
 
+class StackCache:
+    """
+    Local cache of the cluster information retrieved from the CloudFormation stack.
+
+    Entries are stored in ~/.parallelcluster/awsbatch-cli-stack-cache.json, keyed by cluster name and region, and
+    are used without calling CloudFormation for AWSBATCH_CLI_STACK_CACHE_TTL seconds (300 by default, 0 disables
+    the cache). Within that time an updated, or deleted and recreated, stack is not detected, and the previous
+    information is returned. Once expired, an entry is reused only if the LastUpdatedTime of the stack did not change.
+    """
+
+    def __init__(self, log):
+        """Initialize the object."""
+        self.log = log
+        self.cache_file = os.path.expanduser(os.path.join("~", ".parallelcluster", "awsbatch-cli-stack-cache.json"))
+        try:
+            self.ttl = int(os.environ.get("AWSBATCH_CLI_STACK_CACHE_TTL", STACK_CACHE_DEFAULT_TTL))
+        except ValueError:
+            log.warning("Invalid AWSBATCH_CLI_STACK_CACHE_TTL value, using %s seconds", STACK_CACHE_DEFAULT_TTL)
+            self.ttl = STACK_CACHE_DEFAULT_TTL
+
+    def get(self, key):
+        """
+        Return the cache entry for the given key, expired or not.
+
+        :param key: cache key
+        :return: a dictionary with the lastUpdatedTime of the stack, the cacheTime and the attributes, or None
+        """
+        if self.ttl <= 0:
+            return None
+        return self.__load().get(key)
+
+    def is_expired(self, entry):
+        """Return True if the entry has been cached more than ttl seconds ago."""
+        return time.time() - entry.get("cacheTime", 0) > self.ttl
+
+    def put(self, key, last_updated_time, attributes):
+        """
+        Store the attributes resolved from the stack.
+
+        :param key: cache key
+        :param last_updated_time: LastUpdatedTime of the stack, used to validate the entry once expired
+        :param attributes: dictionary of the AWSBatchCliConfig attributes to cache
+        """
+        if self.ttl <= 0:
+            return
+        entries = self.__load()
+        entries[key] = {"lastUpdatedTime": last_updated_time, "cacheTime": time.time(), "attributes": attributes}
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            os.makedirs(cache_dir, exist_ok=True)
+            # write to a temporary file first, so that concurrent invocations never read a partial file
+            with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False) as cache_file:
+                json.dump(entries, cache_file)
+            os.replace(cache_file.name, self.cache_file)
+        except OSError as e:
+            self.log.warning("Unable to write stack cache file %s: %s", self.cache_file, e)
+
+    def __load(self):
+        try:
+            with open(self.cache_file, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.log.warning("Ignoring unreadable stack cache file %s: %s", self.cache_file, e)
+            return {}
+
+
 class AWSBatchCliConfig:
     """AWS ParallelCluster AWS Batch CLI configuration object."""
 
@@ -277,6 +415,14 @@ class AWSBatchCliConfig:
         """
         try:
             self.stack_name = cluster
+            stack_cache = StackCache(log)
+            cache_key = "{0}:{1}".format(cluster, self.region or boto3.session.Session().region_name)
+            cached_stack = stack_cache.get(cache_key)
+            if cached_stack and not stack_cache.is_expired(cached_stack):
+                log.info("Using cached information of stack (%s)" % self.stack_name)
+                self.__init_from_cache(cached_stack["attributes"])
+                return
+
             log.info("Describing stack (%s)" % self.stack_name)
             # get required values from the output of the describe-stack command
             # don't use proxy because we are in the client and use default region
@@ -284,12 +430,23 @@ class AWSBatchCliConfig:
             cfn_client = boto3_factory.get_client("cloudformation")
             stack = cfn_client.describe_stacks(StackName=self.stack_name).get("Stacks")[0]
             log.debug(stack)
+            stack_status = stack.get("StackStatus")
+            last_updated_time = str(stack.get("LastUpdatedTime", stack.get("CreationTime")))
+            if (
+                cached_stack
+                and cached_stack["lastUpdatedTime"] == last_updated_time
+                and stack_status in ["CREATE_COMPLETE", "UPDATE_COMPLETE"]
+            ):
+                log.info("Stack (%s) not updated since it was cached" % self.stack_name)
+                self.__init_from_cache(cached_stack["attributes"])
+                stack_cache.put(cache_key, last_updated_time, cached_stack["attributes"])
+                return
+
             if self.region is None:
                 self.region = get_region_by_stack_id(stack.get("StackId"))
             self.proxy = "NONE"
 
             scheduler = None
-            stack_status = stack.get("StackStatus")
             if stack_status in ["CREATE_COMPLETE", "UPDATE_COMPLETE"]:
                 for output in stack.get("Outputs", []):
                     output_key = output.get("OutputKey")
@@ -328,9 +485,24 @@ class AWSBatchCliConfig:
             elif scheduler != "awsbatch":
                 fail(f"This command cannot be used with a {scheduler} cluster.")
 
+            stack_cache.put(
+                cache_key,
+                last_updated_time,
+                {name: getattr(self, name) for name in STACK_CACHE_ATTRIBUTES if hasattr(self, name)},
+            )
+
         except (ClientError, ParamValidationError) as e:
             fail("Error getting cluster information from AWS CloudFormation. Failed with exception: %s" % e)
 
+    def __init_from_cache(self, attributes):
+        """
+        Init object attributes from the ones cached for the stack.
+
+        :param attributes: dictionary of cached attributes
+        """
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
 
 def config_logger(log_level):
     """
@@ -1,7 +1,10 @@
+import copy
 import json
 import os
+import threading
 
 import pytest
+from botocore.exceptions import ClientError
 
 from awsbatch import awsbstat
 from tests.conftest import DEFAULT_AWSBATCHCLICONFIG_MOCK_CONFIG
@@ -23,8 +26,15 @@ def boto3_stubber_path():
     return "awsbatch.common.boto3"
 
 
+@pytest.fixture()
+def serial_list_jobs(mocker):
+    # the Stubber expects the list_jobs requests of the different status in order
+    mocker.patch("awsbatch.awsbstat.LIST_JOBS_MAX_WORKERS", 1)
+
+
 @pytest.mark.usefixtures("awsbatchcliconfig_mock")
 @pytest.mark.usefixtures("convert_to_date_mock")
+@pytest.mark.usefixtures("serial_list_jobs")
 class TestOutput:
     def test_no_jobs_default_status(self, capsys, boto3_stubber, test_datadir):
         empty_response = {"jobSummaryList": []}
@@ -162,6 +172,71 @@ class TestOutput:
 
         assert capsys.readouterr().out == read_text(test_datadir / expected)
 
+    def test_concurrent_status_listing_detailed(self, capsys, mocker, shared_datadir):
+        job_status = ["RUNNING", "FAILED"]
+        list_jobs_responses = {
+            status: json.loads(read_text(shared_datadir / f"aws_api_responses/batch_list-jobs_{status}.json"))
+            for status in job_status
+        }
+        # each status is listed by a different thread, the barrier is broken if the requests are serialized
+        barrier = threading.Barrier(len(job_status), timeout=5)
+
+        def _list_jobs(jobStatus, jobQueue, nextToken):
+            barrier.wait()
+            return list_jobs_responses[jobStatus]
+
+        def _describe_jobs(jobs):
+            return {"jobs": [dict(job, startedAt=1543511674229) for job in list_jobs_summaries if job["jobId"] in jobs]}
+
+        list_jobs_summaries = [job for status in job_status for job in list_jobs_responses[status]["jobSummaryList"]]
+        mocker.patch("awsbatch.awsbstat.LIST_JOBS_MAX_WORKERS", len(job_status))
+        batch_client = mocker.patch("awsbatch.common.boto3").client.return_value
+        batch_client.list_jobs.side_effect = _list_jobs
+        batch_client.describe_jobs.side_effect = _describe_jobs
+
+        awsbstat.main(["-c", "cluster", "-s", ",".join(job_status), "-d"])
+
+        # jobs of all the status are described at once, in the order of the requested status
+        batch_client.describe_jobs.assert_called_once_with(jobs=[job["jobId"] for job in list_jobs_summaries])
+        assert capsys.readouterr().out.count("jobId") == len(list_jobs_summaries)
+
+    def test_large_array_job(self, capsys, mocker, shared_datadir):
+        array_size = 250
+        parent_id = "3286a19c-68a9-47c9-8000-427d23ffc7ca"
+        response_parent = json.loads(
+            read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_single_array_job.json")
+        )
+        response_parent["jobs"][0]["arrayProperties"]["size"] = array_size
+        child = json.loads(
+            read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_single_array_job_children.json")
+        )["jobs"][0]
+
+        requested_chunks = []
+        lock = threading.Lock()
+
+        def _describe_jobs(jobs):
+            with lock:
+                requested_chunks.append(jobs)
+                # throttle the first request of the second chunk
+                throttled = jobs[0] == f"{parent_id}:100" and requested_chunks.count(jobs) == 1
+            if throttled:
+                raise ClientError({"Error": {"Code": "TooManyRequestsException"}}, "DescribeJobs")
+            if jobs == [parent_id]:
+                return response_parent
+            return {"jobs": [dict(copy.deepcopy(child), jobId=job_id) for job_id in jobs]}
+
+        mocker.patch("awsbatch.common.boto3").client.return_value.describe_jobs.side_effect = _describe_jobs
+        sleep_mock = mocker.patch("awsbatch.common.time.sleep")
+
+        awsbstat.main(["-c", "cluster", parent_id])
+
+        # children are described in chunks of 100, retrying the throttled one
+        assert sorted(len(chunk) for chunk in requested_chunks) == [1, 50, 100, 100, 100]
+        sleep_mock.assert_called_once()
+        rows = capsys.readouterr().out.splitlines()[2:]
+        assert len(rows) == array_size + 1
+        assert [row.split()[0] for row in rows[1:]] == sorted(f"{parent_id}:{i}" for i in range(array_size))
+
     @pytest.mark.parametrize(
         "args, expected",
         [
@@ -199,6 +274,74 @@ class TestOutput:
 
         assert capsys.readouterr().out == read_text(test_datadir / expected)
 
+    def test_summary_array_job(self, capsys, boto3_stubber, test_datadir, shared_datadir):
+        parent_id = "3286a19c-68a9-47c9-8000-427d23ffc7ca"
+        response_parent = json.loads(
+            read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_single_array_job.json")
+        )
+        response_parent["jobs"][0]["status"] = "RUNNING"
+        response_parent["jobs"][0]["arrayProperties"]["size"] = 4
+        response_parent["jobs"][0]["arrayProperties"]["statusSummary"].update(
+            {"RUNNING": 2, "SUCCEEDED": 1, "FAILED": 1}
+        )
+        boto3_stubber(
+            "batch",
+            [
+                MockedBoto3Request(
+                    method="describe_jobs", response=response_parent, expected_params={"jobs": [parent_id]}
+                ),
+                # only the children in the requested status are listed
+                MockedBoto3Request(
+                    method="list_jobs",
+                    response={
+                        "jobSummaryList": [
+                            {
+                                "jobId": f"{parent_id}:1",
+                                "jobName": "array-succeeded",
+                                "status": "FAILED",
+                                "createdAt": 1543511353505,
+                                "startedAt": 1543511674229,
+                                "stoppedAt": 1543511676288,
+                                "container": {"exitCode": 1},
+                                "arrayProperties": {"index": 1},
+                            }
+                        ]
+                    },
+                    expected_params={"arrayJobId": parent_id, "jobStatus": "FAILED", "nextToken": ""},
+                ),
+            ],
+        )
+
+        awsbstat.main(["-c", "cluster", "--summary", "-e", "-s", "FAILED", parent_id])
+
+        assert capsys.readouterr().out == read_text(test_datadir / "expected_output.txt")
+
+    def test_summary_mnp_job(self, capsys, boto3_stubber, test_datadir, shared_datadir):
+        mnp_id = "6abf3ecd-07a8-4faa-8a65-79e7404eb50f"
+        response_parent = json.loads(
+            read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_single_mnp_job.json")
+        )
+        response_children = json.loads(
+            read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_single_mnp_job_children.json")
+        )
+        boto3_stubber(
+            "batch",
+            [
+                MockedBoto3Request(
+                    method="describe_jobs", response=response_parent, expected_params={"jobs": [mnp_id]}
+                ),
+                MockedBoto3Request(
+                    method="describe_jobs",
+                    response=response_children,
+                    expected_params={"jobs": [f"{mnp_id}#0", f"{mnp_id}#1"]},
+                ),
+            ],
+        )
+
+        awsbstat.main(["-c", "cluster", "-S", mnp_id])
+
+        assert capsys.readouterr().out == read_text(test_datadir / "expected_output.txt")
+
     def test_all_status_detailed(self, capsys, boto3_stubber, test_datadir, shared_datadir):
         mocked_requests = []
         jobs_ids = []
@@ -270,21 +413,7 @@ class TestOutput:
                     },
                 )
             )
-        # Mock describe-jobs on parents
-        describe_parent_jobs_response = json.loads(
-            read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_ALL_parents.json")
-        )
-        jobs_with_children_ids = []
-        for job in describe_parent_jobs_response["jobs"]:
-            jobs_with_children_ids.append(job["jobId"])
-        mocked_requests.append(
-            MockedBoto3Request(
-                method="describe_jobs",
-                response=describe_parent_jobs_response,
-                expected_params={"jobs": jobs_with_children_ids},
-            )
-        )
-        # Mock describe-jobs on children
+        # Mock describe-jobs on children, expanded from the size of the parents returned by list-jobs
         describe_children_jobs_response = json.loads(
             read_text(shared_datadir / "aws_api_responses/batch_describe-jobs_ALL_children.json")
         )
@@ -0,0 +1,119 @@
+import hashlib
+import json
+
+import pytest
+
+from awsbatch import awsbsub
+
+CONFIG = {
+    "s3_bucket": "bucket",
+    "artifact_directory": "parallelcluster/clusters/cluster",
+    "job_definition": "job_definition",
+    "job_queue": "job_queue",
+    "env_blacklist": None,
+}
+
+
+@pytest.fixture()
+def config_mock(awsbatchcliconfig_mock):
+    for key, value in CONFIG.items():
+        setattr(awsbatchcliconfig_mock.return_value, key, value)
+    return awsbatchcliconfig_mock
+
+
+@pytest.fixture()
+def clients(mocker):
+    """Mock the boto3 clients created by the command, by service."""
+    mocked_clients = {"batch": mocker.MagicMock(), "s3": mocker.MagicMock()}
+    mocker.patch("awsbatch.common.boto3").client.side_effect = lambda service, **kwargs: mocked_clients[service]
+    mocked_clients["batch"].submit_job.side_effect = lambda **kwargs: {
+        "jobId": "id-" + kwargs["jobName"],
+        "jobName": kwargs["jobName"],
+        "jobArn": "arn-" + kwargs["jobName"],
+    }
+    return mocked_clients
+
+
+@pytest.mark.usefixtures("config_mock")
+class TestManifest:
+    def test_csv_manifest(self, capsys, clients, tmpdir):
+        script = tmpdir.join("sweep.sh")
+        script.write("#!/bin/bash\necho $1")
+        manifest = tmpdir.join("jobs.csv")
+        manifest.write(
+            "job_name,command,command_file,arguments,vcpus\n"
+            f"sweep-1,,{script},--lr 0.1,\n"
+            f"sweep-2,,{script},--lr 0.2,4\n"
+            "inline,hostname -f,,,\n"
+        )
+
+        awsbsub.main(["-c", "cluster", "--manifest", str(manifest), "-p", "2"])
+
+        # the script shared by the jobs is uploaded once, named after its content
+        script_name = "script-{0}.sh".format(hashlib.sha256(script.read_binary()).hexdigest())
+        clients["s3"].upload_file.assert_called_once()
+        assert clients["s3"].upload_file.call_args[0][2].endswith("/" + script_name)
+
+        submissions = {
+            call[1]["jobName"]: call[1]["containerOverrides"] for call in clients["batch"].submit_job.call_args_list
+        }
+        assert submissions["sweep-1"]["vcpus"] == 2
+        assert submissions["sweep-2"]["vcpus"] == 4
+        assert submissions["sweep-2"]["command"][2].endswith(f"./{script_name} --lr 0.2")
+        assert submissions["inline"]["command"] == ["hostname", "-f"]
+
+        jobs = sorted((json.loads(line) for line in capsys.readouterr().out.splitlines()), key=lambda job: job["index"])
+        assert jobs == [
+            {"index": index, "jobName": job_name, "jobId": f"id-{job_name}", "jobArn": f"arn-{job_name}"}
+            for index, job_name in enumerate(["sweep-1", "sweep-2", "inline"])
+        ]
+
+    def test_submission_failure(self, capsys, clients, tmpdir):
+        manifest = tmpdir.join("jobs.json")
+        manifest.write(json.dumps([{"command": "hostname"}, {"command": "uptime", "memory": 256}]))
+        clients["batch"].submit_job.side_effect = [
+            {"jobId": "id", "jobName": "hostname", "jobArn": "arn"},
+            Exception("error"),
+        ]
+
+        with pytest.raises(SystemExit):
+            awsbsub.main(["-c", "cluster", "--manifest", str(manifest), "--concurrency", "1"])
+
+        output = capsys.readouterr()
+        assert output.err == "Error submitting 1 of 2 jobs to AWS Batch.\n"
+        assert [json.loads(line) for line in output.out.splitlines()] == [
+            {"index": 0, "jobName": "hostname", "jobId": "id", "jobArn": "arn"},
+            {"index": 1, "jobName": "uptime", "error": "error"},
+        ]
+
+    @pytest.mark.parametrize(
+        "jobs, message",
+        [
+            ([{"command": "hostname", "queue": "queue"}], "unknown fields ['queue'] for job 0"),
+            ([{"command": "hostname"}, {"vcpus": 1}], "either command or command_file is required for job 1"),
+            ([{"command": "hostname", "vcpus": "two"}], "invalid value for job 0"),
+        ],
+    )
+    def test_invalid_manifest(self, capsys, clients, tmpdir, jobs, message):
+        manifest = tmpdir.join("jobs.json")
+        manifest.write(json.dumps(jobs))
+
+        with pytest.raises(SystemExit):
+            awsbsub.main(["-c", "cluster", "--manifest", str(manifest)])
+        assert message in capsys.readouterr().err
+        clients["batch"].submit_job.assert_not_called()
+
+    def test_working_dirs_of_job_and_arguments(self, capsys, clients, tmpdir):
+        script = tmpdir.join("job.sh")
+        script.write("#!/bin/bash\nhostname")
+        manifest = tmpdir.join("jobs.json")
+        manifest.write(json.dumps([{"command_file": str(script)}, {"command_file": str(script), "working_dir": "/w"}]))
+
+        # The working_dir of a job cannot be combined with the --parent-working-dir argument
+        with pytest.raises(SystemExit):
+            awsbsub.main(["-c", "cluster", "--manifest", str(manifest), "--parent-working-dir", "/p"])
+        assert "working_dir and parent_working_dir cannot be used at the same time for job 1" in (
+            capsys.readouterr().err
+        )
+        clients["s3"].upload_file.assert_not_called()
+        clients["batch"].submit_job.assert_not_called()
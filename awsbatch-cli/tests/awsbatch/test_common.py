@@ -0,0 +1,103 @@
+import logging
+import os
+from datetime import datetime
+
+import pytest
+
+from awsbatch import common
+from awsbatch.common import AWSBatchCliConfig, StackCache
+from tests.utils import MockedBoto3Request
+
+STACK_NAME = "cluster"
+
+
+@pytest.fixture()
+def boto3_stubber_path():
+    # we need to set the region in the environment because the Boto3ClientFactory requires it.
+    os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+    return "awsbatch.common.boto3"
+
+
+@pytest.fixture()
+def home_dir(mocker, tmpdir):
+    """Use an empty home directory, without awsbatch-cli config file and stack cache."""
+    mocker.patch.dict(os.environ, {"HOME": str(tmpdir)})
+    mocker.patch("awsbatch.common.CliRequirementsMatcher")
+    return tmpdir
+
+
+def _describe_stacks_request(last_updated_time, head_node_ip="10.0.0.1"):
+    outputs = {
+        "BatchComputeEnvironmentArn": "compute_environment",
+        "BatchJobQueueArn": "job_queue",
+        "BatchJobDefinitionArn": "job_definition",
+        "HeadNodePrivateIP": head_node_ip,
+        "BatchCliRequirements": "aws-parallelcluster-awsbatch-cli<2.0.0",
+    }
+    parameters = {
+        "ProxyServer": "NONE",
+        "ResourcesS3Bucket": "bucket",
+        "ArtifactS3RootDirectory": "dir",
+        "Scheduler": "awsbatch",
+    }
+    return MockedBoto3Request(
+        method="describe_stacks",
+        response={
+            "Stacks": [
+                {
+                    "StackId": f"arn:aws:cloudformation:us-east-1:123456789012:stack/{STACK_NAME}/id",
+                    "StackName": STACK_NAME,
+                    "CreationTime": datetime(2026, 1, 1),
+                    "LastUpdatedTime": last_updated_time,
+                    "StackStatus": "UPDATE_COMPLETE",
+                    "Outputs": [{"OutputKey": key, "OutputValue": value} for key, value in outputs.items()],
+                    "Parameters": [{"ParameterKey": key, "ParameterValue": value} for key, value in parameters.items()],
+                }
+            ]
+        },
+        expected_params={"StackName": STACK_NAME},
+    )
+
+
+@pytest.mark.usefixtures("home_dir")
+class TestStackCache:
+    def test_cached_stack(self, mocker, boto3_stubber):
+        boto3_stubber("cloudformation", [_describe_stacks_request(datetime(2026, 1, 2))])
+        common.boto3.session.Session.return_value.region_name = "us-east-1"
+        log = logging.getLogger("awsbatch-cli")
+
+        config = AWSBatchCliConfig(log, STACK_NAME)
+        assert config.head_node_ip == "10.0.0.1"
+
+        # the stack is not described again, the Stubber fails on unexpected requests
+        cached_config = AWSBatchCliConfig(log, STACK_NAME)
+        assert cached_config.__dict__ == config.__dict__
+
+        # the cache is disabled with a ttl of 0
+        mocker.patch.dict(os.environ, {"AWSBATCH_CLI_STACK_CACHE_TTL": "0"})
+        assert StackCache(log).get(f"{STACK_NAME}:us-east-1") is None
+
+    @pytest.mark.parametrize(
+        "last_updated_time, expected_head_node_ip",
+        [(datetime(2026, 1, 2), "10.0.0.1"), (datetime(2026, 1, 3), "10.0.0.2")],
+        ids=["stack_not_updated", "stack_updated"],
+    )
+    def test_expired_entry(self, mocker, boto3_stubber, last_updated_time, expected_head_node_ip):
+        boto3_stubber(
+            "cloudformation",
+            [
+                _describe_stacks_request(datetime(2026, 1, 2)),
+                _describe_stacks_request(last_updated_time, head_node_ip="10.0.0.2"),
+            ],
+        )
+        common.boto3.session.Session.return_value.region_name = "us-east-1"
+        log = logging.getLogger("awsbatch-cli")
+        AWSBatchCliConfig(log, STACK_NAME)
+
+        mocker.patch.dict(os.environ, {"AWSBATCH_CLI_STACK_CACHE_TTL": "1"})
+        mocker.patch("awsbatch.common.time.time", return_value=common.time.time() + 10)
+        config = AWSBatchCliConfig(log, STACK_NAME)
+
+        # the expired entry is used only if the stack was not updated since it was cached
+        assert config.head_node_ip == expected_head_node_ip
+        assert not StackCache(log).is_expired(StackCache(log).get(f"{STACK_NAME}:us-east-1"))
@@ -57,6 +57,10 @@ LAMBDA_REQUIRES = [
     "aws-lambda-powertools~=1.14",
 ]
 
+ZSTD_REQUIRES = [
+    "zstandard>=0.15",
+]
+
 setup(
     name="aws-parallelcluster",
     version=VERSION,
@@ -71,6 +75,7 @@ setup(
     install_requires=REQUIRES,
     extras_require={
         "awslambda": LAMBDA_REQUIRES,
+        "zstd": ZSTD_REQUIRES,
     },
     entry_points={
         "console_scripts": [
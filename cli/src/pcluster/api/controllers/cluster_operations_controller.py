@@ -7,8 +7,12 @@
 # limitations under the License.
 
 # pylint: disable=W0613
+import contextvars
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Dict, List
 
 from pcluster.api.controllers.common import (
@@ -35,6 +39,7 @@ from pcluster.api.models import (
     Change,
     CloudFormationStackStatus,
     ClusterConfigurationStructure,
+    ClusterDescription,
     ClusterInfoSummary,
     ClusterStatus,
     CreateClusterBadRequestExceptionResponseContent,
@@ -42,6 +47,7 @@ from pcluster.api.models import (
     CreateClusterResponseContent,
     DeleteClusterResponseContent,
     DescribeClusterResponseContent,
+    DescribeClustersResponseContent,
     EC2Instance,
     Failure,
     InstanceState,
@@ -58,23 +64,36 @@ from pcluster.api.models import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import StackNotFoundError
+from pcluster.aws.common import AWSClientError, StackNotFoundError
 from pcluster.config.config_patch import ConfigPatch
 from pcluster.config.update_policy import UpdatePolicy
+from pcluster.constants import PCLUSTER_CLUSTER_NAME_TAG, PCLUSTER_NODE_TYPE_TAG
 from pcluster.models.cluster import (
     Cluster,
     ClusterActionError,
     ClusterUpdateError,
     ConfigValidationError,
+    NodeType,
     NotFoundClusterActionError,
 )
-from pcluster.models.cluster_resources import ClusterStack
+from pcluster.models.cluster_resources import ClusterInstance, ClusterStack
+from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
 from pcluster.models.login_nodes_status import LoginNodesPoolState
 from pcluster.utils import get_installed_version, to_utc_datetime
 from pcluster.validators.common import FailureLevel
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum time in seconds to wait for each of the lookups issued concurrently by describe_cluster.
+# It is kept below the 29 seconds integration timeout of API Gateway.
+DESCRIBE_CLUSTER_LOOKUP_TIMEOUT = 20
+# The lookups of all the describe_cluster requests share a bounded pool of threads, so that the lookups that time out
+# and keep running after the response cannot pile up when the API is polled.
+DESCRIBE_CLUSTER_MAX_WORKERS = 20
+_DESCRIBE_CLUSTER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=DESCRIBE_CLUSTER_MAX_WORKERS, thread_name_prefix="describe-cluster"
+)
+
 
 @convert_errors()
 @http_success_status_code(202)
@@ -215,17 +234,35 @@ def describe_cluster(cluster_name, region=None):
     cluster = Cluster(cluster_name)
     validate_cluster(cluster)
     cfn_stack = cluster.stack
+    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
 
-    fleet_status = cluster.compute_fleet_status
+    # The lookups below only depend on the stack, so they are issued concurrently. Each of them is bounded by its own
+    # timeout, and falls back as when it fails, so that a slow lookup only removes its part of the response.
+    fleet_status_lookup = _submit_lookup(lambda: cluster.compute_fleet_status)
+    config_url_lookup = _submit_lookup(lambda: cluster.config_presigned_url)
+    failures_lookup = _submit_lookup(_get_creation_failures, cluster_status, cfn_stack)
+    head_node_lookup = _submit_lookup(lambda: cluster.head_node_instance)
+    login_nodes_lookup = _submit_lookup(_get_login_nodes, cluster)
+
+    try:
+        fleet_status = _get_lookup_result(fleet_status_lookup, "compute fleet status")
+    except ClusterActionError as e:
+        LOGGER.error(e)
+        fleet_status = ComputeFleetStatus.UNKNOWN
 
     config_url = "NOT_AVAILABLE"
     try:
-        config_url = cluster.config_presigned_url
+        config_url = _get_lookup_result(config_url_lookup, "cluster configuration url")
     except ClusterActionError as e:
         # Do not fail request when S3 bucket is not available
         LOGGER.error(e)
 
-    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
+    failures = None
+    try:
+        failures = _get_lookup_result(failures_lookup, "cluster creation failures")
+    except ClusterActionError as e:
+        LOGGER.error(e)
+
     response = DescribeClusterResponseContent(
         creation_time=to_utc_datetime(cfn_stack.creation_time),
         version=cfn_stack.version,
@@ -239,20 +276,13 @@ def describe_cluster(cluster_name, region=None):
         region=os.environ.get("AWS_DEFAULT_REGION"),
         cluster_status=cluster_status,
         scheduler=Scheduler(type=cluster.stack.scheduler),
-        failures=_get_creation_failures(cluster_status, cfn_stack),
+        failures=failures,
     )
 
     try:
-        head_node = cluster.head_node_instance
-        response.head_node = EC2Instance(
-            instance_id=head_node.id,
-            launch_time=to_utc_datetime(head_node.launch_time),
-            public_ip_address=head_node.public_ip,
-            instance_type=head_node.instance_type,
-            state=InstanceState.from_dict(head_node.state),
-            private_ip_address=head_node.private_ip,
-        )
-        login_nodes = _get_login_nodes(cluster)
+        head_node = _get_lookup_result(head_node_lookup, "head node information")
+        response.head_node = _to_ec2_instance(head_node)
+        login_nodes = _get_lookup_result(login_nodes_lookup, "login nodes status")
         if login_nodes:
             response.login_nodes = login_nodes
     except ClusterActionError as e:
@@ -263,6 +293,29 @@ def describe_cluster(cluster_name, region=None):
     return response
 
 
+def _submit_lookup(func, *args):
+    """
+    Submit the lookup to the shared executor, propagating the context variables of the request.
+
+    Return the future of the lookup together with its deadline.
+    """
+    deadline = time.monotonic() + DESCRIBE_CLUSTER_LOOKUP_TIMEOUT
+    return _DESCRIBE_CLUSTER_EXECUTOR.submit(contextvars.copy_context().run, func, *args), deadline
+
+
+def _get_lookup_result(lookup, lookup_name):
+    """Return the result of the lookup, raising a ClusterActionError if it does not complete by its deadline."""
+    future, deadline = lookup
+    try:
+        return future.result(timeout=max(deadline - time.monotonic(), 0))
+    except FutureTimeoutError:
+        # The lookup is not interrupted if already running, it is only removed from the queue of the executor
+        future.cancel()
+        raise ClusterActionError(
+            f"Timed out retrieving {lookup_name} after {DESCRIBE_CLUSTER_LOOKUP_TIMEOUT} seconds."
+        ) from None
+
+
 def _get_login_nodes(cluster):
     login_nodes_status = cluster.login_nodes_status
 
@@ -286,6 +339,118 @@ def _get_login_nodes(cluster):
     return None
 
 
+@configure_aws_region()
+@convert_errors()
+def describe_clusters(cluster_names, region=None):
+    """
+    Get detailed information about multiple existing clusters.
+
+    The stacks, the head nodes and the compute fleet status of all the clusters are retrieved with shared requests.
+
+    :param cluster_names: Names of the clusters to describe.
+    :type cluster_names: List[str]
+    :param region: AWS Region that the operation corresponds to.
+    :type region: str
+
+    :rtype: DescribeClustersResponseContent
+    """
+    stacks = AWSApi.instance().cfn.describe_pcluster_stacks(cluster_names)
+    clusters = {}
+    incompatible_cluster_names = []
+    for cluster_name in cluster_names:
+        if cluster_name in stacks:
+            cluster = Cluster(cluster_name, stack=ClusterStack(stacks[cluster_name]))
+            if check_cluster_version(cluster):
+                clusters[cluster_name] = cluster
+            else:
+                # Reported apart, as describe_cluster rejects them instead of reporting them as not found
+                incompatible_cluster_names.append(cluster_name)
+
+    fleet_statuses = _get_compute_fleet_statuses(clusters.values())
+    head_nodes = _get_head_nodes(clusters.keys())
+
+    descriptions = []
+    for cluster_name, cluster in clusters.items():
+        cfn_stack = cluster.stack
+        description = ClusterDescription(
+            creation_time=to_utc_datetime(cfn_stack.creation_time),
+            version=cfn_stack.version,
+            tags=[Tag(value=tag.get("Value"), key=tag.get("Key")) for tag in cfn_stack.tags],
+            cloud_formation_stack_status=cfn_stack.status,
+            cluster_name=cluster_name,
+            compute_fleet_status=fleet_statuses[cluster_name].value,
+            cloudformation_stack_arn=cfn_stack.id,
+            last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
+            region=os.environ.get("AWS_DEFAULT_REGION"),
+            cluster_status=cloud_formation_status_to_cluster_status(cfn_stack.status),
+            scheduler=Scheduler(type=cfn_stack.scheduler),
+        )
+        if cluster_name in head_nodes:
+            description.head_node = _to_ec2_instance(head_nodes[cluster_name])
+        descriptions.append(description)
+
+    return DescribeClustersResponseContent(
+        clusters=descriptions,
+        not_found_cluster_names=[cluster_name for cluster_name in cluster_names if cluster_name not in stacks],
+        incompatible_cluster_names=incompatible_cluster_names,
+    )
+
+
+def _get_compute_fleet_statuses(clusters):
+    """Return the compute fleet status of the clusters, retrieving the ones stored in DynamoDB in batch."""
+    fleet_statuses = {}
+    cluster_versions = {}
+    for cluster in clusters:
+        if not (cluster.stack.is_working_status or cluster.stack.status == "UPDATE_IN_PROGRESS"):
+            fleet_statuses[cluster.name] = ComputeFleetStatus.UNKNOWN
+        elif cluster.stack.scheduler == "awsbatch":
+            fleet_statuses[cluster.name] = cluster.compute_fleet_status
+        else:
+            cluster_versions[cluster.name] = cluster.stack.version
+
+    if cluster_versions:
+        statuses = ComputeFleetStatusManager.get_status_with_last_updated_time_by_cluster(cluster_versions)
+        fleet_statuses.update({cluster_name: status for cluster_name, (status, _) in statuses.items()})
+    return fleet_statuses
+
+
+def _get_head_nodes(cluster_names):
+    """Return the head node of the clusters, indexed by cluster name, retrieved with a single describe_instances."""
+    head_nodes = {}
+    if not cluster_names:
+        return head_nodes
+
+    filters = [
+        {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": list(cluster_names)},
+        {"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": [NodeType.HEAD_NODE.value]},
+        {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+    ]
+    try:
+        next_token = None
+        while True:
+            instances, next_token = AWSApi.instance().ec2.describe_instances(filters, next_token)
+            for instance in instances:
+                head_node = ClusterInstance(instance)
+                head_nodes[head_node.cluster_name] = head_node
+            if not next_token:
+                break
+    except AWSClientError as e:
+        # Do not fail the request, head nodes are not available in some cases, as for a single cluster description
+        LOGGER.error("Failed to retrieve head nodes information. %s", e)
+    return head_nodes
+
+
+def _to_ec2_instance(instance):
+    return EC2Instance(
+        instance_id=instance.id,
+        launch_time=to_utc_datetime(instance.launch_time),
+        public_ip_address=instance.public_ip,
+        instance_type=instance.instance_type,
+        state=InstanceState.from_dict(instance.state),
+        private_ip_address=instance.private_ip,
+    )
+
+
 @configure_aws_region()
 @convert_errors()
 def list_clusters(region=None, next_token=None, cluster_status=None):
@@ -23,6 +23,7 @@ from pcluster.api.models.change import Change
 from pcluster.api.models.cloud_formation_resource_status import CloudFormationResourceStatus
 from pcluster.api.models.cloud_formation_stack_status import CloudFormationStackStatus
 from pcluster.api.models.cluster_configuration_structure import ClusterConfigurationStructure
+from pcluster.api.models.cluster_description import ClusterDescription
 from pcluster.api.models.cluster_info_summary import ClusterInfoSummary
 from pcluster.api.models.cluster_instance import ClusterInstance
 from pcluster.api.models.cluster_status import ClusterStatus
@@ -39,6 +40,7 @@ from pcluster.api.models.delete_cluster_response_content import DeleteClusterRes
 from pcluster.api.models.delete_image_response_content import DeleteImageResponseContent
 from pcluster.api.models.describe_cluster_instances_response_content import DescribeClusterInstancesResponseContent
 from pcluster.api.models.describe_cluster_response_content import DescribeClusterResponseContent
+from pcluster.api.models.describe_clusters_response_content import DescribeClustersResponseContent
 from pcluster.api.models.describe_compute_fleet_response_content import DescribeComputeFleetResponseContent
 from pcluster.api.models.describe_image_response_content import DescribeImageResponseContent
 from pcluster.api.models.dryrun_operation_exception_response_content import DryrunOperationExceptionResponseContent
@@ -199,7 +199,7 @@ class AWSApi:
 
     @staticmethod
     def reset():
-        """Reset the instance to clear all caches."""
+        """Reset the instance to clear all caches, the boto3 clients are kept in the Boto3ClientPool."""
         AWSApi._instance = None
 
 
@@ -8,8 +8,12 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import base64
+import binascii
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from botocore.exceptions import ClientError
 
@@ -20,6 +24,34 @@ from pcluster.utils import remove_none_values
 
 LOGGER = logging.getLogger(__name__)
 
+LIST_STACKS_PAGE_SIZE = 100
+DESCRIBE_STACKS_CONCURRENCY = 10
+# All the stack statuses except DELETE_COMPLETE, since deleted stacks are retained by ListStacks for 90 days
+LIST_STACKS_STATUS_FILTER = [
+    "CREATE_IN_PROGRESS",
+    "CREATE_FAILED",
+    "CREATE_COMPLETE",
+    "ROLLBACK_IN_PROGRESS",
+    "ROLLBACK_FAILED",
+    "ROLLBACK_COMPLETE",
+    "DELETE_IN_PROGRESS",
+    "DELETE_FAILED",
+    "UPDATE_IN_PROGRESS",
+    "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_COMPLETE",
+    "UPDATE_FAILED",
+    "UPDATE_ROLLBACK_IN_PROGRESS",
+    "UPDATE_ROLLBACK_FAILED",
+    "UPDATE_ROLLBACK_COMPLETE_CLEANUP_IN_PROGRESS",
+    "UPDATE_ROLLBACK_COMPLETE",
+    "REVIEW_IN_PROGRESS",
+    "IMPORT_IN_PROGRESS",
+    "IMPORT_COMPLETE",
+    "IMPORT_ROLLBACK_IN_PROGRESS",
+    "IMPORT_ROLLBACK_FAILED",
+    "IMPORT_ROLLBACK_COMPLETE",
+]
+
 
 class CfnClient(Boto3Client):
     """Implement CFN Boto3 client."""
@@ -149,9 +181,27 @@ class CfnClient(Boto3Client):
     @AWSExceptionHandler.handle_client_exception
     def list_pcluster_stacks(self, next_token=None):
         """List existing pcluster cluster stacks."""
-        stacks, result_token = self._list_parentless_stacks_with_tag(PCLUSTER_VERSION_TAG, next_token)
         # Only return stacks without image-id tag, which means they are cluster stacks.
-        return [stack for stack in stacks if StackInfo(stack).get_tag(PCLUSTER_IMAGE_ID_TAG) is None], result_token
+        return self._list_parentless_stacks_with_tag(
+            PCLUSTER_VERSION_TAG, next_token, excluded_tag=PCLUSTER_IMAGE_ID_TAG
+        )
+
+    def describe_pcluster_stacks(self, stack_names):
+        """
+        Return the pcluster cluster stacks with the given names, indexed by name.
+
+        Stacks are retrieved with a single paginated sweep of the stacks of the region, which stops as soon as all
+        the requested stacks have been found. Stacks that do not exist are not returned.
+        """
+        stack_names = set(stack_names)
+        stacks = {}
+        next_token = None
+        while stack_names - stacks.keys():
+            page, next_token = self.list_pcluster_stacks(next_token)
+            stacks.update({stack["StackName"]: stack for stack in page if stack["StackName"] in stack_names})
+            if not next_token:
+                break
+        return stacks
 
     def describe_stack_resource(self, stack_name: str, logic_resource_id: str):
         """Get stack resource information."""
@@ -173,14 +223,99 @@ class CfnClient(Boto3Client):
         """List existing imagebuilder stacks."""
         return self._list_parentless_stacks_with_tag(PCLUSTER_IMAGE_ID_TAG, next_token)
 
-    def _list_parentless_stacks_with_tag(self, tag, next_token=None):
+    @staticmethod
+    def is_stacks_prefilter_enabled():
+        """Return True if stacks must be listed by prefiltering them with ListStacks."""
+        return os.environ.get("PCLUSTER_LIST_STACKS_PREFILTER_ENABLED", "false").lower() == "true"
+
+    def _list_parentless_stacks_with_tag(self, tag, next_token=None, excluded_tag=None):
+        if self.is_stacks_prefilter_enabled():
+            return self._list_prefiltered_parentless_stacks_with_tag(tag, next_token, excluded_tag)
+
         describe_stacks_kwargs = {}
         if next_token:
             describe_stacks_kwargs["NextToken"] = next_token
 
         result = self._client.describe_stacks(**describe_stacks_kwargs)
-        stack_list = []
-        for stack in result.get("Stacks", []):
-            if stack.get("ParentId") is None and StackInfo(stack).get_tag(tag):
-                stack_list.append(stack)
+        stack_list = [stack for stack in result.get("Stacks", []) if _has_tags(stack, tag, excluded_tag)]
         return stack_list, result.get("NextToken")
+
+    def _list_prefiltered_parentless_stacks_with_tag(self, tag, next_token=None, excluded_tag=None):
+        """
+        Return a page of the parentless stacks with the given tag, by describing only the candidate stacks.
+
+        Candidates are the parentless stacks not yet deleted, as returned by ListStacks, which does not return tags.
+        They are described concurrently, one ListStacks page at a time, until LIST_STACKS_PAGE_SIZE matching stacks
+        are found, so that every page except the last one is full.
+        The returned token points to the ListStacks page and to the position in that page where the next page must
+        start from, so that resuming from it never skips or repeats a stack, unless stacks are created or deleted
+        in the meantime.
+        """
+        list_stacks_token, offset = _decode_list_stacks_token(next_token)
+        stack_list = []
+        with ThreadPoolExecutor(max_workers=DESCRIBE_STACKS_CONCURRENCY, thread_name_prefix="describe-stacks") as pool:
+            while True:
+                list_stacks_kwargs = {"StackStatusFilter": LIST_STACKS_STATUS_FILTER}
+                if list_stacks_token:
+                    list_stacks_kwargs["NextToken"] = list_stacks_token
+                result = self._client.list_stacks(**list_stacks_kwargs)
+                summaries = result.get("StackSummaries", [])
+                candidates = [
+                    (position, summary["StackId"])
+                    for position, summary in enumerate(summaries)
+                    if position >= offset and not summary.get("ParentId")
+                ]
+                while candidates:
+                    # Never describe more candidates than the stacks missing to fill the page
+                    batch_size = LIST_STACKS_PAGE_SIZE - len(stack_list)
+                    batch, candidates = candidates[:batch_size], candidates[batch_size:]
+                    stacks = pool.map(self._describe_stack_if_exists, [stack_id for _, stack_id in batch])
+                    stack_list.extend(stack for stack in stacks if stack and _has_tags(stack, tag, excluded_tag))
+                    if len(stack_list) == LIST_STACKS_PAGE_SIZE:
+                        position = batch[-1][0] + 1
+                        if position < len(summaries):
+                            return stack_list, _encode_list_stacks_token(list_stacks_token, position)
+                        return stack_list, _encode_list_stacks_token(result.get("NextToken"), 0)
+
+                list_stacks_token, offset = result.get("NextToken"), 0
+                if not list_stacks_token:
+                    return stack_list, None
+
+    def _describe_stack_if_exists(self, stack_id):
+        """Describe the given stack, return None if it has been deleted after being listed."""
+        try:
+            return self.describe_stack(stack_id)
+        except StackNotFoundError:
+            return None
+
+
+def _has_tags(stack, tag, excluded_tag=None):
+    """Return True if the given stack is parentless, it has the tag and it has not the excluded tag."""
+    stack_info = StackInfo(stack)
+    return (
+        stack.get("ParentId") is None
+        and stack_info.get_tag(tag)
+        and (excluded_tag is None or stack_info.get_tag(excluded_tag) is None)
+    )
+
+
+def _encode_list_stacks_token(list_stacks_token, offset):
+    if not list_stacks_token and not offset:
+        return None
+    token = json.dumps({"listStacksToken": list_stacks_token, "offset": offset})
+    return base64.urlsafe_b64encode(token.encode("utf-8")).decode("utf-8")
+
+
+def _decode_list_stacks_token(next_token):
+    """Return the ListStacks token and the position in the ListStacks page encoded in the given token."""
+    if not next_token:
+        return None, 0
+    try:
+        token = json.loads(base64.urlsafe_b64decode(next_token.encode("utf-8")))
+        return token["listStacksToken"], int(token["offset"])
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise AWSClientError(
+            function_name="list_stacks",
+            message=f"Invalid next token: {next_token}",
+            error_code=AWSClientError.ErrorCode.VALIDATION_ERROR.value,
+        ) from e
@@ -9,11 +9,16 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextvars
 import functools
+import json
 import logging
 import os
+import random
+import sqlite3
 import threading
 import time
+from collections import OrderedDict, deque
 from enum import Enum
 from typing import Dict
 
@@ -23,6 +28,24 @@ from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_CACHE_MAX_SIZE = 1000
+PERSISTENT_CACHE_MAX_SIZE = 10000
+DEFAULT_PERSISTENT_CACHE_PATH = os.path.expanduser(os.path.join("~", ".parallelcluster", "cache", "aws-cache.sqlite"))
+
+# Client-side handling of the throttling errors, see ThrottlingRateLimiter.
+# The max attempts must not be lower than the ones of the botocore retry modes, which retry throttled requests too
+THROTTLING_MAX_ATTEMPTS = 10
+THROTTLING_BASE_BACKOFF = 0.5
+THROTTLING_MAX_BACKOFF = 20
+THROTTLING_MIN_RATE = 0.5
+THROTTLING_MAX_RATE = 100
+THROTTLING_RATE_DECREASE_FACTOR = 0.7
+THROTTLING_RATE_INCREASE = 0.5
+
+# Optional recorder notified of the boto3 calls and cache hits made in the current context,
+# it must expose record_boto3_call(service, operation) and record_cache_hit() methods
+AWS_CALLS_RECORDER = contextvars.ContextVar("aws_calls_recorder", default=None)
+
 
 class AWSClientError(Exception):
     """Error during execution of some AWS calls."""
@@ -33,12 +56,19 @@ class AWSClientError(Exception):
         VALIDATION_ERROR = "ValidationError"
         REQUEST_LIMIT_EXCEEDED = "RequestLimitExceeded"
         THROTTLING_EXCEPTION = "ThrottlingException"
+        THROTTLING = "Throttling"
+        TOO_MANY_REQUESTS_EXCEPTION = "TooManyRequestsException"
         CONDITIONAL_CHECK_FAILED_EXCEPTION = "ConditionalCheckFailedException"
 
         @classmethod
         def throttling_error_codes(cls):
             """Return a set of error codes returned when service rate limits are exceeded."""
-            return {cls.REQUEST_LIMIT_EXCEEDED.value, cls.THROTTLING_EXCEPTION.value}
+            return {
+                cls.REQUEST_LIMIT_EXCEEDED.value,
+                cls.THROTTLING_EXCEPTION.value,
+                cls.THROTTLING.value,
+                cls.TOO_MANY_REQUESTS_EXCEPTION.value,
+            }
 
     def __init__(self, function_name: str, message: str, error_code: str = None):
         super().__init__(message)
@@ -111,22 +141,189 @@ class AWSExceptionHandler:
 
     @staticmethod
     def retry_on_boto3_throttling(func):
-        """Retry boto3 calls on throttling, can be used as a decorator."""
+        """
+        Retry boto3 calls on throttling, can be used as a decorator.
+
+        Throttled requests are already retried by the rate limiter of the client: the attempts made by the client
+        count against the same THROTTLING_MAX_ATTEMPTS budget, so that the decorator only retries the calls of
+        clients without a rate limiter, e.g. the ones created outside the AWSApi, with the same backoff.
+        """
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            attempts = 0
             while True:
                 try:
                     return func(*args, **kwargs)
                 except ClientError as e:
-                    if e.response["Error"]["Code"] != "Throttling":
+                    attempts += 1 + e.response.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+                    if (
+                        e.response["Error"]["Code"] not in AWSClientError.ErrorCode.throttling_error_codes()
+                        or attempts >= THROTTLING_MAX_ATTEMPTS
+                    ):
                         raise
-                    LOGGER.debug("Throttling when calling %s function. Will retry in %d seconds.", func.__name__, 5)
-                    time.sleep(5)
+                    backoff = get_throttling_backoff(attempts)
+                    LOGGER.debug(
+                        "Throttling when calling %s function. Will retry in %.1f seconds.", func.__name__, backoff
+                    )
+                    time.sleep(backoff)
 
         return wrapper
 
 
+def get_throttling_backoff(attempt: int) -> float:
+    """Return the seconds to wait before retrying a throttled request, with exponential backoff and full jitter."""
+    return random.uniform(0, min(THROTTLING_MAX_BACKOFF, THROTTLING_BASE_BACKOFF * 2 ** (attempt - 1)))  # nosec B311
+
+
+class ThrottlingMetrics:
+    """Requests, retries and throttling counters of a rate limiter."""
+
+    def __init__(self):
+        self.requests = 0
+        self.throttled_requests = 0
+        self.retries = 0
+        self.throttled_time = 0.0
+
+    def to_dict(self):
+        """Return the counters as a dictionary."""
+        return {
+            "requests": self.requests,
+            "throttledRequests": self.throttled_requests,
+            "retries": self.retries,
+            "throttledTime": round(self.throttled_time, 3),
+        }
+
+
+class ThrottlingRateLimiter:
+    """
+    Client-side rate limiter shared by all the boto3 clients of an AWS service.
+
+    The limiter is inactive until the service throttles a request. From then on requests are sent at the rate
+    allowed by a token bucket, whose fill rate is multiplicatively decreased at every throttled request and
+    additively increased at every successful one, until it is high enough to disable the limiter again.
+    Throttled requests are retried up to THROTTLING_MAX_ATTEMPTS times, with exponential backoff and full jitter.
+    The time spent waiting for tokens and backing off is reported as throttled time in the metrics.
+    """
+
+    def __init__(self, service: str, max_attempts: int = THROTTLING_MAX_ATTEMPTS):
+        self.service = service
+        self.max_attempts = max_attempts
+        self.metrics = ThrottlingMetrics()
+        self._fill_rate = None
+        self._tokens = 0.0
+        self._last_refill = 0.0
+        self._sent_requests = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def fill_rate(self):
+        """Return the requests per second allowed by the limiter, None if the limiter is inactive."""
+        return self._fill_rate
+
+    def register(self, events):
+        """Register the limiter to the events of a boto3 client, before the retry handler of botocore."""
+        events.register("before-send.*.*", self.on_sending_request)
+        events.register_first("needs-retry.*.*", self.on_response)
+
+    def on_sending_request(self, **kwargs):
+        """Wait for a token before sending a request, called at every attempt."""
+        with self._lock:
+            now = time.monotonic()
+            self.metrics.requests += 1
+            self._sent_requests.append(now)
+            while self._sent_requests[0] < now - 1:
+                self._sent_requests.popleft()
+            if self._fill_rate is None:
+                return
+            self._refill(now)
+            # Tokens can go negative, so that concurrent requests wait in turn for their token
+            self._tokens -= 1
+            wait_time = -self._tokens / self._fill_rate if self._tokens < 0 else 0
+            self.metrics.throttled_time += wait_time
+        if wait_time:
+            time.sleep(wait_time)
+
+    def on_response(self, attempts, response=None, caught_exception=None, **kwargs):
+        """
+        Adapt the rate to the response and return the seconds to wait before retrying a throttled request.
+
+        Return None to leave the decision to the retry handler of botocore, e.g. for connection errors.
+        """
+        if caught_exception is not None or response is None:
+            return None
+        error_code = response[1].get("Error", {}).get("Code")
+        if error_code not in AWSClientError.ErrorCode.throttling_error_codes():
+            if error_code is None:
+                self._on_success()
+            return None
+
+        self._on_throttling()
+        if attempts >= self.max_attempts:
+            LOGGER.info("Request to %s throttled after %d attempts, giving up", self.service, attempts)
+            return None
+        backoff = get_throttling_backoff(attempts)
+        with self._lock:
+            self.metrics.retries += 1
+            self.metrics.throttled_time += backoff
+        LOGGER.debug("Request to %s throttled (%s), retrying in %.1f seconds", self.service, error_code, backoff)
+        return backoff
+
+    def _refill(self, now):
+        capacity = max(1.0, self._fill_rate)
+        self._tokens = min(capacity, self._tokens + (now - self._last_refill) * self._fill_rate)
+        self._last_refill = now
+
+    def _on_throttling(self):
+        with self._lock:
+            self.metrics.throttled_requests += 1
+            now = time.monotonic()
+            if self._fill_rate is None:
+                # Start from the rate measured in the last second
+                self._fill_rate = float(len(self._sent_requests))
+                self._tokens = 0.0
+            else:
+                self._refill(now)
+            self._last_refill = now
+            self._fill_rate = max(THROTTLING_MIN_RATE, self._fill_rate * THROTTLING_RATE_DECREASE_FACTOR)
+
+    def _on_success(self):
+        with self._lock:
+            if self._fill_rate is None:
+                return
+            self._refill(time.monotonic())
+            self._fill_rate += THROTTLING_RATE_INCREASE
+            if self._fill_rate >= THROTTLING_MAX_RATE:
+                self._fill_rate = None
+
+
+_RATE_LIMITERS: Dict[str, ThrottlingRateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(service: str) -> ThrottlingRateLimiter:
+    """Return the rate limiter shared by the clients of the given service."""
+    with _RATE_LIMITERS_LOCK:
+        if service not in _RATE_LIMITERS:
+            _RATE_LIMITERS[service] = ThrottlingRateLimiter(service)
+        return _RATE_LIMITERS[service]
+
+
+def get_throttling_metrics() -> Dict[str, Dict]:
+    """Return the throttling metrics of the services called so far."""
+    with _RATE_LIMITERS_LOCK:
+        return {service: limiter.metrics.to_dict() for service, limiter in _RATE_LIMITERS.items()}
+
+
+def reset_rate_limiters():
+    """Remove the rate limiters and their metrics."""
+    with _RATE_LIMITERS_LOCK:
+        _RATE_LIMITERS.clear()
+
+
+_BOTO3_SESSION_LOCK = threading.Lock()
+
+
 def _log_boto3_calls(params, **kwargs):
     service = kwargs["event_name"].split(".")[-2]
     operation = kwargs["event_name"].split(".")[-1]
@@ -134,16 +331,61 @@ def _log_boto3_calls(params, **kwargs):
     LOGGER.info(
         "Executing boto3 call: region=%s, service=%s, operation=%s, params=%s", region, service, operation, params
     )
+    recorder = AWS_CALLS_RECORDER.get()
+    if recorder:
+        recorder.record_boto3_call(service, operation)
+
+
+def _record_cache_hit():
+    recorder = AWS_CALLS_RECORDER.get()
+    if recorder:
+        recorder.record_cache_hit()
+
+
+class Boto3ClientPool:
+    """
+    Thread safe pool of the boto3 clients, keyed by service, region and botocore configuration.
+
+    Creating a client loads the service model and builds the endpoint resolver and the HTTP connection pool.
+    Pooled clients are shared by the client wrappers of all the AWSApi instances, so that they are kept warm
+    across AWSApi.reset() calls, e.g. across the requests served by the API Lambda. The cached results are bound
+    to the client wrappers and are not affected by the pool.
+    """
+
+    _clients = {}
+
+    @staticmethod
+    def get_client(client_name: str, botocore_config_kwargs: Dict = None):
+        """Return the pooled client of the given service, creating it on first use."""
+        config_key = json.dumps(botocore_config_kwargs, sort_keys=True) if botocore_config_kwargs else None
+        # boto3 default session is not thread safe, clients can be created concurrently by validators
+        with _BOTO3_SESSION_LOCK:
+            if boto3.DEFAULT_SESSION is None:
+                boto3.setup_default_session()
+            # Clients are created from the default session, whose region follows the environment
+            key = (client_name, boto3.DEFAULT_SESSION.region_name, config_key)
+            client = Boto3ClientPool._clients.get(key)
+            if client is None:
+                client = boto3.client(
+                    client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
+                )
+                client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+                get_rate_limiter(client_name).register(client.meta.events)
+                Boto3ClientPool._clients[key] = client
+            return client
+
+    @staticmethod
+    def clear():
+        """Remove all the pooled clients."""
+        with _BOTO3_SESSION_LOCK:
+            Boto3ClientPool._clients.clear()
 
 
 class Boto3Client:
     """Boto3 client Class."""
 
     def __init__(self, client_name: str, botocore_config_kwargs: Dict = None):
-        self._client = boto3.client(
-            client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
-        )
-        self._client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        self._client = Boto3ClientPool.get_client(client_name, botocore_config_kwargs)
 
     def _paginate_results(self, method, **kwargs):
         """
@@ -163,14 +405,182 @@ class Boto3Resource:
     """Boto3 resource Class."""
 
     def __init__(self, resource_name: str):
-        self._resource = boto3.resource(resource_name)
+        with _BOTO3_SESSION_LOCK:
+            self._resource = boto3.resource(resource_name)
         self._resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        get_rate_limiter(resource_name).register(self._resource.meta.client.meta.events)
+
+
+class CacheStats:
+    """Hit, miss and eviction counters of a cached function."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def to_dict(self):
+        """Return the counters as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class MemoryCacheBackend:
+    """In-process cache backend with LRU eviction and optional per-entry expiration."""
+
+    def __init__(self, max_size: int = None):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def get(self, key):
+        """Return a (found, value) tuple for the given key, refreshing its LRU position on hits."""
+        with self._lock:
+            if key not in self._entries:
+                self.stats.misses += 1
+                return False, None
+            value, expires_at = self._entries[key]
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return True, value
+
+    def set(self, key, value, ttl: float = None):
+        """Store the value for the given key, evicting the least recently used entries if the cache is full."""
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl if ttl is not None else None)
+            self._entries.move_to_end(key)
+            while self._max_size is not None and len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SqliteCacheBackend:
+    """
+    On-disk cache backend shared across processes, backed by a sqlite database.
+
+    Values are stored as JSON, so only JSON serializable results can be persisted.
+    Any sqlite failure is logged and treated as a cache miss, the cache must never break the caller.
+    """
+
+    def __init__(self, path: str, max_size: int = None):
+        self._path = path
+        self._max_size = max_size
+        self._connection = None
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def _get_connection(self):
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            self._connection = sqlite3.connect(self._path, timeout=5, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, last_access REAL NOT NULL)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    def get(self, key: str):
+        """Return a (found, value) tuple for the given key."""
+        with self._lock:
+            try:
+                connection = self._get_connection()
+                row = connection.execute("SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self.stats.misses += 1
+                    return False, None
+                value, expires_at = row
+                if expires_at is not None and expires_at <= time.time():
+                    connection.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    connection.commit()
+                    self.stats.expirations += 1
+                    self.stats.misses += 1
+                    return False, None
+                connection.execute("UPDATE cache_entries SET last_access = ? WHERE key = ?", (time.time(), key))
+                connection.commit()
+                self.stats.hits += 1
+                return True, json.loads(value)
+            except (sqlite3.Error, OSError, ValueError) as e:
+                LOGGER.debug("Unable to read from persistent cache %s: %s", self._path, e)
+                return False, None
+
+    def set(self, key: str, value, ttl: float = None):
+        """Store the value for the given key, evicting the least recently used entries if the cache is full."""
+        try:
+            serialized_value = json.dumps(value)
+        except (TypeError, ValueError):
+            LOGGER.debug("Skipping persistent caching of non JSON serializable value for key %s", key)
+            return
+        with self._lock:
+            try:
+                connection = self._get_connection()
+                now = time.time()
+                connection.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                    (key, serialized_value, now + ttl if ttl is not None else None, now),
+                )
+                connection.execute("DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+                if self._max_size is not None:
+                    evicted = connection.execute(
+                        "DELETE FROM cache_entries WHERE key IN "
+                        "(SELECT key FROM cache_entries ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                        (self._max_size,),
+                    ).rowcount
+                    self.stats.evictions += max(evicted, 0)
+                connection.commit()
+            except (sqlite3.Error, OSError) as e:
+                LOGGER.debug("Unable to write to persistent cache %s: %s", self._path, e)
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            try:
+                connection = self._get_connection()
+                connection.execute("DELETE FROM cache_entries")
+                connection.commit()
+            except (sqlite3.Error, OSError) as e:
+                LOGGER.debug("Unable to clear persistent cache %s: %s", self._path, e)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
 
 
 class Cache:
-    """Simple utility class providing a cache mechanism for expensive functions."""
+    """
+    Simple utility class providing a cache mechanism for expensive functions.
+
+    Every cached function has its own bounded in-memory LRU cache. Functions decorated with persistent=True also
+    use a shared on-disk store, enabled through the PCLUSTER_PERSISTENT_CACHE_ENABLED environment variable,
+    so that slow-changing results survive across CLI invocations.
+    """
 
     _caches = []
+    _stats = {}
+    _persistent_backend = None
+    _persistent_backend_lock = threading.Lock()
 
     @staticmethod
     def is_enabled():
@@ -178,10 +588,53 @@ class Cache:
         return not os.environ.get("PCLUSTER_CACHE_DISABLED")
 
     @staticmethod
-    def clear_all():
-        """Clear the content of all caches."""
+    def is_persistent_enabled():
+        """Tell if the persistent on-disk cache is enabled."""
+        return Cache.is_enabled() and os.environ.get("PCLUSTER_PERSISTENT_CACHE_ENABLED", "false").lower() == "true"
+
+    @staticmethod
+    def get_persistent_backend():
+        """Return the on-disk cache backend, creating it on first use."""
+        with Cache._persistent_backend_lock:
+            if Cache._persistent_backend is None:
+                Cache._persistent_backend = SqliteCacheBackend(
+                    os.environ.get("PCLUSTER_PERSISTENT_CACHE_PATH", DEFAULT_PERSISTENT_CACHE_PATH),
+                    max_size=PERSISTENT_CACHE_MAX_SIZE,
+                )
+            return Cache._persistent_backend
+
+    @staticmethod
+    def set_persistent_backend(backend):
+        """Replace the on-disk cache backend, e.g. to point it to a different location."""
+        with Cache._persistent_backend_lock:
+            if Cache._persistent_backend is not None:
+                Cache._persistent_backend.close()
+            Cache._persistent_backend = backend
+
+    @staticmethod
+    def clear_all(persistent: bool = False):
+        """Clear the content of all in-memory caches and, if requested, of the persistent cache."""
         for cache in Cache._caches:
             cache.clear()
+        if persistent:
+            Cache.get_persistent_backend().clear()
+
+    @staticmethod
+    def get_stats():
+        """Return the hit/miss/eviction counters of every cached function which has been invoked."""
+        stats = {}
+        for name, cache_stats in Cache._stats.items():
+            if any(cache_stats.to_dict().values()):
+                stats[name] = cache_stats.to_dict()
+        if Cache._persistent_backend is not None:
+            stats["persistent"] = Cache._persistent_backend.stats.to_dict()
+        return stats
+
+    @staticmethod
+    def log_stats():
+        """Log the cache counters at debug level."""
+        for name, stats in Cache.get_stats().items():
+            LOGGER.debug("Cache stats for %s: %s", name, stats)
 
     @staticmethod
     def _make_key(val):
@@ -196,37 +649,152 @@ class Cache:
         return key
 
     @staticmethod
-    def cached(function):
+    def _make_persistent_key(function, args, kwargs):
+        """
+        Build a key which is stable across processes.
+
+        The client instance is replaced by its region, since client objects differ at every invocation, and the key
+        includes the account of the current credentials, since the on-disk cache is shared by all the profiles and
+        results like images owned by "self" or accessible subnets depend on the account.
+        Return None if the arguments cannot be serialized or the account cannot be resolved, in which case the
+        persistent cache is skipped.
+        """
+        region = None
+        if args and isinstance(args[0], Boto3Client):
+            region = args[0]._client.meta.region_name
+            args = args[1:]
+        elif args and isinstance(args[0], Boto3Resource):
+            region = args[0]._resource.meta.client.meta.region_name
+            args = args[1:]
+        account = _get_caller_account(region)
+        if account is None:
+            return None
+        try:
+            return json.dumps(
+                [f"{function.__module__}.{function.__qualname__}", account, region, list(args), kwargs], sort_keys=True
+            )
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def get_persistent(function, args, kwargs=None):
+        """
+        Return a (found, value) tuple for the result of a persistent cached function stored in the on-disk cache.
+
+        Allow functions retrieving several results at once to reuse the ones of the function retrieving each of them.
+        """
+        persistent_key = Cache.is_persistent_enabled() and Cache._make_persistent_key(function, args, kwargs or {})
+        if not persistent_key:
+            return False, None
+        return Cache.get_persistent_backend().get(persistent_key)
+
+    @staticmethod
+    def set_persistent(function, args, return_value, ttl: float = None, kwargs=None):
+        """Store the result of a persistent cached function in the on-disk cache, if enabled."""
+        persistent_key = Cache.is_persistent_enabled() and Cache._make_persistent_key(function, args, kwargs or {})
+        if persistent_key:
+            Cache.get_persistent_backend().set(persistent_key, return_value, ttl)
+
+    @staticmethod
+    def _get_or_compute(function, cache, cache_key, ttl, persistent, args, kwargs):
+        """Look up the in-memory cache, then the persistent one, and invoke the function only on a miss."""
+        found, return_value = cache.get(cache_key)
+        if found:
+            _record_cache_hit()
+            return return_value
+
+        persistent_key = None
+        if persistent and Cache.is_persistent_enabled():
+            persistent_key = Cache._make_persistent_key(function, args, kwargs)
+        if persistent_key:
+            found, return_value = Cache.get_persistent_backend().get(persistent_key)
+            if found:
+                _record_cache_hit()
+                cache.set(cache_key, return_value, ttl)
+                return return_value
+
+        return_value = function(*args, **kwargs)
+        cache.set(cache_key, return_value, ttl)
+        if persistent_key:
+            Cache.get_persistent_backend().set(persistent_key, return_value, ttl)
+        return return_value
+
+    @staticmethod
+    def cached(function=None, *, ttl: float = None, persistent: bool = False, max_size: int = DEFAULT_CACHE_MAX_SIZE):
         """
         Decorate a function to make it use a results cache based on passed arguments.
 
+        Can be used either as @Cache.cached or as @Cache.cached(ttl=..., persistent=..., max_size=...).
+
+        :param ttl: number of seconds a result is valid for, None means the result never expires
+        :param persistent: also store the result in the on-disk cache, if enabled. Only JSON serializable results
+                           are persisted.
+        :param max_size: maximum number of entries kept in memory, least recently used entries are evicted first
+
         Note: for threaded invocations, only a single instance for a given set of arguments
         will execute at a given time.
         """
-        cache = {}
+        if function is None:
+            return functools.partial(Cache.cached, ttl=ttl, persistent=persistent, max_size=max_size)
+
+        cache = MemoryCacheBackend(max_size=max_size)
+        # Each mutex is paired with the number of threads currently using it, so that it can be discarded afterwards
         mutexes = {}
         lock = threading.Lock()
         Cache._caches.append(cache)
+        Cache._stats[f"{function.__module__}.{function.__qualname__}"] = cache.stats
 
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
+            if not Cache.is_enabled():
+                return function(*args, **kwargs)
+
             cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
             with lock:
-                if cache_key not in mutexes:
-                    mutexes[cache_key] = threading.Lock()
+                mutex_entry = mutexes.setdefault(cache_key, [threading.Lock(), 0])
+                mutex_entry[1] += 1
 
-            with mutexes[cache_key]:
-                if Cache.is_enabled() and cache_key in cache:
-                    return_value = cache[cache_key]
-                else:
-                    return_value = function(*args, **kwargs)
-                if Cache.is_enabled():
-                    cache[cache_key] = return_value
-                return return_value
+            try:
+                with mutex_entry[0]:
+                    return Cache._get_or_compute(function, cache, cache_key, ttl, persistent, args, kwargs)
+            finally:
+                with lock:
+                    mutex_entry[1] -= 1
+                    if mutex_entry[1] == 0:
+                        del mutexes[cache_key]
 
         return wrapper
 
 
+_CALLER_ACCOUNTS: Dict[str, str] = {}
+_CALLER_ACCOUNTS_LOCK = threading.Lock()
+
+
+def _get_caller_account(region: str = None):
+    """
+    Return the account of the current credentials, None if it cannot be resolved.
+
+    The account is retrieved with STS once per process and access key.
+    """
+    try:
+        credentials = boto3.session.Session().get_credentials()
+    except BotoCoreError as e:
+        LOGGER.debug("Unable to resolve the AWS credentials: %s", e)
+        return None
+    if credentials is None:
+        return None
+    access_key = credentials.access_key
+    with _CALLER_ACCOUNTS_LOCK:
+        if access_key not in _CALLER_ACCOUNTS:
+            try:
+                account = boto3.client("sts", region_name=region).get_caller_identity().get("Account")
+            except (BotoCoreError, ClientError) as e:
+                LOGGER.debug("Unable to resolve the account of the AWS credentials: %s", e)
+                account = None
+            _CALLER_ACCOUNTS[access_key] = account
+        return _CALLER_ACCOUNTS[access_key]
+
+
 def get_region():
     """Get region used internally for all the AWS calls."""
     region = boto3.session.Session().region_name
@@ -8,7 +8,13 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
-from pcluster.aws.common import AWSExceptionHandler, Boto3Resource
+import time
+
+from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Resource
+from pcluster.utils import grouper
+
+# Maximum number of items that can be retrieved with a single BatchGetItem request
+BATCH_GET_ITEM_MAX_KEYS = 100
 
 
 class DynamoResource(Boto3Resource):
@@ -22,6 +28,36 @@ class DynamoResource(Boto3Resource):
         """Get item from a DynamoDB table."""
         return self._resource.Table(table_name).get_item(ConsistentRead=True, Key=key)
 
+    @AWSExceptionHandler.handle_client_exception
+    def batch_get_items(self, keys_by_table, max_attempts=5):
+        """
+        Get items from multiple DynamoDB tables with BatchGetItem.
+
+        Keys are grouped in requests of at most 100 keys. Unprocessed keys are retried with exponential backoff.
+        Return a dict with the list of the retrieved items for each table.
+        """
+        items = {}
+        keys = [(table_name, key) for table_name, table_keys in keys_by_table.items() for key in table_keys]
+        for keys_group in grouper(keys, BATCH_GET_ITEM_MAX_KEYS):
+            request_items = {}
+            for table_name, key in keys_group:
+                request_items.setdefault(table_name, {"Keys": [], "ConsistentRead": True})["Keys"].append(key)
+            attempt = 0
+            while request_items:
+                if attempt:
+                    if attempt >= max_attempts:
+                        raise AWSClientError(
+                            function_name="batch_get_items",
+                            message=f"Unable to retrieve items from tables {', '.join(request_items.keys())}",
+                        )
+                    time.sleep(min(0.1 * 2**attempt, 5))
+                response = self._resource.batch_get_item(RequestItems=request_items)
+                for table_name, table_items in response.get("Responses", {}).items():
+                    items.setdefault(table_name, []).extend(table_items)
+                request_items = response.get("UnprocessedKeys")
+                attempt += 1
+        return items
+
     @AWSExceptionHandler.handle_client_exception
     def put_item(self, table_name, item, condition_expression=None):
         """Put item into a DynamoDB table."""
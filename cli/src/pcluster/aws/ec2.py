@@ -9,6 +9,7 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import itertools
+import logging
 import re
 from datetime import datetime
 from typing import Any, List, Tuple
@@ -26,7 +27,16 @@ from pcluster.constants import (
     PCLUSTER_IMAGE_BUILD_STATUS_TAG,
     PCLUSTER_IMAGE_ID_TAG,
 )
-from pcluster.utils import get_partition
+from pcluster.utils import get_partition, grouper
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum number of instance types accepted by a single DescribeInstanceTypes call
+DESCRIBE_INSTANCE_TYPES_BATCH_SIZE = 100
+# Validity, in seconds, of slow-changing data stored in the persistent cache
+INSTANCE_TYPE_CACHE_TTL = 24 * 60 * 60
+OFFICIAL_IMAGES_CACHE_TTL = 6 * 60 * 60
+SUBNET_CACHE_TTL = 24 * 60 * 60
 
 
 class Ec2Client(Boto3Client):
@@ -38,6 +48,7 @@ class Ec2Client(Boto3Client):
         self.security_groups_cache = {}
         self.subnets_cache = {}
         self.capacity_reservations_cache = {}
+        self.instance_types_data_cache = {}
 
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
@@ -111,7 +122,7 @@ class Ec2Client(Boto3Client):
         return result
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=SUBNET_CACHE_TTL, persistent=True)
     def get_subnet_avail_zone(self, subnet_id):
         """Return the availability zone associated to the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -124,7 +135,7 @@ class Ec2Client(Boto3Client):
         return {subnet_id: self.get_subnet_avail_zone(subnet_id) for subnet_id in subnet_ids}
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=SUBNET_CACHE_TTL, persistent=True)
     def get_subnet_vpc(self, subnet_id):
         """Return a vpc associated to the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -133,7 +144,7 @@ class Ec2Client(Boto3Client):
         raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=SUBNET_CACHE_TTL, persistent=True)
     def get_subnet_cidr(self, subnet_id):
         """Return cidr block  of the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -285,10 +296,59 @@ class Ec2Client(Boto3Client):
     def get_instance_type_info(self, instance_type):
         """Return the results of calling EC2's DescribeInstanceTypes API for the given instance type."""
         return InstanceTypeInfo(
-            self.additional_instance_types_data.get(instance_type)
-            or self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+            self.additional_instance_types_data.get(instance_type) or self._describe_instance_type(instance_type)
         )
 
+    @Cache.cached(ttl=INSTANCE_TYPE_CACHE_TTL, persistent=True)
+    def _describe_instance_type(self, instance_type):
+        """Return the raw DescribeInstanceTypes data of the given instance type."""
+        return self.describe_instance_types([instance_type])[0]
+
+    @AWSExceptionHandler.handle_client_exception
+    def describe_instance_types(self, instance_types: List[str]) -> List[dict]:
+        """
+        Return the raw DescribeInstanceTypes data of the given instance types.
+
+        Data not already cached, in memory or in the persistent cache of the single instance types, is retrieved with
+        batched calls, each one describing up to DESCRIBE_INSTANCE_TYPES_BATCH_SIZE instance types, and added to both
+        caches. Data is returned in the order of the given instance types.
+        """
+        instance_types = list(dict.fromkeys(instance_types))
+        result = {}
+        missed_instance_types = []
+        for instance_type in instance_types:
+            cached_data = self.instance_types_data_cache.get(instance_type)
+            if not cached_data:
+                _, cached_data = Cache.get_persistent(Ec2Client._describe_instance_type, (self, instance_type))
+            if cached_data:
+                self.instance_types_data_cache[instance_type] = cached_data
+                result[instance_type] = cached_data
+            else:
+                missed_instance_types.append(instance_type)
+        if missed_instance_types:
+            api_calls = 0
+            paginator = self._client.get_paginator("describe_instance_types")
+            for batch in grouper(missed_instance_types, DESCRIBE_INSTANCE_TYPES_BATCH_SIZE):
+                for page in paginator.paginate(InstanceTypes=list(batch)):
+                    api_calls += 1
+                    for instance_type_data in page.get("InstanceTypes", []):
+                        instance_type = instance_type_data.get("InstanceType")
+                        self.instance_types_data_cache[instance_type] = instance_type_data
+                        Cache.set_persistent(
+                            Ec2Client._describe_instance_type,
+                            (self, instance_type),
+                            instance_type_data,
+                            ttl=INSTANCE_TYPE_CACHE_TTL,
+                        )
+                        result[instance_type] = instance_type_data
+            LOGGER.debug(
+                "Described %d instance types with %d DescribeInstanceTypes calls, %d calls saved by batching",
+                len(missed_instance_types),
+                api_calls,
+                len(missed_instance_types) - api_calls,
+            )
+        return [result[instance_type] for instance_type in instance_types if instance_type in result]
+
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def get_supported_architectures(self, instance_type):
@@ -312,7 +372,7 @@ class Ec2Client(Boto3Client):
 
         filters = [{"Name": "name", "Values": ["{0}*".format(self._get_official_image_name_prefix(os, architecture))]}]
         filters.extend([{"Name": f"tag:{tag.key}", "Values": [tag.value]} for tag in tags])
-        images = self._describe_images_with_pagination(Owners=[owner], Filters=filters, IncludeDeprecated=True)
+        images = self._describe_official_images(owners=[owner], filters=filters)
         if not images:
             raise AWSClientError(function_name="describe_images", message="Cannot find official ParallelCluster AMI")
         return self._find_valid_official_image(images).get("ImageId")
@@ -324,7 +384,7 @@ class Ec2Client(Boto3Client):
         owners = ["amazon"]
         name = f"{self._get_official_image_name_prefix(os, architecture)}*"
         filters = [{"Name": "name", "Values": [name]}]
-        images = self._describe_images_with_pagination(Owners=owners, Filters=filters, IncludeDeprecated=True)
+        images = self._describe_official_images(owners=owners, filters=filters)
         return [
             ImageInfo(self._find_valid_official_image(images_os_arch))
             for _, images_os_arch in itertools.groupby(
@@ -333,6 +393,11 @@ class Ec2Client(Boto3Client):
             )
         ]
 
+    @Cache.cached(ttl=OFFICIAL_IMAGES_CACHE_TTL, persistent=True)
+    def _describe_official_images(self, owners, filters):
+        """Describe the official images, including the deprecated ones, matching the given owners and filters."""
+        return self._describe_images_with_pagination(Owners=owners, Filters=filters, IncludeDeprecated=True)
+
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def get_eip_allocation_id(self, eip):
@@ -17,6 +17,7 @@ from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
 from pcluster.constants import PCLUSTER_BUCKET_PROTECTED_PREFIX
 from pcluster.models.cluster import Cluster
+from pcluster.models.common import DEFAULT_LOGS_DOWNLOAD_CONCURRENCY
 
 LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +66,15 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
                 "node-type - The node type, the only accepted value for this filter is HeadNode."
             ),
         )
+        parser.add_argument(
+            "--download-concurrency",
+            type=_positive_int,
+            default=DEFAULT_LOGS_DOWNLOAD_CONCURRENCY,
+            help=(
+                "Maximum number of log streams downloaded and decompressed concurrently from the S3 bucket. "
+                f"(Defaults to {DEFAULT_LOGS_DOWNLOAD_CONCURRENCY}.)"
+            ),
+        )
 
     def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
         try:
@@ -98,11 +108,24 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
             end_time=args.end_time,
             filters=args.filters,
             output_file=output_file,
+            compression=args.compression,
+            download_concurrency=args.download_concurrency,
         )
         LOGGER.debug("Cluster's logs exported correctly to %s", url)
         return {"path": output_file} if output_file is not None else {"url": url}
 
 
+def _positive_int(value):
+    """Convert the given value to a positive integer."""
+    try:
+        int_value = int(value)
+    except ValueError:
+        int_value = 0
+    if int_value < 1:
+        raise ArgumentTypeError(f"invalid positive integer value: '{value}'")
+    return int_value
+
+
 class _FiltersArg:
     """Class to implement regex parsing for filters parameter."""
 
@@ -9,13 +9,23 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
-# pylint: disable=R0801
+import importlib
 
-# flake8: noqa
+# CLI commands not defined in the API specification, by command name.
+# Command modules import the models they need (e.g. Cluster, ImageBuilder) at module level, so they are imported only
+# when the corresponding command is invoked, keeping the startup of the other commands fast.
+CLI_COMMANDS = {
+    "configure": "pcluster.cli.commands.configure.command.ConfigureCommand",
+    "dcv-connect": "pcluster.cli.commands.dcv_connect.DcvConnectCommand",
+    "export-cluster-logs": "pcluster.cli.commands.cluster_logs.ExportClusterLogsCommand",
+    "export-image-logs": "pcluster.cli.commands.image_logs.ExportImageLogsCommand",
+    "ssh": "pcluster.cli.commands.ssh.SshCommand",
+    "template-cache": "pcluster.cli.commands.template_cache.TemplateCacheCommand",
+    "version": "pcluster.cli.commands.version.VersionCommand",
+}
 
-from pcluster.cli.commands.cluster_logs import ExportClusterLogsCommand
-from pcluster.cli.commands.configure.command import ConfigureCommand
-from pcluster.cli.commands.dcv_connect import DcvConnectCommand
-from pcluster.cli.commands.image_logs import ExportImageLogsCommand
-from pcluster.cli.commands.ssh import SshCommand
-from pcluster.cli.commands.version import VersionCommand
+
+def load_cli_command(name: str):
+    """Import the module of the given CLI command and return the command class."""
+    module_name, class_name = CLI_COMMANDS[name].rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
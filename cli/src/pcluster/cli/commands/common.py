@@ -112,6 +112,13 @@ class ExportLogsCommand:
             default=False,
             help="Keep the exported objects exports to S3. (Defaults to 'false'.)",
         )
+        parser.add_argument(
+            "--compression",
+            choices=["gzip", "zstd"],
+            default="gzip",
+            help="Compression of the logs archive. zstd requires the zstandard Python package. "
+            "(Defaults to 'gzip'.)",
+        )
         # Filters
         parser.add_argument(
             "--start-time",
@@ -91,6 +91,7 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
             start_time=args.start_time,
             end_time=args.end_time,
             output_file=output_file,
+            compression=args.compression,
         )
         LOGGER.debug("Image's logs exported correctly to %s", url)
         return {"path": output_file} if output_file else {"url": url}
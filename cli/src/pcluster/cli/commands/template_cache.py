@@ -0,0 +1,51 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List
+
+import argparse
+
+from pcluster.cli.commands.common import CliCommand, print_json
+from pcluster.templates.cdk_template_cache import CDKTemplateCache
+
+
+class TemplateCacheCommand(CliCommand):
+    """Implement pcluster template-cache command."""
+
+    # CLI
+    name = "template-cache"
+    help = "Inspect or purge the local cache of the cluster templates generated by CDK."
+    description = (
+        "Inspect or purge the local cache of the cluster templates generated by CDK. "
+        "The cache is used by the create-cluster and update-cluster commands when the "
+        "PCLUSTER_TEMPLATE_CACHE_ENABLED environment variable is set to true."
+    )
+
+    def __init__(self, subparsers):
+        super().__init__(subparsers, name=self.name, help=self.help, description=self.description, region_arg=False)
+
+    def register_command_args(self, parser: argparse.ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument(
+            "action",
+            choices=["list", "purge"],
+            help="List the cached templates or remove them from the cache.",
+        )
+        parser.add_argument(
+            "-n", "--cluster-name", help="Consider only the templates of the cluster with the provided name."
+        )
+
+    def execute(  # noqa: D102
+        self, args: argparse.Namespace, extra_args: List[str]  # pylint: disable=unused-argument
+    ) -> None:
+        template_cache = CDKTemplateCache()
+        if args.action == "purge":
+            print_json({"purgedTemplates": template_cache.purge(args.cluster_name)})
+        else:
+            print_json({"templates": template_cache.list_entries(args.cluster_name)})
@@ -12,12 +12,12 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
-import inspect
 import json
 import logging.config
 import os
 import re
 import sys
+import types
 from functools import partial
 
 import argparse
@@ -28,17 +28,13 @@ os.environ["JSII_SILENCE_WARNING_KNOWN_BROKEN_NODE_VERSION"] = "1"
 os.environ["JSII_SILENCE_WARNING_UNTESTED_NODE_VERSION"] = "1"
 os.environ["JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION"] = "1"
 
-# Controllers
-import pcluster.api.controllers.cluster_compute_fleet_controller  # noqa: E402
-import pcluster.api.controllers.cluster_instances_controller  # noqa: E402
-import pcluster.api.controllers.cluster_operations_controller  # noqa: E402
-import pcluster.api.controllers.image_operations_controller  # noqa: E402
-import pcluster.api.errors  # noqa: E402
-import pcluster.cli.commands.commands as cli_commands  # noqa: E402
+# API controllers, the API encoder and errors are not imported here since they load connexion, the API models and
+# the cluster model. Controllers are imported on demand by pcluster.cli.model.call, the others only on errors.
 import pcluster.cli.logger as pcluster_logging  # noqa: E402
 import pcluster.cli.model  # noqa: E402
-from pcluster.api import encoder  # noqa: E402
-from pcluster.cli.commands.common import CliCommand, exit_msg, to_bool, to_int, to_number  # noqa: E402
+from pcluster.aws.common import Cache, get_throttling_metrics  # noqa: E402
+from pcluster.cli.commands.commands import CLI_COMMANDS, load_cli_command  # noqa: E402
+from pcluster.cli.commands.common import exit_msg, to_bool, to_int, to_number  # noqa: E402
 from pcluster.cli.exceptions import APIOperationException, ParameterException  # noqa: E402
 from pcluster.cli.logger import redirect_stdouterr_to_logger  # noqa: E402
 from pcluster.cli.middleware import add_additional_args, middleware_hooks  # noqa: E402
@@ -191,23 +187,41 @@ def gen_parser(model):
     return parser, parser_map
 
 
-def add_cli_commands(parser_map):
-    """Add additional CLI arguments that don't belong to the API."""
+def add_cli_commands(parser_map, operation=None):
+    """
+    Add additional CLI arguments that don't belong to the API.
+
+    Only the command being invoked is loaded. All of them are loaded when the operation is unknown, e.g. to print the
+    full help, and none of them when the operation is an API one.
+    """
     subparsers = parser_map["subparser"]
 
-    # add all non-api commands via introspection
-    for _name, obj in inspect.getmembers(cli_commands):
-        if inspect.isclass(obj) and issubclass(obj, CliCommand) and not inspect.isabstract(obj):
-            obj(subparsers)
+    if operation in CLI_COMMANDS:
+        command_names = [operation]
+    elif operation in parser_map:
+        command_names = []
+    else:
+        command_names = CLI_COMMANDS.keys()
+    for command_name in command_names:
+        load_cli_command(command_name)(subparsers)
 
     add_additional_args(parser_map)
 
 
+def _api_error_data(error):
+    """Format exception messages in the same manner as the API."""
+    import pcluster.api.errors  # pylint: disable=import-outside-toplevel
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
+    message = pcluster.api.errors.exception_message(error)
+    return json.loads(encoder.JSONEncoder().encode(message))
+
+
 def _run_operation(model, args, extra_args):
     if args.operation in model:
         try:
             with redirect_stdouterr_to_logger():
-                return args.func(args)
+                ret = args.func(args)
         except KeyboardInterrupt as e:
             raise e
         except APIOperationException as e:
@@ -215,27 +229,42 @@ def _run_operation(model, args, extra_args):
         except ParameterException as e:
             raise e
         except Exception as e:
-            # format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
+            raise APIOperationException(_api_error_data(e))
+        return _stream_records(ret) if isinstance(ret, types.GeneratorType) else ret
     else:
         try:
             return args.func(args, extra_args)
-        except pcluster.api.errors.ParallelClusterApiException as e:
-            # Format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
         except Exception as e:
+            import pcluster.api.errors  # pylint: disable=import-outside-toplevel
+
+            if isinstance(e, pcluster.api.errors.ParallelClusterApiException):
+                raise APIOperationException(_api_error_data(e))
             raise e
 
 
+def _stream_records(records):
+    """Yield the records of a streamed operation, handling the errors raised while retrieving them as the API does."""
+    try:
+        while True:
+            try:
+                with redirect_stdouterr_to_logger():
+                    record = next(records)
+            except StopIteration:
+                return
+            except (KeyboardInterrupt, APIOperationException, ParameterException) as e:
+                raise e
+            except Exception as e:
+                raise APIOperationException(_api_error_data(e))
+            yield record
+    finally:
+        _log_stats()
+
+
 def run(sys_args, model=None):
     spec = pcluster.cli.model.package_spec()
     model = model or pcluster.cli.model.load_model(spec)
     parser, parser_map = gen_parser(model)
-    add_cli_commands(parser_map)
+    add_cli_commands(parser_map, operation=next(iter(sys_args), None))
     args, extra_args = parser.parse_known_args(sys_args)
 
     # some commands (e.g. ssh and those defined as CliCommand objects) require 'extra_args'
@@ -259,17 +288,38 @@ def run(sys_args, model=None):
 
     LOGGER.info("Handling CLI command %s", args.operation)
     LOGGER.debug("Parsed CLI arguments: args(%s), extra_args(%s)", args, extra_args)
-    return _run_operation(model, args, extra_args)
+    ret = None
+    try:
+        ret = _run_operation(model, args, extra_args)
+        return ret
+    finally:
+        # The stats of streamed operations are logged once all the records have been retrieved
+        if not isinstance(ret, types.GeneratorType):
+            _log_stats()
+
+
+def _log_stats():
+    """Log the cache and the throttling counters of the operation at debug level."""
+    Cache.log_stats()
+    for service, metrics in get_throttling_metrics().items():
+        LOGGER.debug("Throttling metrics for %s: %s", service, metrics)
+
+
+def _print_output(ret):
+    if isinstance(ret, types.GeneratorType):
+        # Streamed operations are printed as NDJSON, one record per line as soon as it is retrieved
+        for record in ret:
+            print(json.dumps(record), flush=True)
+    elif ret:
+        output_str = json.dumps(ret, indent=2)
+        print(output_str)
+        LOGGER.info(output_str)
 
 
 def main():
     pcluster_logging.config_logger()
     try:
-        ret = run(sys.argv[1:])
-        if ret:
-            output_str = json.dumps(ret, indent=2)
-            print(output_str)
-            LOGGER.info(output_str)
+        _print_output(run(sys.argv[1:]))
         sys.exit(0)
     except NoCredentialsError:  # TODO: remove from here
         LOGGER.error("AWS Credentials not found.")
@@ -20,6 +20,8 @@ provided.
 """
 
 import logging
+import os
+from contextlib import contextmanager
 
 import argparse
 import boto3
@@ -28,9 +30,17 @@ from botocore.exceptions import WaiterError
 
 import pcluster.cli.model
 from pcluster.cli.exceptions import APIOperationException, ParameterException
+from pcluster.validators.validation_profiler import VALIDATION_PROFILE_FORMATS
 
 LOGGER = logging.getLogger(__name__)
 
+# Paginated operations supporting the --stream argument, with the key of the records in their response
+STREAMABLE_OPERATIONS = {
+    "describe-cluster-instances": "instances",
+    "get-cluster-log-events": "events",
+    "get-image-log-events": "events",
+}
+
 
 def _cluster_status(cluster_name):
     controller = "cluster_operations_controller"
@@ -49,6 +59,28 @@ def add_additional_args(parser_map):
     parser_map["create-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["delete-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["update-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
+    for operation in ["create-cluster", "update-cluster", "build-image"]:
+        parser_map[operation].add_argument(
+            "--validation-profile",
+            choices=VALIDATION_PROFILE_FORMATS,
+            help="Print to stderr the wall time, boto3 calls and cache hits of each validator, as table or json.",
+        )
+    parser_map["delete-cluster-instances"].add_argument(
+        "--wait",
+        action="store_true",
+        help="Wait until all the compute nodes are terminated, i.e. none of them is shutting down.",
+    )
+    parser_map["update-cluster"].add_argument(
+        "--incremental-validation",
+        action="store_true",
+        help="Validate only the queues and login nodes pools changed by the update, when no other section changes.",
+    )
+    for operation in STREAMABLE_OPERATIONS:
+        parser_map[operation].add_argument(
+            "--stream",
+            action="store_true",
+            help="Retrieve all the pages following the next tokens and print one JSON record per line as they arrive.",
+        )
 
 
 def middleware_hooks():
@@ -56,7 +88,38 @@ def middleware_hooks():
 
     The map has operation names as the keys and functions as values.
     """
-    return {"create-cluster": create_cluster, "delete-cluster": delete_cluster, "update-cluster": update_cluster}
+    hooks = {operation: streamable(records_key) for operation, records_key in STREAMABLE_OPERATIONS.items()}
+    hooks.update(
+        {
+            "build-image": build_image,
+            "create-cluster": create_cluster,
+            "delete-cluster": delete_cluster,
+            "delete-cluster-instances": delete_cluster_instances,
+            "update-cluster": update_cluster,
+        }
+    )
+    return hooks
+
+
+def _validation_profile_environ(kwargs):
+    """Return the environment enabling the validators profiling, if requested, and remove the argument from kwargs."""
+    validation_profile = kwargs.pop("validation_profile", None)
+    return {"PCLUSTER_VALIDATION_PROFILE": validation_profile} if validation_profile else {}
+
+
+@contextmanager
+def _scoped_environ(variables):
+    """Set the environment variables for the duration of the operation only, restoring their previous values after."""
+    previous_values = {name: os.environ.get(name) for name in variables}
+    os.environ.update(variables)
+    try:
+        yield
+    finally:
+        for name, value in previous_values.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
 
 
 def queryable(func):
@@ -71,10 +134,50 @@ def queryable(func):
     return wrapper
 
 
+def streamable(records_key):
+    """
+    Return a middleware function streaming the records of a paginated operation when --stream is set.
+
+    The returned generator retrieves a page at a time, so that records are printed as soon as their page arrives
+    and memory does not grow with the number of pages. The query, if any, is applied to every record.
+    """
+
+    def wrapper(dest_func, _body, kwargs):
+        if not kwargs.pop("stream", False):
+            return dest_func(**kwargs)
+        query = kwargs.pop("query", None)
+        try:
+            expression = jmespath.compile(query) if query else None
+        except jmespath.exceptions.ParseError:
+            raise ParameterException({"message": "Invalid query string.", "query": query})
+        return _stream_records(dest_func, kwargs, records_key, expression)
+
+    return wrapper
+
+
+def _stream_records(dest_func, kwargs, records_key, expression):
+    next_token = kwargs.pop("next_token", None)
+    while True:
+        page = dest_func(next_token=next_token, **kwargs)
+        for record in page.get(records_key, []):
+            if expression:
+                record = expression.search(record)
+            if record is not None:
+                yield record
+        # The log events return the token received as input when the end of the stream is reached
+        if not page.get("nextToken") or page["nextToken"] == next_token:
+            return
+        next_token = page["nextToken"]
+
+
 @queryable
 def update_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
-    ret = func(**kwargs)
+    environ = _validation_profile_environ(kwargs)
+    if kwargs.pop("incremental_validation", False):
+        environ["PCLUSTER_VALIDATION_INCREMENTAL"] = "true"
+    with _scoped_environ(environ):
+        ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
         cloud_formation = boto3.client("cloudformation")
         waiter = cloud_formation.get_waiter("stack_update_complete")
@@ -90,7 +193,8 @@ def update_cluster(func, _body, kwargs):
 @queryable
 def create_cluster(func, body, kwargs):
     wait = kwargs.pop("wait", False)
-    ret = func(**kwargs)
+    with _scoped_environ(_validation_profile_environ(kwargs)):
+        ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
         cloud_formation = boto3.client("cloudformation")
         waiter = cloud_formation.get_waiter("stack_create_complete")
@@ -103,6 +207,11 @@ def create_cluster(func, body, kwargs):
     return ret
 
 
+def build_image(func, _body, kwargs):
+    with _scoped_environ(_validation_profile_environ(kwargs)):
+        return func(**kwargs)
+
+
 @queryable
 def delete_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
@@ -118,3 +227,21 @@ def delete_cluster(func, _body, kwargs):
         return {"message": f"Successfully deleted cluster '{kwargs['cluster_name']}'."}
     else:
         return ret
+
+
+@queryable
+def delete_cluster_instances(func, _body, kwargs):
+    wait = kwargs.pop("wait", False)
+    ret = func(**kwargs)
+    if wait:
+        # Imported here to not load the cluster model when starting the other commands
+        from pcluster.models.cluster import Cluster, ClusterActionError  # pylint: disable=import-outside-toplevel
+
+        try:
+            Cluster(kwargs["cluster_name"]).wait_nodes_termination()
+        except ClusterActionError as e:
+            LOGGER.error("Failed when waiting for compute nodes termination with error: %s", e)
+            raise APIOperationException({"message": str(e)})
+        return {"message": f"Successfully terminated the compute nodes of cluster '{kwargs['cluster_name']}'."}
+    else:
+        return ret
@@ -15,10 +15,11 @@ import importlib
 import json
 
 import jmespath
+import yaml
 
-from pcluster.api import encoder, openapi
+from pcluster.api import openapi
 from pcluster.cli.exceptions import APIOperationException
-from pcluster.utils import to_kebab_case, to_snake_case, yaml_load
+from pcluster.utils import to_kebab_case, to_snake_case
 
 # For importing package resources
 try:
@@ -89,7 +90,8 @@ def _resolve_body(spec, operation):
 def package_spec():
     """Load the OpenAPI specification from the package."""
     with pkg_resources.open_text(openapi, "openapi.yaml") as spec_file:  # pylint: disable=deprecated-method
-        return yaml_load(spec_file.read())
+        # The specification is shipped with the package, use the much faster libyaml based loader when available
+        return yaml.load(spec_file.read(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))  # nosec B506
 
 
 def load_model(spec):
@@ -206,6 +208,9 @@ def call(func_str, *args, **kwargs):
     tuple (instead of an object). Also uses the flask json-ifier to ensure data
     is converted the same as the API.
     """
+    # The encoder loads connexion and the API models, it is imported only when an API operation is executed
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
     query = kwargs.pop("query", None)
     func = get_function_from_name(func_str)
     ret = func(*args, **kwargs)
@@ -13,6 +13,7 @@
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
 import logging
+import re
 from abc import abstractmethod
 from collections import defaultdict
 from enum import Enum
@@ -1825,6 +1826,14 @@ class BaseClusterConfig(Resource):
             storage_count=ebs_count,
         )
 
+    def get_changed_resources(self, changes: List) -> Union[List[Resource], None]:
+        """
+        Return the resources affected by the given ConfigPatch changes, to be used for an incremental validation.
+
+        None means that the whole configuration must be validated.
+        """
+        return None
+
     def _cache_describe_volume(self):
         volume_ids = []
         for storage in self.shared_storage:
@@ -2922,6 +2931,53 @@ class SlurmClusterConfig(BaseClusterConfig):
             AWSApi.instance().ec2.describe_capacity_reservations(self.all_relevant_capacity_reservation_ids)
         except AWSClientError:
             logging.warning("Unable to cache describe_capacity_reservations results for all capacity reservation ids.")
+        # Cache instance types information together, so that validators and template generation do not need to
+        # describe every instance type separately. This cache is only an optimization, in case of errors
+        # (e.g. an invalid instance type in the config) instance types will be described one by one.
+        try:
+            AWSApi.instance().ec2.describe_instance_types(self.all_instance_types)
+        except AWSClientError:
+            LOGGER.debug("Unable to cache describe_instance_types results for all instance types.")
+
+    @property
+    def all_instance_types(self):
+        """Return the list of instance types used by head node, login nodes and compute resources."""
+        instance_types = [self.head_node.instance_type]
+        if self.login_nodes:
+            instance_types.extend(pool.instance_type for pool in self.login_nodes.pools)
+        for queue in self.scheduling.queues:
+            for compute_resource in queue.compute_resources:
+                instance_types.extend(compute_resource.instance_types)
+        return list(dict.fromkeys(instance_type for instance_type in instance_types if instance_type))
+
+    def get_changed_resources(self, changes: List) -> Union[List[Resource], None]:
+        """
+        Return the queues and login nodes pools affected by the given ConfigPatch changes.
+
+        None is returned, meaning that the whole configuration must be validated, when a change touches any other
+        section or removes a queue or a pool, since the remaining ones could be affected.
+        """
+        resources_by_list_path = {
+            ("Scheduling", "SlurmQueues"): {queue.name: queue for queue in self.scheduling.queues},
+            ("LoginNodes", "Pools"): {pool.name: pool for pool in self.login_nodes.pools} if self.login_nodes else {},
+        }
+        changed_resources = []
+        for change in changes:
+            if change.is_list and tuple(change.path) + (change.key,) in resources_by_list_path:
+                # Added item of the list, e.g. a new queue
+                if change.old_value is not None or not change.new_value:
+                    return None
+                resource = resources_by_list_path[tuple(change.path) + (change.key,)].get(change.new_value.get("Name"))
+            else:
+                # Change inside an item of the list, e.g. Scheduling > SlurmQueues[queue1] > ...
+                match = re.fullmatch(r"(\w+)\[(.+)\]", change.path[1]) if len(change.path) > 1 else None
+                resources = resources_by_list_path.get((change.path[0], match.group(1))) if match else None
+                resource = resources.get(match.group(2)) if resources else None
+            if resource is None:
+                return None
+            if not any(changed_resource is resource for changed_resource in changed_resources):
+                changed_resources.append(resource)
+        return changed_resources
 
     def get_instance_types_data(self):
         """Get instance type infos for all instance types used in the configuration file."""
@@ -12,15 +12,13 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
-import asyncio
-import itertools
 import json
 import logging
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import List, Set
 
-from pcluster.validators.common import AsyncValidator, FailureLevel, ValidationResult, Validator, ValidatorContext
+from pcluster.validators.common import ValidationResult, ValidationScheduler, Validator, ValidatorContext
 from pcluster.validators.iam_validators import AdditionalIamPolicyValidator
 from pcluster.validators.networking_validators import LambdaFunctionsVpcConfigValidator
 from pcluster.validators.s3_validators import UrlValidator
@@ -133,7 +131,7 @@ class Resource:
     def __init__(self, implied: bool = False):
         # Parameters registry
         self.__params = {}
-        self._validation_futures = []
+        self._scheduled_validators = []
         self._validation_failures: List[ValidationResult] = []
         self._validators: List = []
         self.implied = implied
@@ -180,38 +178,19 @@ class Resource:
         return Resource.Param(value, default=default, update_policy=update_policy)
 
     @staticmethod
-    def _validator_execute(validator_class, validator_args, suppressors, validation_executor):
+    def _validator_create(validator_class, suppressors):
         validator = validator_class()
 
         if any(suppressor.suppress_validator(validator) for suppressor in (suppressors or [])):
             LOGGER.debug("Suppressing validator %s", validator_class.__name__)
             return None
 
-        LOGGER.debug("Executing validator %s", validator_class.__name__)
-        return validation_executor(validator_args, validator)
+        return validator
 
-    @staticmethod
-    def _validator_execute_sync(validator_args, validator):
-        try:
-            return validator.execute(**validator_args)
-        except Exception as e:
-            LOGGER.debug("Validator %s unexpected failure: %s", validator.type, e)
-            return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)]
-
-    @staticmethod
-    def _validator_execute_async(validator_args, validator):
-        return validator.execute_async(**validator_args)
-
-    def _await_async_validators(self):
-        # here could be a good spot to add a cascading timeout for the async validators
-        # if they are taking too long to execute for a resource and its children since the use of
-        # get_async_timed_validator_type_for allows to decorate only on single validator at a time and
-        # does not cascade to child resources
-        return list(
-            itertools.chain.from_iterable(
-                asyncio.get_event_loop().run_until_complete(asyncio.gather(*self._validation_futures))
-            )
-        )
+    def _run_scheduled_validators(self):
+        # All the validators collected while walking the resource tree are executed together here,
+        # so that I/O bound validators run concurrently and a global timeout applies to the whole tree
+        return ValidationScheduler().run(self._scheduled_validators)
 
     def _nested_resources(self):
         nested_resources = []
@@ -222,53 +201,68 @@ class Resource:
                 nested_resources.extend(item for item in value if isinstance(item, Resource))
         return nested_resources
 
+    def _contains_any(self, resources: List["Resource"]):
+        """Tell if any of the given resources is this resource or one of its nested resources."""
+        return any(resource is self for resource in resources) or any(
+            nested_resource._contains_any(resources) for nested_resource in self._nested_resources()
+        )
+
     def validate(
-        self, suppressors: List[ValidatorSuppressor] = None, context: ValidatorContext = None, nested: bool = False
+        self,
+        suppressors: List[ValidatorSuppressor] = None,
+        context: ValidatorContext = None,
+        nested: bool = False,
+        changed_resources: List["Resource"] = None,
     ):
         """
         Execute registered validators.
 
+        Validators of the whole resource tree are collected first and then executed concurrently.
         The "nested" parameter is used only for internal recursive calls to distinguish those from the top level
-        one where the async validators results should be awaited for.
+        one, which is in charge of executing the validators and returning their results.
+        When "changed_resources" is specified the validation is incremental: only the validators of the changed
+        resources, of their nested resources and of their ancestors, which perform the cross-resource checks,
+        are executed. Validators of the other resources are skipped.
         """
-        # this validation logic is a responsibility that could be completely separated from the resource tree
-        # also until we need to support both sync and async validation this logic will be unnecessarily complex
-        # embracing async validation completely is possible and will greatly simplify this
-        self._validation_futures.clear()
+        self._scheduled_validators.clear()
         self._validation_failures.clear()
 
         try:
-            self._validate_nested_resources(context, suppressors)
+            self._validate_nested_resources(context, suppressors, changed_resources)
             self._validate_self(context, suppressors)
         finally:
             if nested:
-                result = self._validation_failures, self._validation_futures.copy()
+                result = self._validation_failures, self._scheduled_validators.copy()
             else:
-                self._validation_failures.extend(self._await_async_validators())
+                self._validation_failures.extend(self._run_scheduled_validators())
                 result = self._validation_failures
-            self._validation_futures.clear()
+            self._scheduled_validators.clear()
 
         return result
 
-    def _validate_nested_resources(self, context, suppressors):
-        # Call validators for nested resources
+    def _validate_nested_resources(self, context, suppressors, changed_resources=None):
+        # Collect validators of nested resources
         for nested_resource in self._nested_resources():
-            failures, futures = nested_resource.validate(suppressors, context, nested=True)
-            self._validation_futures.extend(futures)
+            nested_changed_resources = changed_resources
+            if changed_resources is not None:
+                if any(resource is nested_resource for resource in changed_resources):
+                    # The whole subtree of a changed resource is validated
+                    nested_changed_resources = None
+                elif not nested_resource._contains_any(changed_resources):
+                    continue
+            failures, scheduled_validators = nested_resource.validate(
+                suppressors, context, nested=True, changed_resources=nested_changed_resources
+            )
+            self._scheduled_validators.extend(scheduled_validators)
             self._validation_failures.extend(failures)
 
     def _validate_self(self, context, suppressors):
         self._validators.clear()
         self._register_validators(context)
-        for validator in self._validators:
-            if issubclass(validator[0], AsyncValidator):
-                result = self._validator_execute(*validator, suppressors, self._validator_execute_async)
-                if result:
-                    self._validation_futures.extend([result])
-            else:
-                self._validation_failures.extend(
-                    self._validator_execute(*validator, suppressors, self._validator_execute_sync) or []
-                )
+        for validator_class, validator_args in self._validators:
+            validator = self._validator_create(validator_class, suppressors)
+            if validator:
+                self._scheduled_validators.append((validator, validator_args))
 
     def _register_validators(self, context: ValidatorContext = None):
         """
@@ -13,9 +13,10 @@ import logging
 import re
 import sys
 from collections import namedtuple
-from typing import List
+from typing import Tuple
 
 from pcluster.config.update_policy import UpdatePolicy
+from pcluster.config.update_policy_utils import ClusterStateSnapshot
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.schemas.common_schema import BaseSchema
 
@@ -52,14 +53,18 @@ class ConfigPatch:
         - A list of change rows with all the information to build a detailed report
     """
 
-    def __init__(self, cluster, base_config: dict, target_config: dict):
+    def __init__(self, cluster, base_config: dict, target_config: dict, cluster_state: ClusterStateSnapshot = None):
         """
         Create a ConfigPatch.
 
         :param base_config: The base configuration, f.i. from S3 bucket
         :param target_config: The target configuration, f.i. as loaded from configuration file
+        :param cluster_state: The state of the cluster to check the patch against, retrieved from the cluster if not
+        provided
         """
         self.cluster = cluster
+        self._provided_cluster_state = cluster_state
+        self.cluster_state = cluster_state or ClusterStateSnapshot(cluster)
         # Cached condition results
         self.condition_results = {}
 
@@ -88,16 +93,18 @@ class ConfigPatch:
         All detected changes are added to the internal changes list, ready to be checked  through the public check()
         method.
         """
-        self._compare_section(self.base_config, self.target_config, self.cluster_schema, param_path=[])
+        self._compare_section(self.base_config, self.target_config, self.cluster_schema, param_path=())
 
-    def _compare_section(self, base_section: dict, target_section: dict, section_schema: BaseSchema, param_path: List):
+    def _compare_section(
+        self, base_section: dict, target_section: dict, section_schema: BaseSchema, param_path: Tuple[str, ...]
+    ):
         """
         Compare the provided base and target sections and append the detected changes to the internal changes list.
 
         :param base_section: The section in the base configuration
         :param target_section: The corresponding section in the target configuration
         :param section_schema: schema corresponding to the section to be analyzed (contains all the resources/params)
-        :param param_path: A list on which the items correspond to the path of the param in the configuration schema
+        :param param_path: A tuple on which the items correspond to the path of the param in the configuration schema
         """
         for _, field_obj in section_schema.declared_fields.items():
             data_key = field_obj.data_key
@@ -127,7 +134,7 @@ class ConfigPatch:
                             # Add section change information
                             self.changes.append(
                                 Change(
-                                    param_path,
+                                    list(param_path),
                                     data_key,
                                     base_value if base_value else "-",
                                     target_value if target_value else "-",
@@ -141,7 +148,8 @@ class ConfigPatch:
                 base_value, base_data_key = self._get_value_from_section(data_key, base_section)
                 if target_data_key != base_data_key:
                     # So far, this only happens when custom actions scripts are changed across simple and sequence.
-                    data_key = param_path.pop()
+                    data_key = param_path[-1]
+                    param_path = param_path[:-1]
                     base_value = {base_data_key: base_value}
                     target_value = {target_data_key: target_value}
                 else:
@@ -152,7 +160,9 @@ class ConfigPatch:
                 if target_value != base_value:
                     # Add param change information
                     self.changes.append(
-                        Change(param_path, data_key, base_value, target_value, change_update_policy, is_list=False)
+                        Change(
+                            list(param_path), data_key, base_value, target_value, change_update_policy, is_list=False
+                        )
                     )
 
     def _get_value_from_section(self, data_key, section):
@@ -169,9 +179,7 @@ class ConfigPatch:
 
     def _compare_nested_section(self, param_path, data_key, base_value, target_value, field_obj):
         # Compare nested sections and params
-        nested_path = copy.deepcopy(param_path)
-        nested_path.append(data_key)
-        self._compare_section(base_value, target_value, field_obj.schema, nested_path)
+        self._compare_section(base_value, target_value, field_obj.schema, param_path + (data_key,))
 
     def _compare_list(self, base_section, target_section, param_path, data_key, field_obj, change_update_policy):
         """
@@ -180,28 +188,27 @@ class ConfigPatch:
         If update_key is not set we're considering Name as identifier.
         """
         update_key = field_obj.metadata.get("update_key")
+        base_nested_sections = base_section.get(data_key, []) if base_section else []
 
-        # Compare items in the list by searching the right item to compare through update_key value
-        # First, compare all sections from target vs base config and mark visited base sections.
+        # Index the base sections by update_key value, the first one wins in case of duplicated values
+        base_indexes = {}
+        for index, base_nested_section in enumerate(base_nested_sections):
+            base_indexes.setdefault(base_nested_section.get(update_key), index)
+
+        # First, compare all sections from target vs base config and keep track of the matched base sections.
+        matched_indexes = set()
         for target_nested_section in target_section.get(data_key, []):
             update_key_value = target_nested_section.get(update_key)
-            base_nested_section = next(
-                (
-                    nested_section
-                    for nested_section in base_section.get(data_key, [])
-                    if nested_section.get(update_key) == update_key_value
-                ),
-                None,
-            )
+            base_index = base_indexes.get(update_key_value)
+            base_nested_section = base_nested_sections[base_index] if base_index is not None else None
             if base_nested_section:
-                nested_path = copy.deepcopy(param_path)
-                nested_path.append(f"{data_key}[{update_key_value}]")
+                nested_path = param_path + (f"{data_key}[{update_key_value}]",)
                 self._compare_section(base_nested_section, target_nested_section, field_obj.schema, nested_path)
-                base_nested_section["visited"] = True
+                matched_indexes.add(base_index)
             else:
                 self.changes.append(
                     Change(
-                        param_path,
+                        list(param_path),
                         data_key,
                         None,
                         target_nested_section,
@@ -209,20 +216,19 @@ class ConfigPatch:
                         is_list=True,
                     )
                 )
-        # Then, compare all non visited base sections vs target config.
-        if base_section:
-            for base_nested_section in base_section.get(data_key, []):
-                if not base_nested_section.get("visited", False):
-                    self.changes.append(
-                        Change(
-                            param_path,
-                            data_key,
-                            base_nested_section,
-                            None,
-                            change_update_policy,
-                            is_list=True,
-                        )
+        # Then, compare all non matched base sections vs target config.
+        for index, base_nested_section in enumerate(base_nested_sections):
+            if index not in matched_indexes:
+                self.changes.append(
+                    Change(
+                        list(param_path),
+                        data_key,
+                        base_nested_section,
+                        None,
+                        change_update_policy,
+                        is_list=True,
                     )
+                )
 
     @property
     def update_policy_level(self):
@@ -254,6 +260,8 @@ class ConfigPatch:
         ]
 
         patch_allowed = True
+        # Take a new snapshot of the cluster state, shared by the condition checkers of all the changes
+        self.cluster_state = self._provided_cluster_state or ClusterStateSnapshot(self.cluster)
 
         for change in self.changes:
             check_result, reason, action_needed, print_change = change.update_policy.check(change, self)
@@ -136,7 +136,7 @@ def actions_needed_managed_placement_group(change, patch):
 
 
 def condition_checker_compute_fleet_stop_on_remove(change, patch):
-    result = not patch.cluster.has_running_capacity()
+    result = not patch.cluster_state.has_running_capacity()
     # SlurmQueue or ComputeResource can be added but removal require compute fleet stop
     if change.is_list and (is_slurm_queues_change(change) or change.key == "SlurmQueues"):
         result = result or (change.old_value is None and change.new_value is not None)
@@ -229,14 +229,16 @@ def is_awsbatch_scheduler(_, patch):
 
 def is_compute_fleet_stop_required_for_shared_storage_change(change, patch):
     return (
-        patch.cluster.has_running_capacity()
+        patch.cluster_state.has_running_capacity()
         and not is_compute_fleet_update_supported_for_shared_storage(change)
         and not is_queue_update_strategy_set(patch)
     )
 
 
 def is_login_fleet_stop_required_for_shared_storage_change(change, patch):
-    return patch.cluster.has_running_login_nodes() and not is_login_fleet_update_supported_for_shared_storage(change)
+    return patch.cluster_state.has_running_login_nodes() and not is_login_fleet_update_supported_for_shared_storage(
+        change
+    )
 
 
 def is_login_fleet_update_supported_for_shared_storage(change):
@@ -344,7 +346,7 @@ def is_resize_update_strategy_terminate(patch):
 
 
 def condition_checker_queue_update_strategy(change, patch):
-    result = not patch.cluster.has_running_capacity()
+    result = not patch.cluster_state.has_running_capacity()
     # QueueUpdateStrategy can override UpdatePolicy of parameters under SlurmQueues
     if is_slurm_queues_change(change):
         result = result or is_queue_update_strategy_set(patch)
@@ -354,7 +356,7 @@ def condition_checker_queue_update_strategy(change, patch):
 
 def condition_checker_resize_update_strategy_on_remove(change, patch):
     # Check if fleet is stopped
-    result = not patch.cluster.has_running_capacity()
+    result = not patch.cluster_state.has_running_capacity()
 
     # Check if the change is inside a Queue section
     if not result and (is_slurm_queues_change(change) or change.key == "SlurmQueues"):
@@ -393,7 +395,7 @@ def convert_value_to_int(value, default):
 
 
 def condition_checker_queue_update_strategy_on_remove(change, patch):
-    result = not patch.cluster.has_running_capacity()
+    result = not patch.cluster_state.has_running_capacity()
     # Update of list element value is possible if one of the following is verified:
     # - fleet is stopped
     # - queue update strategy is set (different from default)
@@ -409,7 +411,7 @@ def condition_checker_queue_update_strategy_on_remove(change, patch):
 
 
 def condition_checker_managed_placement_group(change, patch):
-    if is_managed_placement_group_deletion(change, patch) and patch.cluster.has_running_capacity():
+    if is_managed_placement_group_deletion(change, patch) and patch.cluster_state.has_running_capacity():
         result = False
     else:
         result = condition_checker_queue_update_strategy(change, patch)
@@ -466,10 +468,10 @@ def condition_checker_shared_storage_update_policy(change, patch):
         return False
     if is_awsbatch_scheduler(change, patch):
         return False
-    if patch.cluster.has_running_login_nodes() and not is_login_fleet_update_supported_for_shared_storage(change):
+    if patch.cluster_state.has_running_login_nodes() and not is_login_fleet_update_supported_for_shared_storage(change):
         return False
     if (
-        patch.cluster.has_running_capacity()
+        patch.cluster_state.has_running_capacity()
         and not is_compute_fleet_update_supported_for_shared_storage(change)
         and not is_queue_update_strategy_set(patch)
     ):
@@ -480,7 +482,7 @@ def condition_checker_shared_storage_update_policy(change, patch):
 
 def condition_checker_login_nodes_pools_policy(change, patch):
     """Login pools can be added but removal require LoginNodes stop."""
-    result = not patch.cluster.has_running_login_nodes()
+    result = not patch.cluster_state.has_running_login_nodes()
     if change.is_list and change.key == "Pools":
         result = result or (change.old_value is None and change.new_value is not None)
 
@@ -488,13 +490,13 @@ def condition_checker_login_nodes_pools_policy(change, patch):
 
 
 def condition_checker_login_nodes_stop_policy(_, patch):
-    return not patch.cluster.has_running_login_nodes()
+    return not patch.cluster_state.has_running_login_nodes()
 
 
 def condition_checker_login_nodes_pool_stop_policy(change, patch):
     """Check if login nodes are running in the pool in which update was requested."""
     pool_name = get_pool_name_from_change_paths(change)
-    return not patch.cluster.has_running_login_nodes(pool_name=pool_name)
+    return not patch.cluster_state.has_running_login_nodes(pool_name=pool_name)
 
 
 def get_pool_name_from_change_paths(change):
@@ -572,10 +574,10 @@ UpdatePolicy.AWSBATCH_CE_MAX_RESIZE = UpdatePolicy(
     name="AWSBATCH_CE_MAX_RESIZE",
     level=1,
     fail_reason=lambda change, patch: "Max vCPUs can not be lower than the current Desired vCPUs ({0})".format(
-        patch.cluster.get_running_capacity()
+        patch.cluster_state.get_running_capacity()
     ),
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: patch.cluster.get_running_capacity()
+    condition_checker=lambda change, patch: patch.cluster_state.get_running_capacity()
     <= patch.target_config["Scheduling"]["AwsBatchQueues"][0]["ComputeResources"][0]["MaxvCpus"],
 )
 
@@ -630,7 +632,7 @@ UpdatePolicy.COMPUTE_FLEET_STOP = UpdatePolicy(
     level=10,
     fail_reason="All compute nodes must be stopped",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: not patch.cluster.has_running_capacity(),
+    condition_checker=lambda change, patch: not patch.cluster_state.has_running_capacity(),
 )
 
 # Update supported only with head node down
@@ -639,7 +641,7 @@ UpdatePolicy.HEAD_NODE_STOP = UpdatePolicy(
     level=20,
     fail_reason="To perform this update action, the head node must be in a stopped state",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: patch.cluster.head_node_instance.state == "stopped",
+    condition_checker=lambda change, patch: patch.cluster_state.get_head_node_state() == "stopped",
 )
 
 # Expected Behavior:
@@ -30,3 +30,74 @@ class SharedStorageChangeInfo:
 
         # Storage Type
         self.storage_type = storage_item.get("StorageType")
+
+
+class ClusterStateSnapshot:
+    """
+    Capture the state of the cluster checked by the update policies.
+
+    The state is made of:
+      1. the running capacity of the compute fleet, derived from the compute fleet status.
+      2. the running login nodes, overall and per pool.
+      3. the state of the head node.
+
+    Each fact is retrieved from the cluster the first time a condition checker needs it and then reused for all the
+    changes of the patch. Facts can be provided in advance, e.g. ClusterStateSnapshot(has_running_capacity=False),
+    to check a patch without retrieving the state of a live cluster.
+    """
+
+    def __init__(
+        self,
+        cluster=None,
+        has_running_capacity: bool = None,
+        running_capacity: int = None,
+        has_running_login_nodes=None,
+        head_node_state: str = None,
+    ):
+        """
+        Create a snapshot of the given cluster.
+
+        :param has_running_login_nodes: True or False for all the login nodes pools, or a dict with the value of each
+        pool, in which case the overall value is True if any pool has running login nodes
+        """
+        self.cluster = cluster
+        self._facts = {}
+        self._all_pools_have_running_login_nodes = None
+        if has_running_capacity is not None:
+            self._facts["has_running_capacity"] = has_running_capacity
+        if running_capacity is not None:
+            self._facts["running_capacity"] = running_capacity
+        if isinstance(has_running_login_nodes, dict):
+            self._facts[("has_running_login_nodes", None)] = any(has_running_login_nodes.values())
+            for pool_name, value in has_running_login_nodes.items():
+                self._facts[("has_running_login_nodes", pool_name)] = value
+        else:
+            self._all_pools_have_running_login_nodes = has_running_login_nodes
+        if head_node_state is not None:
+            self._facts["head_node_state"] = head_node_state
+
+    def _get(self, fact, retrieve):
+        if fact not in self._facts:
+            if self.cluster is None:
+                raise ValueError(f"Unable to retrieve {fact} of the cluster, the snapshot has no cluster.")
+            self._facts[fact] = retrieve()
+        return self._facts[fact]
+
+    def has_running_capacity(self) -> bool:
+        """Return True if the compute fleet has running capacity."""
+        return self._get("has_running_capacity", lambda: self.cluster.has_running_capacity())
+
+    def get_running_capacity(self) -> int:
+        """Return the number of compute instances or the desired vCPUs of the compute environment."""
+        return self._get("running_capacity", lambda: self.cluster.get_running_capacity())
+
+    def has_running_login_nodes(self, pool_name: str = None) -> bool:
+        """Return True if the cluster has running login nodes, or the given pool if a pool name is provided."""
+        fact = ("has_running_login_nodes", pool_name)
+        if fact not in self._facts and self._all_pools_have_running_login_nodes is not None:
+            return self._all_pools_have_running_login_nodes
+        return self._get(fact, lambda: self.cluster.has_running_login_nodes(pool_name=pool_name))
+
+    def get_head_node_state(self) -> str:
+        """Return the state of the head node instance."""
+        return self._get("head_node_state", lambda: self.cluster.head_node_instance.state)
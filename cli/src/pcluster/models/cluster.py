@@ -16,7 +16,10 @@ import json
 import logging
 import os
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
@@ -40,11 +43,13 @@ from pcluster.constants import (
 )
 from pcluster.models.cluster_resources import (
     ClusterInstance,
+    ClusterInstanceIndex,
     ClusterStack,
     ExportClusterLogsFiltersParser,
     ListClusterLogsFiltersParser,
 )
 from pcluster.models.common import (
+    DEFAULT_LOGS_DOWNLOAD_CONCURRENCY,
     BadRequest,
     CloudWatchLogsExporter,
     Conflict,
@@ -56,6 +61,7 @@ from pcluster.models.common import (
     export_stack_events,
     parse_config,
     upload_archive,
+    validate_logs_archive_compression,
 )
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
 from pcluster.models.login_nodes_status import LoginNodesStatus
@@ -78,6 +84,11 @@ LOGGER = logging.getLogger(__name__)
 
 # pylint: disable=C0302
 
+TERMINATE_INSTANCES_BATCH_SIZE = 100
+TERMINATE_INSTANCES_CONCURRENCY = 10
+NODES_TERMINATION_WAIT_TIMEOUT = 30 * 60
+NODES_TERMINATION_POLL_INTERVAL = 15
+
 
 class NodeType(Enum):
     """Enum that identifies the cluster node type."""
@@ -172,7 +183,9 @@ class Cluster:
         self.__official_ami = None
         self.__has_running_capacity = None
         self.__running_capacity = None
-        self.__has_running_login_nodes = None
+        self.__has_running_login_nodes = {}
+        self.__instance_lookups = None
+        self.__instance_index = None
 
     @property
     def stack(self):
@@ -475,12 +488,19 @@ class Cluster:
             raise BadRequestClusterActionError(f"Cluster {self.name} already exists.")
 
     def _validate_and_parse_config(
-        self, validator_suppressors, validation_failure_level, config_text=None, context: ValidatorContext = None
+        self,
+        validator_suppressors,
+        validation_failure_level,
+        config_text=None,
+        context: ValidatorContext = None,
+        base_config: dict = None,
     ):
         """
         Perform syntactic and semantic validation and return parsed config.
 
         :param config_text: config to parse, self.source_config_text will be used if not specified.
+        :param base_config: source config of the running cluster. When specified, only the resources changed with
+                            respect to it are validated, if the changes allow it.
         """
         cluster_config_dict = parse_config(config_text or self.source_config_text)
 
@@ -493,7 +513,8 @@ class Cluster:
                 config.managed_head_node_security_group = self.stack.get_resource_physical_id("HeadNodeSecurityGroup")
                 config.managed_compute_security_group = self.stack.get_resource_physical_id("ComputeSecurityGroup")
 
-            validation_failures = config.validate(validator_suppressors, context)
+            changed_resources = self._get_changed_resources(base_config, config) if base_config else None
+            validation_failures = config.validate(validator_suppressors, context, changed_resources=changed_resources)
             if any(f.level.value >= FailureLevel(validation_failure_level).value for f in validation_failures):
                 raise ConfigValidationError("Invalid cluster configuration.", validation_failures=validation_failures)
             LOGGER.info("Validation succeeded.")
@@ -504,6 +525,16 @@ class Cluster:
 
         return config, validation_failures
 
+    def _get_changed_resources(self, base_config: dict, target_config: BaseClusterConfig):
+        """Return the resources to be validated incrementally, or None if the full config must be validated."""
+        patch = ConfigPatch(cluster=self, base_config=base_config, target_config=target_config.source_config)
+        changed_resources = target_config.get_changed_resources(patch.changes)
+        if changed_resources is None:
+            LOGGER.info("Changes affect the whole cluster configuration, performing full validation.")
+        else:
+            LOGGER.info("Performing incremental validation of %d changed resources.", len(changed_resources))
+        return changed_resources
+
     @staticmethod
     def _load_additional_instance_type_data(cluster_config_dict):
         if "DevSettings" in cluster_config_dict:
@@ -681,22 +712,60 @@ class Cluster:
             raise _cluster_error_mapper(e, f"Unable to retrieve template for stack {self.stack_name}. {e}")
 
     def terminate_nodes(self):
-        """Terminate all compute nodes of a cluster."""
+        """
+        Terminate all compute nodes of a cluster.
+
+        Instances are terminated in batches of TERMINATE_INSTANCES_BATCH_SIZE, executed concurrently. Throttled batches
+        are retried by the rate limiter of the EC2 client, and all the batches are executed even if one of them fails.
+        """
         try:
             LOGGER.info("\nChecking if there are running compute nodes that require termination...")
             filters = self._get_instance_filters(node_type=NodeType.COMPUTE)
-            instances = AWSApi.instance().ec2.list_instance_ids(filters)
-
-            for instance_ids in grouper(instances, 100):
-                LOGGER.info("Terminating following instances: %s", instance_ids)
-                if instance_ids:
-                    AWSApi.instance().ec2.terminate_instances(instance_ids)
+            ec2_client = AWSApi.instance().ec2
+            instances = ec2_client.list_instance_ids(filters)
+
+            batches = list(grouper(instances, TERMINATE_INSTANCES_BATCH_SIZE))
+            progress = _NodesTerminationProgress(len(instances))
+            with ThreadPoolExecutor(
+                max_workers=TERMINATE_INSTANCES_CONCURRENCY, thread_name_prefix="terminate-nodes"
+            ) as executor:
+                futures = [
+                    executor.submit(_terminate_instances_batch, ec2_client, instance_ids, progress)
+                    for instance_ids in batches
+                ]
+            errors = [future.exception() for future in futures if future.exception()]
+            if errors:
+                raise errors[0]
 
             LOGGER.info("Compute fleet cleaned up.")
         except Exception as e:
             LOGGER.error("Failed when checking for running EC2 instances with error: %s", str(e))
             raise _cluster_error_mapper(e, f"Unable to delete running EC2 instances with error: {e}")
 
+    def wait_nodes_termination(
+        self, timeout: int = NODES_TERMINATION_WAIT_TIMEOUT, poll_interval: int = NODES_TERMINATION_POLL_INTERVAL
+    ):
+        """Wait until all the compute nodes of the cluster are terminated, i.e. none of them is shutting down."""
+        filters = self._get_instance_filters(
+            node_type=NodeType.COMPUTE,
+            instance_states=["pending", "running", "shutting-down", "stopping", "stopped"],
+        )
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                instances = AWSApi.instance().ec2.list_instance_ids(filters)
+            except AWSClientError as e:
+                raise _cluster_error_mapper(e, f"Unable to retrieve the compute nodes of cluster {self.name}. {e}")
+            if not instances:
+                LOGGER.info("All compute nodes have been terminated.")
+                return
+            if time.monotonic() >= deadline:
+                raise ClusterActionError(
+                    f"Timed out waiting for the termination of {len(instances)} compute nodes after {timeout} seconds."
+                )
+            LOGGER.info("Waiting for the termination of %d compute nodes...", len(instances))
+            time.sleep(poll_interval)
+
     @property
     def compute_instances(self) -> List[ClusterInstance]:
         """Get compute instances."""
@@ -721,10 +790,13 @@ class Cluster:
         else:
             raise ClusterActionError("Unable to retrieve login node information.")
 
-    def _get_instance_filters(self, node_type: NodeType, queue_name: str = None):
+    def _get_instance_filters(self, node_type: NodeType, queue_name: str = None, instance_states: List[str] = None):
         filters = [
             {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": [self.stack_name]},
-            {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+            {
+                "Name": "instance-state-name",
+                "Values": instance_states or ["pending", "running", "stopping", "stopped"],
+            },
         ]
         if node_type:
             filters.append({"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": [node_type.value]})
@@ -732,10 +804,63 @@ class Cluster:
             filters.append({"Name": f"tag:{PCLUSTER_QUEUE_NAME_TAG}", "Values": [queue_name]})
         return filters
 
+    @contextmanager
+    def indexed_instances(self):
+        """
+        Serve the repeated instance lookups of the enclosed operation without asking EC2 again.
+
+        Lookups are memoized for the duration of the operation, e.g. the update retrieves the head node for the
+        validators and again for the update policies. When instances of a second node type are looked up, the first
+        page of the unfiltered listing is retrieved: if it contains all the instances of the cluster, the following
+        lookups are served from a ClusterInstanceIndex built from it. Larger clusters are never listed entirely and
+        keep filtering on the EC2 side, so that results are the same as outside of the operation.
+        Only the update is indexed: the other operations look up the instances of a single node type.
+        """
+        self.__instance_lookups = {}
+        try:
+            yield
+        finally:
+            self.__instance_lookups = None
+            self.__instance_index = None
+
+    def _build_instance_index(self):
+        """Return the index of the cluster instances, or False if they do not fit in a single listing page."""
+        try:
+            instances, next_token = AWSApi.instance().ec2.describe_instances(self._get_instance_filters(node_type=None))
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
+        if next_token:
+            LOGGER.debug("Cluster instances do not fit in a single page, not indexing them")
+            return False
+        return ClusterInstanceIndex([ClusterInstance(instance) for instance in instances])
+
     def describe_instances(
         self, node_type: NodeType = None, next_token: str = None, queue_name: str = None
     ) -> Tuple[List[ClusterInstance], str]:
         """Return the cluster instances filtered by node type."""
+        if self.__instance_lookups is None:
+            return self._describe_instances(node_type, next_token, queue_name)
+
+        lookup_key = (node_type, queue_name, next_token)
+        if lookup_key not in self.__instance_lookups:
+            looked_up_node_types = {key[0] for key in self.__instance_lookups}
+            if self.__instance_index is None and looked_up_node_types - {node_type}:
+                self.__instance_index = self._build_instance_index()
+            if self.__instance_index and not next_token:
+                self.__instance_lookups[lookup_key] = (
+                    self.__instance_index.get_instances(
+                        node_type=node_type.value if node_type else None, queue_name=queue_name
+                    ),
+                    None,
+                )
+            else:
+                self.__instance_lookups[lookup_key] = self._describe_instances(node_type, next_token, queue_name)
+        instances, token = self.__instance_lookups[lookup_key]
+        return list(instances), token
+
+    def _describe_instances(
+        self, node_type: NodeType = None, next_token: str = None, queue_name: str = None
+    ) -> Tuple[List[ClusterInstance], str]:
         try:
             filters = self._get_instance_filters(node_type, queue_name)
             instances, token = AWSApi.instance().ec2.describe_instances(filters, next_token)
@@ -760,14 +885,14 @@ class Cluster:
 
         Note: the value will be cached.
         """
-        healthy_nodes = self.login_nodes_status.get_healthy_nodes(pool_name=pool_name)
-        unhealthy_nodes = self.login_nodes_status.get_unhealthy_nodes(pool_name=pool_name)
-
-        if self.__has_running_login_nodes is None or updated_value:
-            self.__has_running_login_nodes = (
+        if pool_name not in self.__has_running_login_nodes or updated_value:
+            login_nodes_status = self.login_nodes_status
+            healthy_nodes = login_nodes_status.get_healthy_nodes(pool_name=pool_name)
+            unhealthy_nodes = login_nodes_status.get_unhealthy_nodes(pool_name=pool_name)
+            self.__has_running_login_nodes[pool_name] = (
                 healthy_nodes is not None and unhealthy_nodes is not None and healthy_nodes + unhealthy_nodes != 0
             )
-        return self.__has_running_login_nodes
+        return self.__has_running_login_nodes[pool_name]
 
     def get_running_capacity(self, updated_value: bool = False):
         """Return the number of instances or desired capacity. Note: the value will be cached."""
@@ -864,16 +989,25 @@ class Cluster:
         validation_failure_level: FailureLevel = FailureLevel.ERROR,
         force: bool = False,
     ):
-        """Validate a cluster update request."""
+        """
+        Validate a cluster update request.
+
+        When the PCLUSTER_VALIDATION_INCREMENTAL environment variable is set to true, only the validators of the
+        resources changed by the update, and of the ones containing them, are executed.
+        """
         self._validate_cluster_exists()
         self._validate_stack_status_not_in_progress()
-        target_config, ignored_validation_failures = self._validate_and_parse_config(
-            validator_suppressors=validator_suppressors,
-            validation_failure_level=validation_failure_level,
-            config_text=target_source_config,
-            context=ValidatorContext(head_node_instance_id=self.head_node_instance.id, during_update=True),
-        )
-        changes = self._validate_patch(force, target_config)
+        incremental_validation = os.environ.get("PCLUSTER_VALIDATION_INCREMENTAL", "false").lower() == "true"
+        # The head node looked up by the validators and by the update policies is retrieved once
+        with self.indexed_instances():
+            target_config, ignored_validation_failures = self._validate_and_parse_config(
+                validator_suppressors=validator_suppressors,
+                validation_failure_level=validation_failure_level,
+                config_text=target_source_config,
+                context=ValidatorContext(head_node_instance_id=self.head_node_instance.id, during_update=True),
+                base_config=self.config.source_config if incremental_validation else None,
+            )
+            changes = self._validate_patch(force, target_config)
 
         return target_config, changes, ignored_validation_failures
 
@@ -996,6 +1130,8 @@ class Cluster:
         end_time: datetime = None,
         filters: List[str] = None,
         output_file: str = None,
+        download_concurrency: int = DEFAULT_LOGS_DOWNLOAD_CONCURRENCY,
+        compression: str = "gzip",
     ):
         """
         Export cluster's logs in the given output path, by using given bucket as a temporary folder.
@@ -1009,7 +1145,10 @@ class Cluster:
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param filters: Filters in the format ["Name=name,Values=value1,value2"]
                Accepted filters are: private_dns_name, node_type==HeadNode
+        :param download_concurrency: Maximum number of log streams downloaded concurrently from the bucket
+        :param compression: Compression of the logs archive, gzip or zstd
         """
+        validate_logs_archive_compression(compression)
         # check stack
         if not AWSApi.instance().cfn.stack_exists(self.stack_name):
             raise NotFoundClusterActionError(f"Cluster {self.name} does not exist.")
@@ -1031,6 +1170,7 @@ class Cluster:
                         output_dir=root_archive_dir,
                         bucket_prefix=bucket_prefix,
                         keep_s3_objects=keep_s3_objects,
+                        download_concurrency=download_concurrency,
                     )
                     logs_exporter.execute(
                         log_stream_prefix=export_logs_filters.log_stream_prefix,
@@ -1047,11 +1187,12 @@ class Cluster:
                 stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
                 export_stack_events(self.stack_name, stack_events_file)
 
-                archive_path = create_logs_archive(root_archive_dir, output_file)
                 if output_file:
+                    create_logs_archive(root_archive_dir, output_file, compression)
                     return output_file
                 else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
+                    # The archive is uploaded while it is being created, without storing it on disk
+                    s3_path = upload_archive(bucket, bucket_prefix, root_archive_dir, compression)
                     return create_s3_presigned_url(s3_path)
         except Exception as e:
             raise ClusterActionError(f"Unexpected error when exporting cluster's logs: {e}")
@@ -1183,3 +1324,31 @@ class Cluster:
     def _stack_events_stream_name(self):
         """Return the name of the stack events log stream."""
         return STACK_EVENTS_LOG_STREAM_NAME_FORMAT.format(self.stack_name)
+
+
+class _NodesTerminationProgress:
+    """Thread-safe progress of the termination of the compute nodes, logged at every terminated batch."""
+
+    def __init__(self, total_instances: int):
+        self._lock = threading.Lock()
+        self.total_instances = total_instances
+        self.terminated_instances = 0
+        self._start_time = time.monotonic()
+
+    def update(self, instance_ids):
+        """Record the termination of the given instances."""
+        with self._lock:
+            self.terminated_instances += len(instance_ids)
+            LOGGER.info(
+                "Requested termination of %d/%d compute nodes in %.1f seconds: %s",
+                self.terminated_instances,
+                self.total_instances,
+                time.monotonic() - self._start_time,
+                instance_ids,
+            )
+
+
+def _terminate_instances_batch(ec2_client, instance_ids, progress: _NodesTerminationProgress):
+    """Terminate the given instances, the throttled requests are retried by the rate limiter of the EC2 client."""
+    ec2_client.terminate_instances(instance_ids)
+    progress.update(instance_ids)
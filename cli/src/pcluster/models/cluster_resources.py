@@ -11,12 +11,19 @@
 import datetime
 import itertools
 import re
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import List
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceInfo, StackInfo
-from pcluster.constants import CW_LOGS_CFN_PARAM_NAME, OS_MAPPING, PCLUSTER_NODE_TYPE_TAG, PCLUSTER_VERSION_TAG
+from pcluster.constants import (
+    CW_LOGS_CFN_PARAM_NAME,
+    OS_MAPPING,
+    PCLUSTER_CLUSTER_NAME_TAG,
+    PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_VERSION_TAG,
+)
 from pcluster.models.common import FiltersParserError, LogGroupTimeFiltersParser, get_all_stack_events
 
 
@@ -210,10 +217,45 @@ class ClusterInstance(InstanceInfo):
         """Return os of the instance."""
         return self._get_tag(PCLUSTER_NODE_TYPE_TAG)
 
+    @property
+    def cluster_name(self) -> str:
+        """Return the name of the cluster the instance belongs to."""
+        return self._get_tag(PCLUSTER_CLUSTER_NAME_TAG)
+
     def _get_tag(self, tag_key: str):
         return next(iter([tag["Value"] for tag in self._tags if tag["Key"] == tag_key]), None)
 
 
+class ClusterInstanceIndex:
+    """
+    Instances of a cluster retrieved with a single listing, indexed by node type and queue.
+
+    Node type and queue are read once from the instance tags when the index is built.
+    """
+
+    def __init__(self, instances: List[ClusterInstance]):
+        self._instances = instances
+        self._indexes = {name: defaultdict(list) for name in ("node_type", "queue_name")}
+        for instance in instances:
+            for name, index in self._indexes.items():
+                index[getattr(instance, name)].append(instance)
+
+    def __len__(self):
+        return len(self._instances)
+
+    def get_instances(self, node_type: str = None, queue_name: str = None) -> List[ClusterInstance]:
+        """Return the instances matching all the given criteria, in listing order."""
+        criteria = {"node_type": node_type, "queue_name": queue_name}
+        matches = None
+        for name, value in criteria.items():
+            if value is not None:
+                indexed_instances = {id(instance) for instance in self._indexes[name].get(value, [])}
+                matches = indexed_instances if matches is None else matches & indexed_instances
+        if matches is None:
+            return list(self._instances)
+        return [instance for instance in self._instances if id(instance) in matches]
+
+
 class ClusterLogsFiltersParser:
     """Class to parse filters."""
 
@@ -14,8 +14,11 @@ import json
 import logging
 import os
 import os.path
+import shutil
 import tarfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 
 import configparser
@@ -27,6 +30,11 @@ from pcluster.utils import datetime_to_epoch, to_utc_datetime, yaml_load
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_LOGS_DOWNLOAD_CONCURRENCY = 10
+# Extension of the logs archive by supported compression
+LOGS_ARCHIVE_EXTENSIONS = {"gzip": "tar.gz", "zstd": "tar.zst"}
+LOGS_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class LimitExceeded(Exception):
     """Base exception type for errors caused by exceeding the limit of some underlying AWS service."""
@@ -134,10 +142,45 @@ class LogsExporterError(Exception):
         super().__init__(message)
 
 
+class _LogsDownloadProgress:
+    """Thread-safe progress of the download of the exported log streams, logged every 10% of the streams."""
+
+    def __init__(self, total_streams: int):
+        self._lock = threading.Lock()
+        self.total_streams = total_streams
+        self.downloaded_streams = 0
+        self.downloaded_bytes = 0
+        self._start_time = time.monotonic()
+
+    def update(self, stream_size: int):
+        """Record a downloaded log stream of the given decompressed size."""
+        with self._lock:
+            self.downloaded_streams += 1
+            self.downloaded_bytes += stream_size
+            step = max(self.total_streams // 10, 1)
+            if self.downloaded_streams % step == 0 or self.downloaded_streams == self.total_streams:
+                LOGGER.info(
+                    "Downloaded %d/%d log streams (%.1f MB) in %.1f seconds",
+                    self.downloaded_streams,
+                    self.total_streams,
+                    self.downloaded_bytes / (1024 * 1024),
+                    time.monotonic() - self._start_time,
+                )
+
+
 class CloudWatchLogsExporter:
     """Utility class used to export log group logs."""
 
-    def __init__(self, resource_id, log_group_name, bucket, output_dir, bucket_prefix=None, keep_s3_objects=False):
+    def __init__(
+        self,
+        resource_id,
+        log_group_name,
+        bucket,
+        output_dir,
+        bucket_prefix=None,
+        keep_s3_objects=False,
+        download_concurrency=DEFAULT_LOGS_DOWNLOAD_CONCURRENCY,
+    ):
         # check bucket
         bucket_region = AWSApi.instance().s3.get_bucket_region(bucket_name=bucket)
         if bucket_region != get_region():
@@ -149,6 +192,7 @@ class CloudWatchLogsExporter:
         self.log_group_name = log_group_name
         self.output_dir = output_dir
         self.keep_s3_objects = keep_s3_objects
+        self.download_concurrency = download_concurrency
 
         if bucket_prefix:
             self.bucket_prefix = bucket_prefix
@@ -222,27 +266,48 @@ class CloudWatchLogsExporter:
         return status
 
     def _download_s3_objects_with_prefix(self, task_id, destdir):
-        """Download all object in bucket with given prefix into destdir."""
+        """
+        Download all object in bucket with given prefix into destdir.
+
+        Log streams are downloaded concurrently by a bounded pool of workers, each object is decompressed while
+        it is downloaded and written straight to the destination file.
+        """
         prefix = f"{self.bucket_prefix}/{task_id}"
         LOGGER.debug("Downloading exported logs from s3 bucket %s (under key %s) to %s", self.bucket, prefix, destdir)
+        # Large log streams are exported as multiple sequential objects, which are appended to the same file
+        objects_by_path = {}
         for archive_object in AWSApi.instance().s3_resource.get_objects(bucket_name=self.bucket, prefix=prefix):
             decompressed_path = os.path.dirname(os.path.join(destdir, archive_object.key))
             decompressed_path = decompressed_path.replace(
                 r"{unwanted_path_segment}{sep}".format(unwanted_path_segment=prefix, sep=os.path.sep), ""
             )
-            compressed_path = f"{decompressed_path}.gz"
+            objects_by_path.setdefault(decompressed_path, []).append(archive_object.key)
 
-            LOGGER.debug("Downloading object with key=%s to %s", archive_object.key, compressed_path)
-            os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
-            AWSApi.instance().s3_resource.download_file(
-                bucket_name=self.bucket, key=archive_object.key, output=compressed_path
-            )
+        progress = _LogsDownloadProgress(len(objects_by_path))
+        # boto3 clients are thread safe, share the same client across the workers
+        s3_client = AWSApi.instance().s3
+        executor = ThreadPoolExecutor(max_workers=self.download_concurrency, thread_name_prefix="logs-download")
+        try:
+            futures = [
+                executor.submit(self._download_log_stream, s3_client, sorted(keys), decompressed_path, progress)
+                for decompressed_path, keys in objects_by_path.items()
+            ]
+            for future in as_completed(futures):
+                future.result()
+        finally:
+            # Do not start the download of the remaining log streams if one failed
+            executor.shutdown(wait=True, cancel_futures=True)
 
-            # Create a decompressed copy of the downloaded archive and remove the original
-            LOGGER.debug("Extracting object at %s to %s", compressed_path, decompressed_path)
-            with gzip.open(compressed_path) as gfile, open(decompressed_path, "wb") as outfile:
-                outfile.write(gfile.read())
-            os.remove(compressed_path)
+    def _download_log_stream(self, s3_client, keys: List[str], decompressed_path: str, progress: _LogsDownloadProgress):
+        """Download and decompress the given objects of a log stream into decompressed_path."""
+        os.makedirs(os.path.dirname(decompressed_path), exist_ok=True)
+        with open(decompressed_path, "wb") as outfile:
+            for key in keys:
+                LOGGER.debug("Downloading and extracting object with key=%s to %s", key, decompressed_path)
+                body = s3_client.get_object(bucket_name=self.bucket, key=key)["Body"]
+                with gzip.GzipFile(fileobj=body) as gfile:
+                    shutil.copyfileobj(gfile, outfile, LOGS_DOWNLOAD_CHUNK_SIZE)
+            progress.update(outfile.tell())
 
 
 def get_all_stack_events(stack_name: str):
@@ -264,22 +329,117 @@ def export_stack_events(stack_name: str, output_file: str):
         cfn_events_file.write(json.dumps(stack_events, cls=JSONEncoder, indent=2))
 
 
-def create_logs_archive(directory: str, output_file: str = None):
-    base_directory = os.path.dirname(directory)
-    base_name = os.path.basename(directory)
-    output_file = output_file or f"{os.path.join(base_directory, base_name)}.tar.gz"
+def validate_logs_archive_compression(compression: str):
+    """Verify that the given compression of the logs archive is supported."""
+    if compression not in LOGS_ARCHIVE_EXTENSIONS:
+        raise BadRequest(f"Unsupported compression {compression}, supported values are: gzip, zstd.")
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: F401 pylint: disable=C0415,W0611
+        except ImportError:
+            raise BadRequest(
+                "The zstd compression requires the zstandard Python package. "
+                "Install it with 'pip install aws-parallelcluster[zstd]' or use the gzip compression."
+            )
+
+
+def _open_compressed_stream(fileobj, compression: str):
+    """Return a writable stream compressing the data written to it into the given file object."""
+    if compression == "zstd":
+        import zstandard  # pylint: disable=C0415
+
+        return zstandard.ZstdCompressor().stream_writer(fileobj, closefd=False)
+    return gzip.GzipFile(fileobj=fileobj, mode="wb")
+
+
+def _write_logs_archive(directory: str, fileobj, compression: str):
+    """Write the compressed tar archive of the given directory to the given file object."""
+    # The tar stream mode never seeks, so the archive can be written to a pipe
+    with _open_compressed_stream(fileobj, compression) as compressed_stream, tarfile.open(
+        fileobj=compressed_stream, mode="w|"
+    ) as tar:
+        tar.add(directory, arcname=os.path.basename(directory))
+
+
+def get_logs_archive_name(directory: str, compression: str = "gzip"):
+    """Return the name of the archive of the given logs directory."""
+    return f"{os.path.basename(directory)}.{LOGS_ARCHIVE_EXTENSIONS[compression]}"
+
+
+def create_logs_archive(directory: str, output_file: str = None, compression: str = "gzip"):
+    validate_logs_archive_compression(compression)
+    output_file = output_file or os.path.join(os.path.dirname(directory), get_logs_archive_name(directory, compression))
     LOGGER.debug("Creating archive of logs and saving it to %s", output_file)
-    with tarfile.open(output_file, "w:gz") as tar:
-        tar.add(directory, arcname=base_name)
+    with open(output_file, "wb") as archive_file:
+        _write_logs_archive(directory, archive_file, compression)
     return output_file
 
 
-def upload_archive(bucket: str, bucket_prefix: str, archive_path: str):
-    archive_filename = os.path.basename(archive_path)
-    with open(archive_path, "rb") as archive_file:
-        archive_data = archive_file.read()
+class _LogsArchiveStream:
+    """
+    Readable stream of the archive of a logs directory.
+
+    The archive is written to a pipe by a background thread while it is read, so that it never needs to be stored
+    on disk or in memory as a whole.
+    """
+
+    def __init__(self, directory: str, compression: str):
+        read_fd, write_fd = os.pipe()
+        self._reader = open(read_fd, "rb")  # pylint: disable=consider-using-with
+        self._writer = open(write_fd, "wb")  # pylint: disable=consider-using-with
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._write, args=(directory, compression), name="logs-archive", daemon=True
+        )
+        self._thread.start()
+
+    def _write(self, directory: str, compression: str):
+        try:
+            _write_logs_archive(directory, self._writer, compression)
+        except Exception as e:
+            self._error = e
+        finally:
+            try:
+                self._writer.close()
+            except OSError:
+                # The reader has been closed before reading the whole archive
+                pass
+
+    def read(self, size: int = -1):
+        """Read up to size bytes of the archive, raise the archive creation error, if any, at the end of the stream."""
+        data = self._reader.read(size)
+        if not data and self._error:
+            raise self._error
+        return data
+
+    def close(self):
+        """Close the stream, interrupting the archive creation if not completed."""
+        self._reader.close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        # Fail if the archive creation failed, unless the reader already failed for another reason
+        if exc_type is None and self._error:
+            raise self._error
+
+
+def upload_archive(bucket: str, bucket_prefix: str, directory: str, compression: str = "gzip"):
+    """
+    Upload the archive of the given logs directory to the bucket, while it is being created.
+
+    The archive is streamed to an S3 multipart upload, so memory usage is bounded by the size of the upload parts
+    regardless of the size of the logs.
+    """
+    validate_logs_archive_compression(compression)
+    archive_filename = get_logs_archive_name(directory, compression)
     bucket_path = f"{bucket_prefix}/{archive_filename}" if bucket_prefix else archive_filename
-    AWSApi.instance().s3.put_object(bucket, archive_data, bucket_path)
+    LOGGER.debug("Uploading archive of logs to s3://%s/%s", bucket, bucket_path)
+    with _LogsArchiveStream(directory, compression) as archive_stream:
+        AWSApi.instance().s3.upload_fileobj(bucket, archive_stream, bucket_path)
     return f"s3://{bucket}/{bucket_path}"
 
 
@@ -143,6 +143,51 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         """Get compute fleet status and the last compute fleet status updated time."""
         pass
 
+    @property
+    @abstractmethod
+    def _item_key(self):
+        """Key of the compute fleet status item in the DB table."""
+        pass
+
+    @abstractmethod
+    def _parse_item(self, item):
+        """Return compute fleet status and last updated time from the DB item."""
+        pass
+
+    @staticmethod
+    def get_status_with_last_updated_time_by_cluster(
+        cluster_versions, status_fallback=ComputeFleetStatus.UNKNOWN, last_updated_time_fallback=None
+    ):
+        """
+        Get compute fleet status and last updated time of multiple clusters, given as a dict of name and version.
+
+        The items of all the clusters are retrieved with DynamoDB BatchGetItem requests.
+        """
+        managers = {
+            cluster_name: ComputeFleetStatusManager.get_manager(cluster_name, version)
+            for cluster_name, version in cluster_versions.items()
+        }
+        try:
+            items = AWSApi.instance().ddb_resource.batch_get_items(
+                {manager._table_name: [manager._item_key] for manager in managers.values()}
+            )
+        except AWSClientError as e:
+            # BatchGetItem fails when any of the tables does not exist, e.g. while a cluster is being deleted
+            LOGGER.warning("Failed when retrieving fleet status from DynamoDB in batch with error %s", e)
+            return {
+                cluster_name: manager.get_status_with_last_updated_time(status_fallback, last_updated_time_fallback)
+                for cluster_name, manager in managers.items()
+            }
+
+        statuses = {}
+        for cluster_name, manager in managers.items():
+            try:
+                statuses[cluster_name] = manager._parse_item(items[manager._table_name][0])
+            except Exception as e:
+                LOGGER.warning("Failed when parsing fleet status of cluster %s with error %s", cluster_name, e)
+                statuses[cluster_name] = status_fallback, last_updated_time_fallback
+        return statuses
+
     @staticmethod
     def get_manager(cluster_name, version):
         """Return compute fleet status manager based on version and plugin."""
@@ -180,20 +225,25 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     def __init__(self, cluster_name):
         super().__init__(PCLUSTER_DYNAMODB_PREFIX + cluster_name)
 
+    @property
+    def _item_key(self):
+        return {"Id": self.DB_KEY}
+
+    def _parse_item(self, item):
+        return (
+            ComputeFleetStatus(item.get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)),
+            item.get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
+        )
+
     def get_status_with_last_updated_time(
         self, status_fallback=ComputeFleetStatus.UNKNOWN, last_updated_time_fallback=None
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, {"Id": self.DB_KEY})
+            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, self._item_key)
             if not compute_fleet_item or "Item" not in compute_fleet_item:
                 raise Exception("COMPUTE_FLEET data not found in db table")
-            return (
-                ComputeFleetStatus(
-                    compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)
-                ),
-                compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            return self._parse_item(compute_fleet_item["Item"])
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -243,20 +293,22 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
     def __init__(self, cluster_name):
         super().__init__(PCLUSTER_DYNAMODB_PREFIX + cluster_name)
 
+    @property
+    def _item_key(self):
+        return {"Id": self.COMPUTE_FLEET_STATUS_KEY}
+
+    def _parse_item(self, item):
+        return ComputeFleetStatus(item[self.COMPUTE_FLEET_STATUS_ATTRIBUTE]), item.get(self.LAST_UPDATED_TIME_ATTRIBUTE)
+
     def get_status_with_last_updated_time(
         self, status_fallback=ComputeFleetStatus.UNKNOWN, last_updated_time_fallback=None
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(
-                self._table_name, {"Id": self.COMPUTE_FLEET_STATUS_KEY}
-            )
+            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(self._table_name, self._item_key)
             if not compute_fleet_status or "Item" not in compute_fleet_status:
                 raise Exception("COMPUTE_FLEET status not found in db table")
-            return (
-                ComputeFleetStatus(compute_fleet_status["Item"][self.COMPUTE_FLEET_STATUS_ATTRIBUTE]),
-                compute_fleet_status["Item"].get(self.LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            return self._parse_item(compute_fleet_status["Item"])
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
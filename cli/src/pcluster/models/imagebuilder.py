@@ -62,6 +62,7 @@ from pcluster.models.common import (
     export_stack_events,
     parse_config,
     upload_archive,
+    validate_logs_archive_compression,
 )
 from pcluster.models.imagebuilder_resources import (
     BadRequestStackError,
@@ -678,6 +679,7 @@ class ImageBuilder:
         start_time: datetime = None,
         end_time: datetime = None,
         output_file: str = None,
+        compression: str = "gzip",
     ):
         """
         Export image builder's logs in the given output path, by using given bucket as a temporary folder.
@@ -688,7 +690,9 @@ class ImageBuilder:
         :param keep_s3_objects: Keep the exported objects exports to S3. The default behavior is to delete them
         :param start_time: Start time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
+        :param compression: Compression of the logs archive, gzip or zstd
         """
+        validate_logs_archive_compression(compression)
         # check stack
         stack_exists = self._stack_exists()
         if not stack_exists:
@@ -724,11 +728,12 @@ class ImageBuilder:
                     # Get stack events and write them into a file
                     stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
                     export_stack_events(self.stack.name, stack_events_file)
-                archive_path = create_logs_archive(root_archive_dir, output_file)
                 if output_file:
+                    create_logs_archive(root_archive_dir, output_file, compression)
                     return output_file
                 else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
+                    # The archive is uploaded while it is being created, without storing it on disk
+                    s3_path = upload_archive(bucket, bucket_prefix, root_archive_dir, compression)
                     return create_s3_presigned_url(s3_path)
         except Exception as e:
             raise ImageBuilderActionError(f"Unexpected error when exporting image's logs: {e}")
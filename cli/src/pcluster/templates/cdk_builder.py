@@ -14,11 +14,13 @@
 import logging
 import os
 import tempfile
+from datetime import datetime
 
 from pcluster.config.cluster_config import BaseClusterConfig
 from pcluster.config.imagebuilder_config import ImageBuilderConfig
-from pcluster.models.s3_bucket import S3Bucket
-from pcluster.utils import load_yaml_dict
+from pcluster.models.s3_bucket import S3Bucket, S3FileFormat
+from pcluster.templates.cdk_template_cache import CDKTemplateCache
+from pcluster.utils import generate_cluster_log_group_name, load_yaml_dict
 
 LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +33,19 @@ class CDKTemplateBuilder:
         cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str, log_group_name: str = None
     ):
         """Build template for the given cluster and return as output in Yaml format."""
+        template_cache = None
+        # AWS Batch stacks embed additional creation timestamps, only Slurm templates are cached
+        if CDKTemplateCache.is_enabled() and cluster_config.scheduling.scheduler == "slurm":
+            template_cache = CDKTemplateCache()
+            cache_key = template_cache.get_key(cluster_config, bucket, stack_name)
+            cached_template = template_cache.get(
+                cache_key, CDKTemplateBuilder._get_volatile_values(cluster_config, bucket, stack_name, log_group_name)
+            )
+            if cached_template:
+                LOGGER.info("Using cached CDK template %s", cache_key)
+                generated_template, cached_assets = cached_template
+                return generated_template, CDKTemplateBuilder._upload_cached_assets(cached_assets, bucket)
+
         LOGGER.info("Importing CDK...")
         from aws_cdk.core import App  # pylint: disable=C0415
 
@@ -43,7 +58,7 @@ class CDKTemplateBuilder:
         with tempfile.TemporaryDirectory() as cloud_assembly_dir:
             output_file = str(stack_name)
             app = App(outdir=str(cloud_assembly_dir))
-            ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name)
+            cluster_stack = ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name)
 
             cloud_assembly = app.synth()
             LOGGER.info("CDK template generation completed successfully")
@@ -52,8 +67,61 @@ class CDKTemplateBuilder:
             assets_metadata = cdk_artifacts_manager.upload_assets(bucket=bucket)
             generated_template = cdk_artifacts_manager.get_template_body()
 
+            if template_cache:
+                asset_ids = [asset.id for asset in cdk_artifacts_manager.cluster_cdk_assembly.get_assets()]
+                template_cache.put(
+                    cache_key,
+                    stack_name,
+                    generated_template,
+                    [{"id": asset_id, "metadata": metadata} for asset_id, metadata in zip(asset_ids, assets_metadata)],
+                    CDKTemplateBuilder._get_volatile_values(
+                        cluster_config,
+                        bucket,
+                        stack_name,
+                        getattr(cluster_stack, "log_group_name", None),
+                        cluster_stack.timestamp,
+                    ),
+                )
+
         return generated_template, assets_metadata
 
+    @staticmethod
+    def _get_volatile_values(
+        cluster_config: BaseClusterConfig,
+        bucket: S3Bucket,
+        stack_name: str,
+        log_group_name: str = None,
+        timestamp: str = None,
+    ):
+        """
+        Return the values embedded in the cluster template that change at every request.
+
+        When not given, the timestamp and the log group name are generated as the cluster stack would do.
+        """
+        now = datetime.utcnow()
+        if not log_group_name and cluster_config.is_cw_logging_enabled:
+            log_group_name = generate_cluster_log_group_name(stack_name, now)
+        return {
+            "ArtifactDirectory": bucket.artifact_directory,
+            "ConfigVersion": cluster_config.config_version,
+            "OriginalConfigVersion": cluster_config.original_config_version,
+            "InstanceTypesDataVersion": cluster_config.instance_types_data_version,
+            "Timestamp": timestamp or now.strftime("%Y%m%d%H%M%S"),
+            "LogGroupName": log_group_name,
+        }
+
+    @staticmethod
+    def _upload_cached_assets(cached_assets, bucket: S3Bucket):
+        """Upload the assets of a cached template to the cluster artifacts S3 Bucket and return their metadata."""
+        for asset in cached_assets:
+            LOGGER.info("Uploading cached asset %s to S3", asset["id"])
+            bucket.upload_cfn_asset(
+                asset_file_content=asset["metadata"]["content"],
+                asset_name=asset["id"],
+                format=S3FileFormat.MINIFIED_JSON,
+            )
+        return [asset["metadata"] for asset in cached_assets]
+
     @staticmethod
     def build_imagebuilder_template(image_config: ImageBuilderConfig, image_id: str, bucket: S3Bucket):
         """Build template for the given imagebuilder and return as output in Yaml format."""
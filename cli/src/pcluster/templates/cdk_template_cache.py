@@ -0,0 +1,272 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the on-disk cache of the cluster templates synthesized by CDK.
+#
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from copy import deepcopy
+from typing import Dict, List, Optional, Tuple
+
+from pcluster.aws.common import get_region
+from pcluster.config.cluster_config import BaseClusterConfig
+from pcluster.models.s3_bucket import S3Bucket
+from pcluster.schemas.cluster_schema import ClusterSchema
+from pcluster.utils import get_installed_version, get_partition
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATE_CACHE_PATH = os.path.expanduser(os.path.join("~", ".parallelcluster", "cache", "templates"))
+DEFAULT_TEMPLATE_CACHE_TTL = 24 * 60 * 60
+TEMPLATE_CACHE_MAX_ENTRIES = 50
+TEMPLATE_CACHE_ENTRY_SUFFIX = ".json"
+VOLATILE_VALUE_PLACEHOLDER = "{{{{PclusterTemplateCache:{name}}}}}"
+VOLATILE_VALUE_MIN_LENGTH = 8
+
+
+class CDKTemplateCache:
+    """
+    Content-addressed cache of the cluster templates and assets generated by the CDK synthesis.
+
+    The cache key is the hash of everything the synthesis depends on: the cluster configuration together with the
+    attributes resolved at runtime (official AMI, managed security groups, instance types data), the stack name,
+    the artifacts bucket, the region and the ParallelCluster version.
+    Values that change at every create or update request without changing the synthesized resources, i.e. the
+    artifact directory, the versions of the uploaded config files, the wait condition timestamp and the log group
+    name, are replaced by placeholders when storing an entry and substituted back with the current values on a hit.
+
+    The cache is enabled by setting the PCLUSTER_TEMPLATE_CACHE_ENABLED environment variable to true.
+    Entries are stored as JSON files in the directory pointed by PCLUSTER_TEMPLATE_CACHE_PATH and expire after
+    PCLUSTER_TEMPLATE_CACHE_TTL seconds, since the synthesis also depends on resources looked up in the account
+    (e.g. subnets availability zones and hosted zones).
+    """
+
+    def __init__(self, cache_dir: str = None, ttl: int = None, max_entries: int = TEMPLATE_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir or os.environ.get("PCLUSTER_TEMPLATE_CACHE_PATH", DEFAULT_TEMPLATE_CACHE_PATH)
+        self.ttl = (
+            ttl if ttl is not None else int(os.environ.get("PCLUSTER_TEMPLATE_CACHE_TTL", DEFAULT_TEMPLATE_CACHE_TTL))
+        )
+        self.max_entries = max_entries
+
+    @staticmethod
+    def is_enabled():
+        """Return True if the template cache is enabled through the environment."""
+        return os.environ.get("PCLUSTER_TEMPLATE_CACHE_ENABLED", "false").lower() == "true"
+
+    @staticmethod
+    def get_key(cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str) -> str:
+        """Return the cache key of the template synthesized from the given inputs."""
+        key_inputs = {
+            "config": ClusterSchema(cluster_name=cluster_config.cluster_name).dump(deepcopy(cluster_config)),
+            "official_ami": cluster_config.official_ami,
+            "managed_head_node_security_group": cluster_config.managed_head_node_security_group,
+            "managed_compute_security_group": cluster_config.managed_compute_security_group,
+            "instance_types_data": cluster_config.get_instance_types_data(),
+            "stack_name": stack_name,
+            "bucket": bucket.name,
+            "region": get_region(),
+            "partition": get_partition(),
+            "version": get_installed_version(),
+        }
+        serialized_inputs = json.dumps(key_inputs, sort_keys=True, default=str)
+        return hashlib.sha256(serialized_inputs.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, volatile_values: Dict[str, str]) -> Optional[Tuple[dict, List[dict]]]:
+        """
+        Return the cached template and assets for the given key, with the volatile values substituted back.
+
+        Return None if the entry is missing, expired or unreadable.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, encoding="utf-8") as entry_file:
+                entry = entry_file.read()
+            metadata = json.loads(entry)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            LOGGER.warning("Ignoring unreadable template cache entry %s: %s", entry_path, e)
+            return None
+
+        if time.time() - metadata.get("creationTime", 0) > self.ttl:
+            LOGGER.info("Template cache entry %s expired", key)
+            self._remove(entry_path)
+            return None
+        volatile_values = {name: value for name, value in volatile_values.items() if value}
+        if sorted(metadata.get("volatileValues", [])) != sorted(volatile_values.keys()):
+            LOGGER.info("Template cache entry %s does not match the current request", key)
+            return None
+
+        for name, value in volatile_values.items():
+            entry = entry.replace(VOLATILE_VALUE_PLACEHOLDER.format(name=name), _to_json_string(value))
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        entry = json.loads(self._rename_assets(entry))
+        return entry["template"], entry["assets"]
+
+    @staticmethod
+    def _rename_assets(entry: str) -> str:
+        """
+        Rename the assets of the entry after their current content.
+
+        CDK names the nested stack assets after the hash of their content, which embeds the volatile values. Assets
+        are renamed after the hash of the substituted content, so that their S3 object key, hence the TemplateURL of
+        the nested stacks, changes only when the content does.
+        """
+        for asset in json.loads(entry)["assets"]:
+            content = json.dumps(asset["metadata"]["content"], sort_keys=True)
+            entry = entry.replace(asset["id"], hashlib.sha256(content.encode("utf-8")).hexdigest())
+        return entry
+
+    def put(
+        self, key: str, stack_name: str, template: dict, assets: List[dict], volatile_values: Dict[str, str]
+    ) -> bool:
+        """
+        Store the template and assets, replacing the volatile values with placeholders.
+
+        A volatile value is replaced only where it is not part of a longer number or word. Nothing is stored if a
+        volatile value cannot be told apart from the rest of the entry: if it is too short (e.g. a "null" version),
+        if it is contained in another one or if it is also found inside a longer number or word, since substituting
+        it back would corrupt unrelated text. Return True if the entry has been stored.
+        """
+        volatile_values = {name: value for name, value in volatile_values.items() if value}
+        short_values = [name for name, value in volatile_values.items() if len(value) < VOLATILE_VALUE_MIN_LENGTH]
+        if short_values:
+            LOGGER.info("Not caching template %s, volatile values %s are too short", key, short_values)
+            return False
+        values = list(volatile_values.values())
+        if any(value in other for i, value in enumerate(values) for j, other in enumerate(values) if i != j):
+            LOGGER.info("Not caching template %s, volatile values overlap", key)
+            return False
+
+        entry = json.dumps(
+            {
+                "stackName": stack_name,
+                "creationTime": time.time(),
+                "volatileValues": sorted(volatile_values.keys()),
+                "template": template,
+                "assets": assets,
+            },
+            default=str,
+        )
+        for name, value in volatile_values.items():
+            value = _to_json_string(value)
+            entry = _volatile_value_pattern(value).sub(VOLATILE_VALUE_PLACEHOLDER.format(name=name), entry)
+            if value in entry:
+                LOGGER.info("Not caching template %s, volatile value %s is also part of other values", key, name)
+                return False
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first, so that concurrent readers never see a partial entry
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as entry_file:
+                entry_file.write(entry)
+            os.replace(entry_file.name, self._entry_path(key))
+        except OSError as e:
+            LOGGER.warning("Unable to store template in cache: %s", e)
+            return False
+
+        self._evict()
+        return True
+
+    def list_entries(self, stack_name: str = None) -> List[Dict]:
+        """Return the description of the cached entries, most recently used first."""
+        entries = []
+        for key, entry_path, last_used_time in self._entries():
+            try:
+                with open(entry_path, encoding="utf-8") as entry_file:
+                    metadata = json.load(entry_file)
+            except (OSError, ValueError):
+                continue
+            if stack_name and metadata.get("stackName") != stack_name:
+                continue
+            creation_time = metadata.get("creationTime", 0)
+            entries.append(
+                {
+                    "key": key,
+                    "clusterName": metadata.get("stackName"),
+                    "creationTime": _to_iso_timestr(creation_time),
+                    "lastUsedTime": _to_iso_timestr(last_used_time),
+                    "expired": time.time() - creation_time > self.ttl,
+                    "size": os.path.getsize(entry_path),
+                }
+            )
+        return entries
+
+    def purge(self, stack_name: str = None) -> int:
+        """Remove the cached entries, only the ones of the given stack if specified. Return the removed entries."""
+        keys = {entry["key"] for entry in self.list_entries(stack_name)} if stack_name else None
+        removed = 0
+        for key, entry_path, _ in self._entries():
+            if keys is None or key in keys:
+                removed += self._remove(entry_path)
+        return removed
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}{TEMPLATE_CACHE_ENTRY_SUFFIX}")
+
+    def _entries(self):
+        """Return key, path and last used time of the entries, most recently used first."""
+        try:
+            file_names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return []
+        entries = []
+        for file_name in file_names:
+            if file_name.endswith(TEMPLATE_CACHE_ENTRY_SUFFIX):
+                entry_path = os.path.join(self.cache_dir, file_name)
+                try:
+                    last_used_time = os.path.getmtime(entry_path)
+                except OSError:
+                    continue
+                entries.append((file_name.replace(TEMPLATE_CACHE_ENTRY_SUFFIX, ""), entry_path, last_used_time))
+        return sorted(entries, key=lambda entry: entry[2], reverse=True)
+
+    def _evict(self):
+        """Remove the least recently used entries exceeding the maximum number of entries."""
+        for index, (_, entry_path, _) in enumerate(self._entries()):
+            if index >= self.max_entries:
+                self._remove(entry_path)
+
+    @staticmethod
+    def _remove(entry_path: str) -> bool:
+        try:
+            os.remove(entry_path)
+            return True
+        except OSError:
+            return False
+
+
+def _to_json_string(value: str) -> str:
+    """Return the value as it is serialized inside a JSON string."""
+    return json.dumps(value)[1:-1]
+
+
+def _volatile_value_pattern(value: str):
+    """Return the pattern matching the value when it is not part of a longer number, or of a longer word."""
+
+    def _boundary(char):
+        return "[0-9]" if char.isdigit() else "[A-Za-z0-9]"
+
+    return re.compile(f"(?<!{_boundary(value[0])}){re.escape(value)}(?!{_boundary(value[-1])})")
+
+
+def _to_iso_timestr(epoch_time: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch_time))
@@ -63,7 +63,6 @@ from pcluster.constants import (
     CW_ALARM_EVALUATION_PERIODS_DEFAULT,
     CW_ALARM_PERCENT_THRESHOLD_DEFAULT,
     CW_ALARM_PERIOD_DEFAULT,
-    CW_LOG_GROUP_NAME_PREFIX,
     CW_LOGS_CFN_PARAM_NAME,
     DEFAULT_EPHEMERAL_DIR,
     EFS_PORT,
@@ -105,7 +104,12 @@ from pcluster.templates.compute_fleet_stack import ComputeFleetConstruct
 from pcluster.templates.cw_dashboard_builder import CWDashboardConstruct
 from pcluster.templates.login_nodes_stack import LoginNodesStack
 from pcluster.templates.slurm_builder import SlurmConstruct
-from pcluster.utils import get_attr, get_http_tokens_setting, get_service_endpoint
+from pcluster.utils import (
+    generate_cluster_log_group_name,
+    get_attr,
+    get_http_tokens_setting,
+    get_service_endpoint,
+)
 
 StorageInfo = namedtuple("StorageInfo", ["id", "config"])
 
@@ -136,8 +140,7 @@ class ClusterCdkStack:
                 self.log_group_name = log_group_name
             else:
                 # pcluster create create a log group with timestamp suffix
-                timestamp = f"{datetime.utcnow().strftime('%Y%m%d%H%M')}"
-                self.log_group_name = f"{CW_LOG_GROUP_NAME_PREFIX}{self.stack.stack_name}-{timestamp}"
+                self.log_group_name = generate_cluster_log_group_name(self.stack.stack_name, datetime.utcnow())
 
         self.shared_storage_infos = {storage_type: [] for storage_type in SharedStorageType}
         self.shared_storage_mount_dirs = {storage_type: [] for storage_type in SharedStorageType}
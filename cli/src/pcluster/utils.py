@@ -9,6 +9,7 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import contextvars
 import datetime
 import functools
 import itertools
@@ -39,6 +40,7 @@ from yaml.resolver import BaseResolver
 
 from pcluster.aws.common import get_region
 from pcluster.constants import (
+    CW_LOG_GROUP_NAME_PREFIX,
     SUPPORTED_OSES_FOR_ARCHITECTURE,
     SUPPORTED_OSES_FOR_SCHEDULER,
     UNSUPPORTED_FEATURES_MAP,
@@ -309,6 +311,11 @@ def get_installed_version(base_version_only: bool = False):
     return pkg_distribution.version if not base_version_only else pkg_distribution.parsed_version.base_version
 
 
+def generate_cluster_log_group_name(stack_name: str, creation_time: datetime.datetime) -> str:
+    """Return the name of the CloudWatch log group created with the cluster, suffixed by the creation time."""
+    return f"{CW_LOG_GROUP_NAME_PREFIX}{stack_name}-{creation_time.strftime('%Y%m%d%H%M')}"
+
+
 def warn(message):
     """Print a warning message."""
     print(f"WARNING: {message}")
@@ -556,8 +563,10 @@ class AsyncUtils:
 
         @functools.wraps(func)
         async def wrapper(self, *args, **kwargs):
+            # Propagate the context of the calling task to the thread, like asyncio.to_thread does
+            context = contextvars.copy_context()
             return await asyncio.get_event_loop().run_in_executor(
-                AsyncUtils._thread_pool_executor, lambda: func(self, *args, **kwargs)
+                AsyncUtils._thread_pool_executor, lambda: context.run(func, self, *args, **kwargs)
             )
 
         return wrapper
@@ -14,14 +14,24 @@
 # pylint: disable=protected-access
 
 import asyncio
+import contextlib
+import contextvars
 import functools
+import logging
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List
+from typing import Dict, List, Tuple
 
 from pcluster.aws.common import AWSClientError
+from pcluster.validators.validation_profiler import ValidationProfiler
+
+LOGGER = logging.getLogger(__name__)
 
 ASYNC_TIMED_VALIDATORS_DEFAULT_TIMEOUT_SEC = 10
+VALIDATION_DEFAULT_MAX_CONCURRENCY = 10
+VALIDATION_DEFAULT_TIMEOUT_SEC = 300
 
 
 class FailureLevel(Enum):
@@ -141,6 +151,151 @@ def get_async_timed_validator_type_for(validator_type: type) -> AsyncValidator:
     return schema_class_type
 
 
+class ValidationScheduler:
+    """
+    Execute a list of validators concurrently and collect their results.
+
+    Sync validators are executed in a bounded thread pool, async validators are awaited on the event loop, at most
+    max_concurrency validators are running at a given time. The whole execution is bounded by a global timeout:
+    validators still running when it expires are reported with a warning.
+
+    Concurrency and timeout default to the PCLUSTER_VALIDATION_MAX_CONCURRENCY and PCLUSTER_VALIDATION_TIMEOUT
+    environment variables, if set. When a profiler is given, or enabled through the PCLUSTER_VALIDATION_PROFILE
+    environment variable, the cost of each validator class is measured and reported at the end of the execution.
+    """
+
+    def __init__(self, max_concurrency: int = None, timeout: float = None, profiler: ValidationProfiler = None):
+        self.max_concurrency = max_concurrency or int(
+            os.environ.get("PCLUSTER_VALIDATION_MAX_CONCURRENCY", VALIDATION_DEFAULT_MAX_CONCURRENCY)
+        )
+        self.timeout = timeout or float(os.environ.get("PCLUSTER_VALIDATION_TIMEOUT", VALIDATION_DEFAULT_TIMEOUT_SEC))
+        self.profiler = profiler or ValidationProfiler.from_environment()
+
+    def run(self, validators: List[Tuple[Validator, Dict]]) -> List[ValidationResult]:
+        """
+        Execute the given (validator, arguments) pairs and return their results.
+
+        Identical invocations, i.e. same validator type and same arguments, are executed only once and their results
+        are returned for each of them.
+        Results of sync validators come first, followed by the ones of async validators,
+        each group in the same order of the given validators.
+        """
+        if not validators:
+            return []
+
+        unique_validators = {}
+        invocation_keys = []
+        for validator, validator_args in validators:
+            invocation_key = self._invocation_key(validator, validator_args)
+            unique_validators.setdefault(invocation_key, (validator, validator_args))
+            invocation_keys.append(invocation_key)
+        LOGGER.debug(
+            "Executing %d distinct validators out of %d registered, %d duplicate executions collapsed",
+            len(unique_validators),
+            len(validators),
+            len(validators) - len(unique_validators),
+        )
+
+        results = dict(
+            zip(
+                unique_validators.keys(),
+                asyncio.get_event_loop().run_until_complete(self._run_all(list(unique_validators.values()))),
+            )
+        )
+        if self.profiler:
+            self.profiler.write_report()
+        ordered_results = [
+            results[invocation_key]
+            for invocation_key, (validator, _) in zip(invocation_keys, validators)
+            if not isinstance(validator, AsyncValidator)
+        ] + [
+            results[invocation_key]
+            for invocation_key, (validator, _) in zip(invocation_keys, validators)
+            if isinstance(validator, AsyncValidator)
+        ]
+        return [failure for failures in ordered_results for failure in failures]
+
+    @staticmethod
+    def _invocation_key(validator: Validator, validator_args: Dict):
+        """Return a hashable key identifying a validator invocation by validator type and canonicalized arguments."""
+        return type(validator), ValidationScheduler._canonicalize(validator_args)
+
+    @staticmethod
+    def _canonicalize(value):
+        """
+        Convert the given value into an hashable one, equal for equal values.
+
+        Values of different types are kept distinct (e.g. 1 and True) and objects that are not hashable,
+        like resources, are identified by their identity.
+        """
+        if isinstance(value, dict):
+            return dict, tuple(
+                sorted(
+                    ((key, ValidationScheduler._canonicalize(item)) for key, item in value.items()),
+                    key=lambda entry: repr(entry[0]),
+                )
+            )
+        if isinstance(value, (list, tuple)):
+            return type(value), tuple(ValidationScheduler._canonicalize(item) for item in value)
+        if isinstance(value, (set, frozenset)):
+            return type(value), frozenset(ValidationScheduler._canonicalize(item) for item in value)
+        try:
+            hash(value)
+            return type(value), value
+        except TypeError:
+            return type(value), id(value)
+
+    async def _run_all(self, validators):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="validator")
+        tasks = [
+            asyncio.ensure_future(self._run_validator(semaphore, executor, validator, validator_args))
+            for validator, validator_args in validators
+        ]
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=self.timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        finally:
+            # Threads cannot be interrupted, validators still running after the timeout are left behind
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results = []
+        for task, (validator, _) in zip(tasks, validators):
+            if task.cancelled():
+                LOGGER.debug("Validator %s timed out after %s seconds", validator.type, self.timeout)
+                results.append(
+                    [
+                        ValidationResult(
+                            f"Validation timed out after {self.timeout} seconds.", FailureLevel.WARNING, validator.type
+                        )
+                    ]
+                )
+            else:
+                results.append(task.result())
+        return results
+
+    async def _run_validator(self, semaphore, executor, validator, validator_args):
+        async with semaphore:
+            LOGGER.debug("Executing validator %s", validator.type)
+            try:
+                with self.profiler.profile(validator.type) if self.profiler else contextlib.nullcontext():
+                    if isinstance(validator, AsyncValidator):
+                        return await validator.execute_async(**validator_args)
+                    # The copied context carries the profiling recorder of this validator to the worker thread
+                    return await asyncio.get_event_loop().run_in_executor(
+                        executor,
+                        functools.partial(contextvars.copy_context().run, validator.execute, **validator_args),
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.debug("Validator %s unexpected failure: %s", validator.type, e)
+                return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)]
+
+
 class ValidatorContext:
     """Context containing information about cluster environment meant to be passed to validators."""
 
@@ -0,0 +1,164 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the profiler used to measure the cost of each validator during the config validation.
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+from tabulate import tabulate
+
+from pcluster.aws.common import AWS_CALLS_RECORDER
+
+LOGGER = logging.getLogger(__name__)
+
+VALIDATION_PROFILE_FORMATS = ["table", "json"]
+
+
+class _ExecutionRecord:
+    """Counters of a single validator execution, updated by the threads executing it."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.boto3_calls = 0
+        self.cache_hits = 0
+
+    def record_boto3_call(self, service: str, operation: str):  # pylint: disable=unused-argument
+        """Record a boto3 call made by the validator."""
+        with self._lock:
+            self.boto3_calls += 1
+
+    def record_cache_hit(self):
+        """Record a result served from the AWS API cache."""
+        with self._lock:
+            self.cache_hits += 1
+
+
+class ValidatorProfile:
+    """Aggregated measures of all the executions of a validator class."""
+
+    def __init__(self, validator_type: str):
+        self.validator_type = validator_type
+        self.executions = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.boto3_calls = 0
+        self.cache_hits = 0
+
+    def add_execution(self, elapsed_time: float, record: _ExecutionRecord):
+        """Add the measures of a completed execution."""
+        self.executions += 1
+        self.total_time += elapsed_time
+        self.max_time = max(self.max_time, elapsed_time)
+        self.boto3_calls += record.boto3_calls
+        self.cache_hits += record.cache_hits
+
+    def to_dict(self):
+        """Return the measures as a dictionary."""
+        return {
+            "validator": self.validator_type,
+            "executions": self.executions,
+            "totalTime": round(self.total_time, 3),
+            "maxTime": round(self.max_time, 3),
+            "boto3Calls": self.boto3_calls,
+            "cacheHits": self.cache_hits,
+        }
+
+
+class ValidationProfiler:
+    """
+    Collect wall time, boto3 calls and AWS API cache hits of each validator class.
+
+    The profiling is enabled by setting the PCLUSTER_VALIDATION_PROFILE environment variable to one of the
+    supported formats (table or json). The report is written to stderr, or appended to the file pointed by the
+    PCLUSTER_VALIDATION_PROFILE_FILE environment variable, if set.
+    """
+
+    def __init__(self, output_format: str = "table"):
+        self.output_format = output_format
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, ValidatorProfile] = {}
+        self._start_time = time.monotonic()
+
+    @staticmethod
+    def from_environment():
+        """Return a profiler if the profiling is enabled through the environment, None otherwise."""
+        output_format = os.environ.get("PCLUSTER_VALIDATION_PROFILE", "").strip().lower()
+        if not output_format:
+            return None
+        if output_format not in VALIDATION_PROFILE_FORMATS:
+            LOGGER.warning(
+                "Unsupported validation profile format %s, supported formats are: %s. Using table.",
+                output_format,
+                ", ".join(VALIDATION_PROFILE_FORMATS),
+            )
+            output_format = "table"
+        return ValidationProfiler(output_format)
+
+    @contextmanager
+    def profile(self, validator_type: str):
+        """
+        Measure the execution of a validator in the current context.
+
+        boto3 calls and cache hits are attributed to the validator when made from the same context, i.e. the same
+        thread or asyncio task, or from threads started with a copy of it.
+        """
+        record = _ExecutionRecord()
+        token = AWS_CALLS_RECORDER.set(record)
+        start_time = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed_time = time.monotonic() - start_time
+            AWS_CALLS_RECORDER.reset(token)
+            with self._lock:
+                self._profiles.setdefault(validator_type, ValidatorProfile(validator_type)).add_execution(
+                    elapsed_time, record
+                )
+
+    def report(self) -> List[Dict]:
+        """Return the measures of each validator class, most expensive first."""
+        with self._lock:
+            profiles = sorted(self._profiles.values(), key=lambda profile: profile.total_time, reverse=True)
+            return [profile.to_dict() for profile in profiles]
+
+    def format_report(self) -> str:
+        """Return the report in the configured format."""
+        report = self.report()
+        total_time = round(time.monotonic() - self._start_time, 3)
+        if self.output_format == "json":
+            return json.dumps({"totalTime": total_time, "validators": report}, indent=2)
+
+        header = ["Validator", "Executions", "Total time (s)", "Max time (s)", "boto3 calls", "Cache hits"]
+        rows = [list(entry.values()) for entry in report]
+        return f"{tabulate(rows, header)}\n\nValidation completed in {total_time} seconds."
+
+    def write_report(self):
+        """Write the report to the file set in PCLUSTER_VALIDATION_PROFILE_FILE, or to stderr otherwise."""
+        report = self.format_report()
+        output_file = os.environ.get("PCLUSTER_VALIDATION_PROFILE_FILE")
+        try:
+            if output_file:
+                with open(output_file, "a", encoding="utf-8") as output:
+                    output.write(f"{report}\n")
+            else:
+                # The CLI redirects sys.stderr to the log file while running an operation, use the original stream
+                sys.__stderr__.write(f"{report}\n")
+                sys.__stderr__.flush()
+        except OSError as e:
+            LOGGER.warning("Unable to write validation profile: %s", e)
+        LOGGER.info("Validation profile:\n%s", report)
@@ -34,10 +34,12 @@ def clear_env(mocker):
 
 @pytest.fixture(autouse=True)
 def reset_aws_api():
-    """Reset AWSApi singleton to remove dependencies between tests."""
+    """Reset AWSApi singleton and the pooled boto3 clients to remove dependencies between tests."""
     from pcluster.aws.aws_api import AWSApi
+    from pcluster.aws.common import Boto3ClientPool
 
     AWSApi._instance = None
+    Boto3ClientPool.clear()
 
 
 @pytest.fixture
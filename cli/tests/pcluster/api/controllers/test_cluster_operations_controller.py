@@ -6,6 +6,8 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import threading
+import time
 from datetime import datetime
 
 import pytest
@@ -27,6 +29,7 @@ from pcluster.models.cluster import (
     ConflictClusterActionError,
     LimitExceededClusterActionError,
 )
+from pcluster.models.cluster_resources import ClusterInstance
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus
 from pcluster.models.login_nodes_status import LoginNodesPoolState, PoolStatus
 from pcluster.utils import get_installed_version, to_iso_timestr
@@ -885,6 +888,76 @@ class TestDescribeCluster:
             assert_that(response.status_code).is_equal_to(400)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    @pytest.mark.parametrize(
+        "slow_lookup, expected_fields",
+        [
+            ("head_node", {"url": "presigned-url", "headNode": None, "computeFleetStatus": "RUNNING"}),
+            ("config_url", {"url": "NOT_AVAILABLE", "headNode": "i-123", "computeFleetStatus": "RUNNING"}),
+            ("compute_fleet_status", {"url": "presigned-url", "headNode": "i-123", "computeFleetStatus": "UNKNOWN"}),
+            ("failures", {"url": "presigned-url", "headNode": "i-123", "computeFleetStatus": "RUNNING"}),
+        ],
+    )
+    def test_lookup_timeout(self, mocker, client, slow_lookup, expected_fields):
+        mocker.patch("pcluster.api.controllers.cluster_operations_controller.DESCRIBE_CLUSTER_LOOKUP_TIMEOUT", 0.5)
+        release_event = threading.Event()
+
+        def _lookup(name, value):
+            def _wait():
+                if name == slow_lookup:
+                    release_event.wait(10)
+                return value
+
+            return _wait
+
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            return_value=cfn_describe_stack_mock_response(
+                {"Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": "slurm"}]}
+            ),
+        )
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).side_effect = _lookup("compute_fleet_status", ComputeFleetStatus.RUNNING)
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).side_effect = _lookup("config_url", "presigned-url")
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.head_node_instance", new_callable=mocker.PropertyMock
+        ).side_effect = _lookup(
+            "head_node",
+            ClusterInstance(
+                {
+                    "InstanceId": "i-123",
+                    "InstanceType": "t3.micro",
+                    "LaunchTime": datetime(2021, 5, 10, 13, 55, 48),
+                    "PrivateIpAddress": "192.168.61.109",
+                    "State": {"Code": 16, "Name": "running"},
+                }
+            ),
+        )
+        mocker.patch("pcluster.api.controllers.cluster_operations_controller._get_login_nodes", return_value=None)
+        mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller._get_creation_failures",
+            side_effect=lambda *args: _lookup("failures", None)(),
+        )
+
+        start_time = time.monotonic()
+        try:
+            response = self._send_test_request(client)
+        finally:
+            release_event.set()
+
+        with soft_assertions():
+            # The lookups are executed concurrently, so the request waits at most for the timeout of the slowest one
+            assert_that(time.monotonic() - start_time).is_less_than(5)
+            # A lookup that times out falls back as when it fails, instead of failing the whole request
+            assert_that(response.status_code).is_equal_to(200)
+            response_json = response.get_json()
+            assert_that(response_json["clusterConfiguration"]).is_equal_to({"url": expected_fields["url"]})
+            assert_that(response_json["computeFleetStatus"]).is_equal_to(expected_fields["computeFleetStatus"])
+            assert_that(response_json.get("headNode", {}).get("instanceId")).is_equal_to(expected_fields["headNode"])
+            assert_that(response_json).does_not_contain_key("failures")
+
     def test_cluster_not_found(self, client, mocker):
         mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=StackNotFoundError("func", "stack"))
 
@@ -1573,6 +1646,179 @@ class TestDescribeCluster:
             assert_that(response.get_json()).is_equal_to(expected_response)
 
 
+class TestDescribeClusters:
+    url = "/v3/clusterdescriptions"
+    method = "GET"
+
+    def _send_test_request(self, client, cluster_names, region="us-east-1"):
+        query_string = [("clusterNames", cluster_name) for cluster_name in cluster_names] + [("region", region)]
+        headers = {"Accept": "application/json"}
+        return client.open(self.url, method=self.method, headers=headers, query_string=query_string)
+
+    def test_successful_request(self, mocker, client):
+        stacks = {
+            "slurm-cluster": cfn_describe_stack_mock_response(
+                {
+                    "StackName": "slurm-cluster",
+                    "StackId": "arn:aws:cloudformation:us-east-1:123:stack/slurm-cluster/123",
+                }
+            ),
+            "batch-cluster": cfn_describe_stack_mock_response(
+                {
+                    "StackName": "batch-cluster",
+                    "StackId": "arn:aws:cloudformation:us-east-1:123:stack/batch-cluster/123",
+                    "Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": "awsbatch"}],
+                    "Outputs": [{"OutputKey": "BatchComputeEnvironmentArn", "OutputValue": "ce-arn"}],
+                }
+            ),
+            "deleting-cluster": cfn_describe_stack_mock_response(
+                {
+                    "StackName": "deleting-cluster",
+                    "StackId": "arn:aws:cloudformation:us-east-1:123:stack/deleting-cluster/123",
+                    "StackStatus": "DELETE_IN_PROGRESS",
+                }
+            ),
+            "old-cluster": cfn_describe_stack_mock_response(
+                {"StackName": "old-cluster", "Tags": [{"Key": "parallelcluster:version", "Value": "2.11.0"}]}
+            ),
+        }
+        describe_stacks_mock = mocker.patch("pcluster.aws.cfn.CfnClient.describe_pcluster_stacks", return_value=stacks)
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            return_value=(
+                [
+                    {
+                        "InstanceId": "i-020c2ec1b6d550000",
+                        "InstanceType": "t3.micro",
+                        "LaunchTime": datetime(2021, 5, 10, 13, 55, 48),
+                        "PrivateIpAddress": "192.168.61.109",
+                        "State": {"Code": 16, "Name": "running"},
+                        "Tags": [{"Key": "parallelcluster:cluster-name", "Value": "slurm-cluster"}],
+                    }
+                ],
+                None,
+            ),
+        )
+        batch_get_items_mock = mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.batch_get_items",
+            return_value={"parallelcluster-slurm-cluster": [{"Id": "COMPUTE_FLEET", "Data": {"status": "STOPPED"}}]},
+        )
+        mocker.patch("pcluster.aws.batch.BatchClient.get_compute_environment_state", return_value="ENABLED")
+
+        cluster_names = ["slurm-cluster", "batch-cluster", "deleting-cluster", "old-cluster", "missing-cluster"]
+        response = self._send_test_request(client, cluster_names)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            response_json = response.get_json()
+            assert_that(response_json["notFoundClusterNames"]).is_equal_to(["missing-cluster"])
+            assert_that(response_json["incompatibleClusterNames"]).is_equal_to(["old-cluster"])
+            clusters = {cluster["clusterName"]: cluster for cluster in response_json["clusters"]}
+            assert_that(clusters).is_length(3)
+            assert_that(clusters["slurm-cluster"]).is_equal_to(
+                {
+                    "cloudFormationStackStatus": "CREATE_COMPLETE",
+                    "cloudformationStackArn": "arn:aws:cloudformation:us-east-1:123:stack/slurm-cluster/123",
+                    "clusterName": "slurm-cluster",
+                    "clusterStatus": "CREATE_COMPLETE",
+                    "computeFleetStatus": "STOPPED",
+                    "creationTime": to_iso_timestr(datetime(2021, 4, 30)),
+                    "lastUpdatedTime": to_iso_timestr(datetime(2021, 4, 30)),
+                    "region": "us-east-1",
+                    "tags": [
+                        {"key": "parallelcluster:version", "value": get_installed_version()},
+                        {"key": "parallelcluster:s3_bucket", "value": "bucket_name"},
+                        {
+                            "key": "parallelcluster:cluster_dir",
+                            "value": "parallelcluster/3.0.0/clusters/pcluster3-2-smkloc964uzpm12m",
+                        },
+                    ],
+                    "version": get_installed_version(),
+                    "headNode": {
+                        "instanceId": "i-020c2ec1b6d550000",
+                        "instanceType": "t3.micro",
+                        "launchTime": to_iso_timestr(datetime(2021, 5, 10, 13, 55, 48)),
+                        "privateIpAddress": "192.168.61.109",
+                        "state": "running",
+                    },
+                    "scheduler": {"type": "slurm"},
+                }
+            )
+            assert_that(clusters["batch-cluster"]).does_not_contain_key("headNode")
+            assert_that(clusters["batch-cluster"]["computeFleetStatus"]).is_equal_to("ENABLED")
+            assert_that(clusters["deleting-cluster"]["computeFleetStatus"]).is_equal_to("UNKNOWN")
+            assert_that(clusters["deleting-cluster"]["clusterStatus"]).is_equal_to("DELETE_IN_PROGRESS")
+
+        # Stacks, head nodes and compute fleet status of all the clusters are retrieved with shared requests
+        assert_that(describe_stacks_mock.call_count).is_equal_to(1)
+        assert_that(describe_instances_mock.call_count).is_equal_to(1)
+        filters = describe_instances_mock.call_args[0][0]
+        assert_that(filters[0]["Values"]).contains_only("slurm-cluster", "batch-cluster", "deleting-cluster")
+        batch_get_items_mock.assert_called_once_with({"parallelcluster-slurm-cluster": [{"Id": "COMPUTE_FLEET"}]})
+
+    def test_head_nodes_not_available(self, mocker, client):
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_pcluster_stacks",
+            return_value={"clustername": cfn_describe_stack_mock_response({"StackName": "clustername"})},
+        )
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances", side_effect=AWSClientError("describe_instances", "error")
+        )
+        mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.batch_get_items",
+            return_value={"parallelcluster-clustername": [{"Id": "COMPUTE_FLEET", "Data": {"status": "RUNNING"}}]},
+        )
+
+        response = self._send_test_request(client, ["clustername"])
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()["clusters"]).is_length(1)
+            assert_that(response.get_json()["clusters"][0]).does_not_contain_key("headNode")
+            assert_that(response.get_json()["notFoundClusterNames"]).is_empty()
+
+    def test_incompatible_clusters(self, mocker, client):
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_pcluster_stacks",
+            return_value={
+                "old-cluster": cfn_describe_stack_mock_response(
+                    {"StackName": "old-cluster", "Tags": [{"Key": "parallelcluster:version", "Value": "2.11.0"}]}
+                )
+            },
+        )
+        describe_instances_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances")
+
+        response = self._send_test_request(client, ["old-cluster", "missing-cluster"])
+
+        # Clusters of an incompatible version exist, they are not reported as not found
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).is_equal_to(
+                {
+                    "clusters": [],
+                    "incompatibleClusterNames": ["old-cluster"],
+                    "notFoundClusterNames": ["missing-cluster"],
+                }
+            )
+        describe_instances_mock.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "cluster_names, expected_message",
+        [
+            ([], "Bad Request: Missing query parameter 'clusterNames'"),
+            (["aaaaa.aaa"], "Bad Request: 'aaaaa.aaa' does not match '^[a-zA-Z][a-zA-Z0-9-]+$'"),
+            ([f"cluster{index}" for index in range(101)], "is too long"),
+        ],
+        ids=["missing_cluster_names", "invalid_cluster_name", "too_many_clusters"],
+    )
+    def test_malformed_request(self, client, cluster_names, expected_message):
+        response = self._send_test_request(client, cluster_names)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()["message"]).contains(expected_message)
+
+
 class TestListClusters:
     url = "/v3/clusters"
     method = "GET"
@@ -2299,7 +2545,16 @@ class TestUpdateCluster:
         mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", return_value=stack_data)
         mocker.patch(
             "pcluster.aws.ec2.Ec2Client.describe_instances",
-            return_value=([{"InstanceId": "i-123456789"}], None),
+            return_value=(
+                [
+                    {
+                        "InstanceId": "i-123456789",
+                        "State": {"Name": "running"},
+                        "Tags": [{"Key": "parallelcluster:node-type", "Value": "HeadNode"}],
+                    }
+                ],
+                None,
+            ),
         )
 
         response = self._send_test_request(
@@ -135,6 +135,10 @@ class _DummyEc2Client(Ec2Client):
             "cr-234": {"InstanceType": "t3.micro", "AvailabilityZone": "string"},
         }
         self.security_groups_cache = {}
+        self.instance_types_data_cache = {}
+
+    def describe_instance_types(self, instance_types):
+        return []
 
     def get_official_image_id(self, os, architecture, filters=None):
         return "dummy-ami-id"
@@ -12,12 +12,28 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
+import os
 from datetime import datetime
 
 import pytest
 from assertpy import assert_that
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError
 
-from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, StackNotFoundError
+from pcluster.aws import common
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import (
+    THROTTLING_MAX_ATTEMPTS,
+    AWSExceptionHandler,
+    Boto3Client,
+    Boto3ClientPool,
+    ImageNotFoundError,
+    LimitExceededError,
+    StackNotFoundError,
+    ThrottlingRateLimiter,
+    get_throttling_metrics,
+    reset_rate_limiters,
+)
 from tests.pcluster.aws.dummy_aws_api import _DummyAWSApi, mock_aws_api
 from tests.pcluster.test_utils import FAKE_NAME
 from tests.utils import MockedBoto3Request
@@ -73,6 +89,7 @@ def test_retry_on_boto3_throttling(boto3_stubber, mocker):
         client.describe_stack_resources(StackName=FAKE_NAME)
 
     sleep_mock = mocker.patch("pcluster.utils.time.sleep")
+    mocker.patch("pcluster.aws.common.random.uniform", side_effect=lambda low, high: high)
     mocked_requests = [
         MockedBoto3Request(
             method="describe_stack_resources",
@@ -86,13 +103,178 @@ def test_retry_on_boto3_throttling(boto3_stubber, mocker):
             response="Error",
             expected_params={"StackName": FAKE_NAME},
             generate_error=True,
-            error_code="Throttling",
+            error_code="RequestLimitExceeded",
         ),
         MockedBoto3Request(method="describe_stack_resources", response={}, expected_params={"StackName": FAKE_NAME}),
     ]
     client = boto3_stubber("cloudformation", mocked_requests)
     describe_stack_resources(client)
-    sleep_mock.assert_called_with(5)
+    # Exponential backoff, the jitter is disabled by the mock
+    assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([0.5, 1])
+
+
+def test_retry_on_boto3_throttling_max_attempts(boto3_stubber, mocker):
+    @AWSExceptionHandler.retry_on_boto3_throttling
+    def describe_stack_resources(client):
+        client.describe_stack_resources(StackName=FAKE_NAME)
+
+    sleep_mock = mocker.patch("pcluster.utils.time.sleep")
+    mocker.patch("pcluster.aws.common.THROTTLING_MAX_ATTEMPTS", 2)
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_stack_resources",
+            response="Error",
+            expected_params={"StackName": FAKE_NAME},
+            generate_error=True,
+            error_code="Throttling",
+        )
+    ] * 2
+    client = boto3_stubber("cloudformation", mocked_requests)
+    with pytest.raises(ClientError, match="Throttling"):
+        describe_stack_resources(client)
+    assert_that(sleep_mock.call_count).is_equal_to(1)
+
+
+class _RawResponse:
+    def __init__(self, body):
+        self._body = body
+
+    def stream(self, **kwargs):
+        yield self._body
+
+
+def _cfn_response(error_code=None):
+    if error_code:
+        body = (
+            f"<ErrorResponse><Error><Type>Sender</Type><Code>{error_code}</Code><Message>Rate exceeded</Message>"
+            "</Error><RequestId>request-id</RequestId></ErrorResponse>"
+        )
+        status_code = 400
+    else:
+        body = "<DescribeStacksResponse><DescribeStacksResult><Stacks/></DescribeStacksResult></DescribeStacksResponse>"
+        status_code = 200
+    return AWSResponse("https://cloudformation.us-east-1.amazonaws.com", status_code, {}, _RawResponse(body.encode()))
+
+
+@pytest.fixture()
+def rate_limited_cfn_client(mocker):
+    """Return a factory of cloudformation clients receiving the given responses instead of calling the service."""
+    mocker.patch.dict(
+        os.environ,
+        {"AWS_DEFAULT_REGION": "us-east-1", "AWS_ACCESS_KEY_ID": "key", "AWS_SECRET_ACCESS_KEY": "secret"},
+    )
+    reset_rate_limiters()
+    yield_responses = []
+
+    def _rate_limited_cfn_client(responses):
+        client = Boto3Client("cloudformation")
+        yield_responses.extend(responses)
+        client._client.meta.events.register("before-send.*.*", lambda **kwargs: yield_responses.pop(0))
+        return client
+
+    yield _rate_limited_cfn_client
+    reset_rate_limiters()
+
+
+def test_rate_limiter_retries_throttled_requests(rate_limited_cfn_client, mocker):
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    mocker.patch("pcluster.aws.common.random.uniform", side_effect=lambda low, high: high)
+    client = rate_limited_cfn_client(
+        [_cfn_response("Throttling"), _cfn_response("ThrottlingException"), _cfn_response()]
+    )
+
+    assert_that(client._client.describe_stacks()).contains_entry({"Stacks": []})
+    # Retries wait for the backoff and, once the limiter is enabled by the first throttled request, for a token
+    assert_that(sleep_mock.call_args_list).contains(mocker.call(0.5), mocker.call(1))
+    assert_that(common.get_rate_limiter("cloudformation").fill_rate).is_not_none()
+    metrics = get_throttling_metrics()["cloudformation"]
+    assert_that(metrics).contains_entry({"requests": 3}, {"throttledRequests": 2}, {"retries": 2})
+    assert_that(metrics["throttledTime"]).is_greater_than_or_equal_to(1.5)
+
+
+def test_rate_limiter_gives_up_after_max_attempts(rate_limited_cfn_client, mocker):
+    mocker.patch("pcluster.aws.common.time.sleep")
+    client = rate_limited_cfn_client([_cfn_response("Throttling")] * THROTTLING_MAX_ATTEMPTS)
+
+    @AWSExceptionHandler.handle_client_exception
+    def describe_stacks():
+        return client._client.describe_stacks()
+
+    with pytest.raises(LimitExceededError, match="Rate exceeded"):
+        describe_stacks()
+    assert_that(get_throttling_metrics()["cloudformation"]).contains_entry(
+        {"requests": 10}, {"throttledRequests": 10}, {"retries": 9}
+    )
+
+
+def test_retry_on_boto3_throttling_counts_client_retries(rate_limited_cfn_client, mocker):
+    mocker.patch("pcluster.aws.common.time.sleep")
+    client = rate_limited_cfn_client([_cfn_response("Throttling")] * THROTTLING_MAX_ATTEMPTS)
+
+    @AWSExceptionHandler.retry_on_boto3_throttling
+    def describe_stacks():
+        return client._client.describe_stacks()
+
+    # The attempts already made by the rate limiter of the client exhaust the budget of the decorator
+    with pytest.raises(ClientError, match="Throttling"):
+        describe_stacks()
+    assert_that(get_throttling_metrics()["cloudformation"]).contains_entry({"requests": THROTTLING_MAX_ATTEMPTS})
+
+
+def test_rate_limiter_adapts_rate(mocker):
+    now = [100.0]
+    mocker.patch("pcluster.aws.common.time.monotonic", side_effect=lambda: now[0])
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    throttled_response = (None, {"Error": {"Code": "RequestLimitExceeded"}})
+    success_response = (None, {})
+    limiter = ThrottlingRateLimiter("ec2")
+
+    # Requests are not limited until the service throttles them, then the rate starts from the measured one
+    for _ in range(10):
+        limiter.on_sending_request()
+    assert_that(limiter.fill_rate).is_none()
+    limiter.on_response(attempts=1, response=throttled_response)
+    assert_that(limiter.fill_rate).is_equal_to(7)
+
+    # Requests exceeding the rate wait for their token
+    for _ in range(3):
+        limiter.on_sending_request()
+    assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([1 / 7, 2 / 7, 3 / 7])
+
+    # Successful responses increase the rate until the limiter is disabled
+    limiter.on_response(attempts=1, response=success_response)
+    assert_that(limiter.fill_rate).is_equal_to(7.5)
+    for _ in range(200):
+        limiter.on_response(attempts=1, response=success_response)
+    assert_that(limiter.fill_rate).is_none()
+
+    # Other errors are left to the botocore retry handler
+    assert_that(limiter.on_response(attempts=1, response=(None, {"Error": {"Code": "ValidationError"}}))).is_none()
+    assert_that(limiter.on_response(attempts=1, caught_exception=ConnectionError())).is_none()
+    assert_that(limiter.metrics.to_dict()).contains_entry({"requests": 13}, {"throttledRequests": 1}, {"retries": 1})
+
+
+def test_boto3_client_pool(mocker):
+    mocker.patch.dict(os.environ, {"AWS_DEFAULT_REGION": "us-east-1"})
+    client_factory = mocker.patch("pcluster.aws.common.boto3.client", side_effect=lambda *args, **kwargs: mocker.Mock())
+    api = AWSApi.instance()
+    cfn_client = api.cfn._client
+
+    # Clients are reused across resets, while the client wrappers and their caches are not
+    AWSApi.reset()
+    assert_that(AWSApi.instance()).is_not_same_as(api)
+    assert_that(AWSApi.instance().cfn._client).is_same_as(cfn_client)
+    assert_that(cfn_client.meta.events.register.call_count).is_equal_to(2)
+
+    # A new client is created for a different service, region or configuration
+    assert_that(AWSApi.instance().ec2._client).is_not_same_as(cfn_client)
+    assert_that(AWSApi.instance().s3._client).is_not_same_as(Boto3Client("s3")._client)
+    mocker.patch.dict(os.environ, {"AWS_DEFAULT_REGION": "eu-west-1"})
+    assert_that(AWSApi.instance().cfn._client).is_not_same_as(cfn_client)
+    assert_that(client_factory.call_count).is_equal_to(5)
+
+    Boto3ClientPool.clear()
+    assert_that(Boto3Client("cloudformation")._client).is_not_same_as(AWSApi.instance().cfn._client)
 
 
 FAKE_SSM_PARAMETER = "fake-ssm-parameter-name"
@@ -5,13 +5,18 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+import os
+import threading
+import time
+from collections import Counter
 from datetime import datetime
 
 import pytest
 from assertpy import assert_that
+from botocore.exceptions import ClientError
 
 from pcluster import utils as utils
-from pcluster.aws.cfn import CfnClient
+from pcluster.aws.cfn import LIST_STACKS_PAGE_SIZE, CfnClient
 from pcluster.aws.common import AWSClientError
 from tests.pcluster.test_utils import FAKE_NAME, _generate_stack_event
 from tests.utils import MockedBoto3Request
@@ -98,6 +103,51 @@ class TestCfnClient:
                 CfnClient().list_pcluster_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
 
+    def test_describe_pcluster_stacks(self, set_env, boto3_stubber):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+
+        def _stack(name):
+            return {
+                "StackName": name,
+                "CreationTime": datetime.now(),
+                "StackStatus": "CREATE_COMPLETE",
+                "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}],
+            }
+
+        mocked_requests = [
+            MockedBoto3Request(
+                method="describe_stacks",
+                response={"Stacks": [_stack("name1"), _stack("name2")], "NextToken": "token1"},
+                expected_params={},
+            ),
+            MockedBoto3Request(
+                method="describe_stacks",
+                response={"Stacks": [_stack("name3")], "NextToken": "token2"},
+                expected_params={"NextToken": "token1"},
+            ),
+        ]
+        boto3_stubber("cloudformation", mocked_requests)
+
+        # The sweep stops as soon as all the requested stacks are found
+        stacks = CfnClient().describe_pcluster_stacks(["name1", "name3"])
+        assert_that(stacks).is_length(2).contains_key("name1", "name3")
+
+    def test_describe_pcluster_stacks_not_found(self, set_env, boto3_stubber):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocked_requests = [
+            MockedBoto3Request(
+                method="describe_stacks",
+                response={"Stacks": [], "NextToken": "token"},
+                expected_params={},
+            ),
+            MockedBoto3Request(
+                method="describe_stacks", response={"Stacks": []}, expected_params={"NextToken": "token"}
+            ),
+        ]
+        boto3_stubber("cloudformation", mocked_requests)
+
+        assert_that(CfnClient().describe_pcluster_stacks(["name1"])).is_empty()
+
     def test_get_stack_events_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
         expected_events = [_generate_stack_event()]
@@ -117,7 +167,7 @@ class TestCfnClient:
         ]
         boto3_stubber("cloudformation", mocked_requests)
         assert_that(CfnClient().get_stack_events(FAKE_NAME)["StackEvents"]).is_equal_to(expected_events)
-        sleep_mock.assert_called_with(5)
+        sleep_mock.assert_called_once()
 
     def test_get_stack_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
@@ -139,7 +189,7 @@ class TestCfnClient:
         boto3_stubber("cloudformation", mocked_requests)
         stack = CfnClient().describe_stack(FAKE_NAME)
         assert_that(stack).is_equal_to(expected_stack)
-        sleep_mock.assert_called_with(5)
+        sleep_mock.assert_called_once()
 
     def test_verify_stack_status_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
@@ -242,3 +292,181 @@ class TestCfnClient:
             with pytest.raises(AWSClientError) as e:
                 CfnClient().list_pcluster_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
+
+
+class FakeCloudFormation:
+    """In-memory CloudFormation client implementing the paginated DescribeStacks and ListStacks calls."""
+
+    def __init__(self, stacks, page_size=100, latency=0):
+        self.stacks = stacks
+        self.page_size = page_size
+        self.latency = latency
+        self.calls = Counter()
+        self.vanished_stacks = set()
+        self._lock = threading.Lock()
+
+    def _call(self, operation):
+        with self._lock:
+            self.calls[operation] += 1
+        time.sleep(self.latency)
+
+    def _page(self, items, next_token):
+        start = int(next_token or 0)
+        end = start + self.page_size
+        return items[start:end], str(end) if end < len(items) else None
+
+    def describe_stacks(self, StackName=None, NextToken=None):  # noqa: N803
+        self._call("describe_stacks")
+        stacks = [stack for stack in self.stacks if stack["StackStatus"] != "DELETE_COMPLETE"]
+        if StackName:
+            for stack in stacks:
+                if (
+                    StackName in (stack["StackId"], stack["StackName"])
+                    and stack["StackName"] not in self.vanished_stacks
+                ):
+                    return {"Stacks": [stack]}
+            raise ClientError(
+                {"Error": {"Code": "ValidationError", "Message": f"Stack {StackName} does not exist"}}, "DescribeStacks"
+            )
+        page, next_token = self._page(stacks, NextToken)
+        return {"Stacks": page, "NextToken": next_token} if next_token else {"Stacks": page}
+
+    def list_stacks(self, StackStatusFilter, NextToken=None):  # noqa: N803
+        self._call("list_stacks")
+        summaries = [
+            {key: stack[key] for key in ["StackId", "StackName", "StackStatus", "ParentId"] if key in stack}
+            for stack in self.stacks
+            if stack["StackStatus"] in StackStatusFilter
+        ]
+        page, next_token = self._page(summaries, NextToken)
+        return {"StackSummaries": page, "NextToken": next_token} if next_token else {"StackSummaries": page}
+
+
+def _fake_stack(name, status="CREATE_COMPLETE", tags=None, parent_id=None):
+    stack = {
+        "StackId": f"arn:aws:cloudformation:us-east-1:123456789012:stack/{name}/id",
+        "StackName": name,
+        "StackStatus": status,
+        "Tags": [{"Key": key, "Value": value} for key, value in (tags or {}).items()],
+    }
+    if parent_id:
+        stack["ParentId"] = parent_id
+    return stack
+
+
+def _fake_stacks(clusters, images, nested_stacks_per_cluster, unrelated_stacks, deleted_stacks):
+    """Return the stacks of an account, with the stacks of the clusters mixed with unrelated stacks."""
+    stacks = []
+    for index in range(clusters):
+        cluster = _fake_stack(f"cluster{index}", tags={"parallelcluster:version": "3.13.0"})
+        stacks.append(cluster)
+        stacks.extend(
+            _fake_stack(f"cluster{index}-nested{nested}", parent_id=cluster["StackId"])
+            for nested in range(nested_stacks_per_cluster)
+        )
+        stacks.extend(_fake_stack(f"unrelated{index}-{unrelated}") for unrelated in range(unrelated_stacks // clusters))
+        stacks.extend(
+            _fake_stack(
+                f"deleted{index}-{deleted}", status="DELETE_COMPLETE", tags={"parallelcluster:version": "3.0.0"}
+            )
+            for deleted in range(deleted_stacks // clusters)
+        )
+    stacks.extend(
+        _fake_stack(
+            f"image{index}", tags={"parallelcluster:version": "3.13.0", "parallelcluster:image_id": f"image{index}"}
+        )
+        for index in range(images)
+    )
+    return stacks
+
+
+def _list_all_pcluster_stacks(cfn_client):
+    pages = []
+    next_token = None
+    while True:
+        stacks, next_token = cfn_client.list_pcluster_stacks(next_token)
+        pages.append([stack["StackName"] for stack in stacks])
+        if not next_token:
+            return pages
+
+
+@pytest.fixture()
+def fake_cfn_client(set_env):
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+
+    def _fake_cfn_client(stacks, latency=0):
+        cfn_client = CfnClient()
+        cfn_client._client = FakeCloudFormation(stacks, latency=latency)
+        return cfn_client
+
+    return _fake_cfn_client
+
+
+@pytest.mark.parametrize("prefilter_enabled", [True, False])
+def test_list_pcluster_stacks_pages(set_env, fake_cfn_client, prefilter_enabled):
+    set_env("PCLUSTER_LIST_STACKS_PREFILTER_ENABLED", str(prefilter_enabled).lower())
+    cfn_client = fake_cfn_client(_fake_stacks(250, 5, 3, 250, 250))
+    cfn_client._client.vanished_stacks.add("cluster7")
+
+    pages = _list_all_pcluster_stacks(cfn_client)
+
+    # A stack deleted after being listed is skipped
+    expected_stacks = [f"cluster{index}" for index in range(250) if index != 7 or not prefilter_enabled]
+    assert_that([stack for page in pages for stack in page]).is_equal_to(expected_stacks)
+    if prefilter_enabled:
+        # Pages are full and nested and deleted stacks are never described
+        assert_that([len(page) for page in pages]).is_equal_to([LIST_STACKS_PAGE_SIZE, LIST_STACKS_PAGE_SIZE, 49])
+        assert_that(cfn_client._client.calls["describe_stacks"]).is_equal_to(250 + 250 + 5)
+
+
+def test_list_pcluster_stacks_prefiltered_token(set_env, fake_cfn_client):
+    set_env("PCLUSTER_LIST_STACKS_PREFILTER_ENABLED", "true")
+    cfn_client = fake_cfn_client(_fake_stacks(250, 0, 0, 0, 0))
+
+    first_page, next_token = cfn_client.list_pcluster_stacks()
+    second_page, _ = cfn_client.list_pcluster_stacks(next_token)
+
+    # The token is stable, resuming twice from it returns the same page
+    assert_that(cfn_client.list_pcluster_stacks(next_token)[0]).is_equal_to(second_page)
+    assert_that(second_page[0]["StackName"]).is_equal_to("cluster100")
+
+    with pytest.raises(AWSClientError) as e:
+        cfn_client.list_pcluster_stacks("invalid-token")
+    assert_that(e.value.error_code).is_equal_to(AWSClientError.ErrorCode.VALIDATION_ERROR.value)
+
+
+def test_list_pcluster_stacks_benchmark(set_env, fake_cfn_client):
+    """
+    Compare the listing paths in an account with 10k stacks, of which only 125 are clusters.
+
+    The number of list-clusters requests needed to list all the clusters is always checked. The wall time with a
+    simulated API latency is reported only when the PCLUSTER_LIST_STACKS_BENCHMARK environment variable is set to
+    true, e.g.:
+
+        PCLUSTER_LIST_STACKS_BENCHMARK=true pytest -s tests/pcluster/aws/test_cfn.py -k benchmark
+    """
+    benchmark = os.environ.get("PCLUSTER_LIST_STACKS_BENCHMARK", "false").lower() == "true"
+    stacks = _fake_stacks(
+        clusters=125, images=0, nested_stacks_per_cluster=20, unrelated_stacks=375, deleted_stacks=7000
+    )
+    assert_that(stacks).is_length(10000)
+
+    results = {}
+    for prefilter_enabled in [False, True]:
+        set_env("PCLUSTER_LIST_STACKS_PREFILTER_ENABLED", str(prefilter_enabled).lower())
+        cfn_client = fake_cfn_client(stacks, latency=0.01 if benchmark else 0)
+        start_time = time.monotonic()
+        pages = _list_all_pcluster_stacks(cfn_client)
+        results[prefilter_enabled] = pages, time.monotonic() - start_time, cfn_client._client.calls
+        assert_that([stack for page in pages for stack in page]).is_length(125)
+        if benchmark:
+            print(
+                f"prefilter={prefilter_enabled}: {len(pages)} pages, {results[prefilter_enabled][1]:.2f} s, "
+                f"calls {dict(cfn_client._client.calls)}"
+            )
+
+    # Without prefilter every DescribeStacks page is a list-clusters page, most of them almost empty.
+    # With prefilter nested stacks are never described, while the other parentless stacks are described one by one.
+    assert_that(results[False][0]).is_length(30)
+    assert_that(results[True][0]).is_length(2)
+    assert_that(results[True][2]["describe_stacks"]).is_equal_to(500)
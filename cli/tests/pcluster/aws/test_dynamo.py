@@ -10,11 +10,18 @@
 # limitations under the License.
 
 import pytest
+from assertpy import assert_that
 from boto3.dynamodb.conditions import Attr
 
+from pcluster.aws.common import AWSClientError
 from pcluster.aws.dynamo import DynamoResource
 
 
+@pytest.fixture()
+def mocked_dynamo_resource(mocker):
+    return mocker.patch("boto3.resource").return_value
+
+
 @pytest.fixture()
 def mocked_dynamo_table(mocker):
     mock_table = mocker.MagicMock(autospec=True)
@@ -66,3 +73,39 @@ class TestDynamoDBResource:
             ExpressionAttributeValues=expression_attribute_values,
             ConditionExpression=condition_expression,
         )
+
+    def test_batch_get_items(self, set_env, mocker, mocked_dynamo_resource):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.dynamo.time.sleep")
+        keys_by_table = {f"table{index}": [{"Id": "MyKey"}] for index in range(150)}
+        mocked_dynamo_resource.batch_get_item.side_effect = [
+            {
+                "Responses": {f"table{index}": [{"Id": "MyKey", "index": index}] for index in range(99)},
+                "UnprocessedKeys": {"table99": {"Keys": [{"Id": "MyKey"}], "ConsistentRead": True}},
+            },
+            {"Responses": {"table99": [{"Id": "MyKey", "index": 99}]}, "UnprocessedKeys": {}},
+            {"Responses": {f"table{index}": [{"Id": "MyKey", "index": index}] for index in range(100, 150)}},
+        ]
+
+        items = DynamoResource().batch_get_items(keys_by_table)
+
+        assert_that(items).is_length(150)
+        assert_that(items["table99"]).is_equal_to([{"Id": "MyKey", "index": 99}])
+        # Keys are grouped in requests of at most 100 keys and unprocessed keys are retried
+        calls = mocked_dynamo_resource.batch_get_item.call_args_list
+        assert_that([len(call.kwargs["RequestItems"]) for call in calls]).is_equal_to([100, 1, 50])
+        assert_that(calls[1].kwargs["RequestItems"]).is_equal_to(
+            {"table99": {"Keys": [{"Id": "MyKey"}], "ConsistentRead": True}}
+        )
+
+    def test_batch_get_items_unprocessed_keys(self, set_env, mocker, mocked_dynamo_resource):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.dynamo.time.sleep")
+        mocked_dynamo_resource.batch_get_item.return_value = {
+            "Responses": {},
+            "UnprocessedKeys": {"table": {"Keys": [{"Id": "MyKey"}], "ConsistentRead": True}},
+        }
+
+        with pytest.raises(AWSClientError, match="Unable to retrieve items from tables table"):
+            DynamoResource().batch_get_items({"table": [{"Id": "MyKey"}]}, max_attempts=3)
+        assert_that(mocked_dynamo_resource.batch_get_item.call_count).is_equal_to(3)
@@ -16,7 +16,7 @@ from assertpy import assert_that, soft_assertions
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import CapacityReservationInfo, ImageInfo, InstanceTypeInfo
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, Cache, SqliteCacheBackend
 from pcluster.aws.ec2 import Ec2Client
 from pcluster.config.cluster_config import AmiSearchFilters, Tag
 from pcluster.constants import OS_TO_IMAGE_NAME_PART_MAP
@@ -518,6 +518,63 @@ def test_get_subnet_ids_az_mapping(boto3_stubber):
     assert_that(response["subnet-456"]).is_equal_to("us-east-1b")
 
 
+def get_describe_instance_types_mocked_request(instance_types):
+    return MockedBoto3Request(
+        method="describe_instance_types",
+        response={
+            "InstanceTypes": [
+                {"InstanceType": instance_type, "VCpuInfo": {"DefaultVCpus": 4}} for instance_type in instance_types
+            ]
+        },
+        expected_params={"InstanceTypes": instance_types},
+    )
+
+
+def test_describe_instance_types_cache(boto3_stubber, mocker):
+    mocker.patch("pcluster.aws.ec2.DESCRIBE_INSTANCE_TYPES_BATCH_SIZE", 2)
+    instance_types = ["c5.xlarge", "c5.2xlarge", "m6i.large"]
+    # The instance types are described in batches; then only the instance type missing from the cache is described
+    mocked_requests = [
+        get_describe_instance_types_mocked_request(["c5.xlarge", "c5.2xlarge"]),
+        get_describe_instance_types_mocked_request(["m6i.large"]),
+        get_describe_instance_types_mocked_request(["t3.micro"]),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    response = AWSApi.instance().ec2.describe_instance_types(instance_types + ["c5.xlarge"])
+    assert_that([data["InstanceType"] for data in response]).is_equal_to(instance_types)
+
+    # The prefetched data is used when getting the info of a single instance type
+    for instance_type in instance_types:
+        assert_that(AWSApi.instance().ec2.get_instance_type_info(instance_type).vcpus_count()).is_equal_to(4)
+    assert_that(AWSApi.instance().ec2.get_instance_type_info("t3.micro").instance_type()).is_equal_to("t3.micro")
+
+
+def test_describe_instance_types_persistent_cache(boto3_stubber, mocker, tmp_path):
+    mocker.patch.dict(os_lib.environ, {"PCLUSTER_PERSISTENT_CACHE_ENABLED": "true"})
+    mocker.patch("pcluster.aws.common._get_caller_account", return_value="123456789012")
+    Cache.set_persistent_backend(SqliteCacheBackend(str(tmp_path / "cache.sqlite")))
+    mocked_requests = [
+        get_describe_instance_types_mocked_request(["c5.xlarge"]),
+        get_describe_instance_types_mocked_request(["m6i.large", "t3.micro"]),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    try:
+        AWSApi.instance().ec2.get_instance_type_info("c5.xlarge")
+
+        # Simulate a new CLI invocation, only the instance types missing from the persistent cache are described
+        Cache.clear_all()
+        AWSApi.reset()
+        response = AWSApi.instance().ec2.describe_instance_types(["m6i.large", "c5.xlarge", "t3.micro"])
+        assert_that([data["InstanceType"] for data in response]).is_equal_to(["m6i.large", "c5.xlarge", "t3.micro"])
+
+        # The batched results are stored in the persistent cache of the single instance types
+        Cache.clear_all()
+        AWSApi.reset()
+        assert_that(AWSApi.instance().ec2.get_instance_type_info("t3.micro").vcpus_count()).is_equal_to(4)
+    finally:
+        Cache.set_persistent_backend(None)
+
+
 def get_describe_capacity_reservation_mocked_request(capacity_reservations, state):
     return MockedBoto3Request(
         method="describe_capacity_reservations",
@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import itertools
+import os
 
 import pytest
 from assertpy import assert_that
@@ -158,6 +159,39 @@ class TestCreateClusterCommand:
         }
         create_cluster_mock.assert_called_with(**expected_args)
 
+    def test_execute_with_validation_profile(self, mocker, test_datadir):
+        response_dict = {
+            "cluster": {
+                "clusterName": "cluster",
+                "cloudformationStackStatus": "CREATE_IN_PROGRESS",
+                "cloudformationStackArn": "arn:aws:cloudformation:us-east-2:000000000000:stack/cluster/aa",
+                "region": "eu-west-1",
+                "version": "3.0.0",
+                "clusterStatus": "CREATE_IN_PROGRESS",
+            }
+        }
+        operation_environ = {}
+
+        def _create_cluster(**kwargs):
+            operation_environ.update(os.environ)
+            return CreateClusterResponseContent().from_dict(response_dict)
+
+        create_cluster_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.create_cluster",
+            side_effect=_create_cluster,
+            autospec=True,
+        )
+        environ = mocker.patch.dict(os.environ, {})
+
+        path = str(test_datadir / "config.yaml")
+        run(["create-cluster", "-n", "cluster", "-c", path, "-r", "eu-west-1", "--validation-profile", "json"])
+
+        # The flag is not part of the API specification, it is converted into the environment variable of the operation
+        assert_that(create_cluster_mock.call_args[1]).does_not_contain_key("validation_profile")
+        assert_that(operation_environ).contains_entry({"PCLUSTER_VALIDATION_PROFILE": "json"})
+        # The variable does not leak to the later operations of the process
+        assert_that(environ).does_not_contain_key("PCLUSTER_VALIDATION_PROFILE")
+
     def test_error(self, mocker, test_datadir):
         api_response = {"message": "error"}, 400
         mocker.patch(
@@ -8,6 +8,10 @@
 import pytest
 from assertpy import assert_that
 
+from pcluster.cli.entrypoint import run
+from pcluster.cli.exceptions import APIOperationException
+from pcluster.models.cluster import ClusterActionError
+
 
 class TestDeleteClusterInstancesCommand:
     def test_helper(self, test_datadir, run_cli, assert_out_err):
@@ -34,3 +38,23 @@ class TestDeleteClusterInstancesCommand:
 
         out, err = capsys.readouterr()
         assert_that(out + err).contains(error_message)
+
+    @pytest.mark.parametrize("wait_error", [None, ClusterActionError("Timed out waiting for the termination")])
+    def test_execute_with_wait(self, mocker, wait_error):
+        delete_cluster_instances_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_instances_controller.delete_cluster_instances",
+            return_value=None,
+            autospec=True,
+        )
+        wait_mock = mocker.patch("pcluster.models.cluster.Cluster.wait_nodes_termination", side_effect=wait_error)
+
+        command = ["delete-cluster-instances", "--cluster-name", "cluster", "--wait"]
+        if wait_error:
+            with pytest.raises(APIOperationException) as exc_info:
+                run(command)
+            assert_that(exc_info.value.data).is_equal_to({"message": "Timed out waiting for the termination"})
+        else:
+            out = run(command)
+            assert_that(out).is_equal_to({"message": "Successfully terminated the compute nodes of cluster 'cluster'."})
+        delete_cluster_instances_mock.assert_called_with(region=None, cluster_name="cluster", force=None)
+        wait_mock.assert_called_once()
@@ -5,11 +5,15 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+import json
 import re
 
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSClientError
+from pcluster.models.cluster_resources import ClusterInstance
+
 
 class TestDescribeClusterInstancesCommand:
     def test_helper(self, test_datadir, run_cli, assert_out_err):
@@ -41,3 +45,56 @@ class TestDescribeClusterInstancesCommand:
 
         out, err = capsys.readouterr()
         assert_that(re.search(error_message, out + err) or error_message in out + err).is_true()
+
+    def test_execute_stream(self, mocker, mock_cluster_stack, set_env, run_cli, capsys):
+        def _instances(*instance_ids):
+            return [
+                ClusterInstance(
+                    {
+                        "InstanceId": instance_id,
+                        "InstanceType": "t2.micro",
+                        "LaunchTime": "2021-04-30T00:00:00.000Z",
+                        "PrivateIpAddress": "10.0.0.1",
+                        "State": {"Name": "running"},
+                        "Tags": [{"Key": "parallelcluster:node-type", "Value": "Compute"}],
+                    }
+                )
+                for instance_id in instance_ids
+            ]
+
+        describe_instances_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_instances_controller.Cluster.describe_instances",
+            side_effect=[(_instances("i-1", "i-2"), "token1"), (_instances("i-3"), None)],
+        )
+        # The stats are logged once all the pages have been retrieved
+        logged_stats = []
+        mocker.patch(
+            "pcluster.cli.entrypoint._log_stats",
+            side_effect=lambda: logged_stats.append(describe_instances_mock.call_count),
+        )
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mock_cluster_stack()
+        command = ["pcluster", "describe-cluster-instances", "-n", "cluster", "--next-token", "token0", "--stream"]
+        run_cli(command, expect_failure=False)
+        assert_that(logged_stats).is_equal_to([2])
+
+        # One record per line, retrieved following the next tokens
+        out, _ = capsys.readouterr()
+        records = [json.loads(line) for line in out.splitlines()]
+        assert_that([record["instanceId"] for record in records]).is_equal_to(["i-1", "i-2", "i-3"])
+        assert_that(records[0]).contains_entry({"nodeType": "ComputeNode"}, {"state": "running"})
+        assert_that([call[1]["next_token"] for call in describe_instances_mock.call_args_list]).is_equal_to(
+            ["token0", "token1"]
+        )
+
+    def test_execute_stream_error(self, mocker, mock_cluster_stack, set_env, run_cli, capsys):
+        mocker.patch(
+            "pcluster.api.controllers.cluster_instances_controller.Cluster.describe_instances",
+            side_effect=[([], "token1"), AWSClientError("describe_instances", "Failed to retrieve cluster instances")],
+        )
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mock_cluster_stack()
+        run_cli(["pcluster", "describe-cluster-instances", "-n", "cluster", "--stream"], expect_failure=True)
+
+        out, _ = capsys.readouterr()
+        assert_that(out).contains("Failed to retrieve cluster instances")
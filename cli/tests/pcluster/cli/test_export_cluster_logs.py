@@ -43,6 +43,9 @@ class TestExportClusterLogsCommand:
             ({"filters": ["Name=wrong,Value=test"]}, "filters parameter must be in the form"),
             ({"filters": ["private-dns-name=test"]}, "filters parameter must be in the form"),
             ({"filters": "private-dns-name=test"}, "filters parameter must be in the form"),
+            ({"download_concurrency": "0"}, "invalid positive integer value: '0'"),
+            ({"download_concurrency": "many"}, "invalid positive integer value: 'many'"),
+            ({"compression": "bzip2"}, "argument --compression: invalid choice: 'bzip2'"),
         ],
     )
     def test_invalid_args(self, args, error_message, run_cli, capsys):
@@ -112,6 +115,8 @@ class TestExportClusterLogsCommand:
                 "end_time": "2021-06-07",
                 "filters": "Name=node-type,Values=HeadNode",
             },
+            {"download_concurrency": 32},
+            {"compression": "zstd"},
         ],
     )
     def test_execute(self, mocker, set_env, args):
@@ -138,6 +143,8 @@ class TestExportClusterLogsCommand:
             "filters": None,
             "start_time": None,
             "end_time": None,
+            "compression": "gzip",
+            "download_concurrency": 10,
         }
         expected_params.update(args)
         expected_params.update(
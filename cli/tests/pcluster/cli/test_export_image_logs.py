@@ -87,6 +87,7 @@ class TestExportImageLogsCommand:
             "keep_s3_objects": False,
             "start_time": None,
             "end_time": None,
+            "compression": "gzip",
         }
         expected_params.update(args)
         expected_params.update(
@@ -144,6 +144,27 @@ class TestGetClusterLogEventsCommand:
         }
         get_cluster_log_events_mock.assert_called_with(**kwargs)
 
+    def test_execute_stream(self, mocker, mock_cluster_stack, set_env, run_cli, capsys):
+        def _log_stream(messages, next_token):
+            events = [{"timestamp": 1622802790248, "message": message, "ingestionTime": 0} for message in messages]
+            return LogStream(FAKE_NAME, "logstream", {"events": events, "nextForwardToken": next_token})
+
+        # The end of the stream is reached when the returned token is the one received as input
+        get_cluster_log_events_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_logs_controller.Cluster.get_log_events",
+            side_effect=[_log_stream(["a", "b"], "f/1"), _log_stream([], "f/2"), _log_stream(["c"], "f/2")],
+        )
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mock_cluster_stack()
+        command = BASE_COMMAND + self._build_cli_args({**REQUIRED_ARGS, "start_from_head": "true"})
+        run_cli(command + ["--stream", "--query", "message"], expect_failure=False)
+
+        out, _ = capsys.readouterr()
+        assert_that(out.splitlines()).is_equal_to(['"a"', '"b"', '"c"'])
+        assert_that([call[1]["next_token"] for call in get_cluster_log_events_mock.call_args_list]).is_equal_to(
+            [None, "f/1", "f/2"]
+        )
+
     @staticmethod
     def _build_cli_args(args):
         cli_args = []
@@ -0,0 +1,84 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+"""
+Import time benchmark of the pcluster CLI commands.
+
+For each command the modules imported before dispatching it, i.e. while building the parser and loading the command
+or the API controller, are measured with python -X importtime in a fresh interpreter.
+Modules that must never be imported by a command are always checked. Import time budgets depend on the machine, so
+they are checked only when the PCLUSTER_IMPORT_TIME_BENCHMARK environment variable is set to true, e.g.:
+
+    PCLUSTER_IMPORT_TIME_BENCHMARK=true pytest -s tests/pcluster/cli/test_import_time.py
+"""
+import os
+import re
+import subprocess  # nosec B404
+import sys
+
+import pytest
+from assertpy import assert_that
+
+# Imports everything needed to dispatch the operation given as first argument, without executing it
+STARTUP_SCRIPT = """
+import sys
+import pcluster.cli.entrypoint as entrypoint
+import pcluster.cli.model as cli_model
+operation = sys.argv[1]
+model = cli_model.load_model(cli_model.package_spec())
+parser, parser_map = entrypoint.gen_parser(model)
+entrypoint.add_cli_commands(parser_map, operation)
+if operation in model:
+    cli_model.get_function_from_name(model[operation]["func"])
+"""
+
+# Modules providing the API server, the configuration schema and the cluster model
+API_AND_MODEL_MODULES = ["connexion", "flask", "marshmallow", "pcluster.models.cluster"]
+
+# Command: (import time budget in milliseconds, modules that must not be imported)
+IMPORT_TIME_BUDGETS = {
+    "version": (1500, ["aws_cdk"] + API_AND_MODEL_MODULES),
+    "configure": (1500, ["aws_cdk"] + API_AND_MODEL_MODULES),
+    "ssh": (4000, ["aws_cdk"]),
+    "export-cluster-logs": (4000, ["aws_cdk"]),
+    "list-clusters": (4000, ["aws_cdk"]),
+    "describe-cluster": (4000, ["aws_cdk"]),
+    "create-cluster": (4000, ["aws_cdk"]),
+    "list-images": (4000, ["aws_cdk"]),
+}
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(?P<self>\d+) \|\s+\d+ \|\s+(?P<module>\S+)")
+
+
+def _measure_imports(operation):
+    """Return the total import time in milliseconds and the imported modules when starting the given operation."""
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT, operation],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_time_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            total_time_us += int(match.group("self"))
+            modules.add(match.group("module"))
+    return total_time_us / 1000, modules
+
+
+@pytest.mark.parametrize("operation", IMPORT_TIME_BUDGETS.keys())
+def test_import_time(operation):
+    budget_ms, forbidden_modules = IMPORT_TIME_BUDGETS[operation]
+    import_time_ms, modules = _measure_imports(operation)
+
+    assert_that(modules).contains("pcluster.cli.entrypoint")
+    assert_that(modules).does_not_contain(*forbidden_modules)
+    if os.environ.get("PCLUSTER_IMPORT_TIME_BENCHMARK", "false").lower() == "true":
+        print(f"{operation}: {import_time_ms:.0f} ms (budget {budget_ms} ms)")
+        assert_that(import_time_ms).is_less_than_or_equal_to(budget_ms)
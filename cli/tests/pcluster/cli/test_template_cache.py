@@ -0,0 +1,44 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+import os
+
+from assertpy import assert_that
+
+from pcluster.templates.cdk_template_cache import CDKTemplateCache
+
+BASE_COMMAND = ["pcluster", "template-cache"]
+
+
+class TestTemplateCacheCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = BASE_COMMAND + ["--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    def test_invalid_action(self, run_cli, capsys):
+        run_cli(BASE_COMMAND + ["delete"], expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains("invalid choice: 'delete'")
+
+    def test_list_and_purge(self, mocker, tmpdir, run_cli, capsys):
+        mocker.patch.dict(os.environ, {"PCLUSTER_TEMPLATE_CACHE_PATH": str(tmpdir)})
+        template_cache = CDKTemplateCache()
+        template_cache.put("key1", "cluster1", {"Resources": {}}, [], {})
+        template_cache.put("key2", "cluster2", {"Resources": {}}, [], {})
+
+        run_cli(BASE_COMMAND + ["list", "--cluster-name", "cluster1"], expect_failure=False)
+        templates = json.loads(capsys.readouterr().out)["templates"]
+        assert_that(templates).is_length(1)
+        assert_that(templates[0]).contains_entry({"key": "key1"}, {"clusterName": "cluster1"})
+
+        run_cli(BASE_COMMAND + ["purge"], expect_failure=False)
+        assert_that(json.loads(capsys.readouterr().out)).is_equal_to({"purgedTemplates": 2})
+        assert_that(template_cache.list_entries()).is_empty()
@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import itertools
+import os
 
 import pytest
 from assertpy import assert_that
@@ -172,6 +173,42 @@ class TestUpdateClusterCommand:
         }
         update_cluster_mock.assert_called_with(**expected_args)
 
+    def test_execute_with_incremental_validation(self, mocker, test_datadir):
+        response_dict = {
+            "cluster": {
+                "clusterName": "cluster",
+                "cloudformationStackStatus": "UPDATE_IN_PROGRESS",
+                "cloudformationStackArn": "arn:aws:cloudformation:us-east-2:000000000000:stack/cluster/aa",
+                "region": "eu-west-1",
+                "version": "3.0.0",
+                "clusterStatus": "UPDATE_IN_PROGRESS",
+            },
+            "changeSet": [],
+        }
+        operation_environ = {}
+
+        def _update_cluster(**kwargs):
+            operation_environ.update(os.environ)
+            return UpdateClusterResponseContent().from_dict(response_dict)
+
+        update_cluster_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.update_cluster",
+            side_effect=_update_cluster,
+            autospec=True,
+        )
+        environ = mocker.patch.dict(os.environ, {})
+
+        path = str(test_datadir / "config.yaml")
+        run(["update-cluster", "-n", "cluster", "-c", path, "--incremental-validation", "--validation-profile", "json"])
+
+        # The flags are not part of the API specification, they are converted into environment variables
+        assert_that(update_cluster_mock.call_args[1]).does_not_contain_key("incremental_validation")
+        assert_that(operation_environ).contains_entry({"PCLUSTER_VALIDATION_INCREMENTAL": "true"})
+        assert_that(operation_environ).contains_entry({"PCLUSTER_VALIDATION_PROFILE": "json"})
+        # The variables do not leak to the later operations of the process
+        assert_that(environ).does_not_contain_key("PCLUSTER_VALIDATION_INCREMENTAL")
+        assert_that(environ).does_not_contain_key("PCLUSTER_VALIDATION_PROFILE")
+
     def test_resource_unchanged_due_to_queue_reorder(self, mocker, test_datadir, pcluster_config_reader):
         """Confirms that changing queue order/count does not result in generation of different resource ids."""
         mock_aws_api(mocker)
@@ -37,6 +37,7 @@ from pcluster.config.cluster_config import (
     SlurmSettings,
     Tag,
 )
+from pcluster.config.config_patch import Change
 from pcluster.validators.ec2_validators import PlacementGroupCapacityTypeValidator
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
@@ -647,6 +648,110 @@ class TestBaseClusterConfig:
     def test_get_instance_types_data(self, base_cluster_config):
         assert_that(base_cluster_config.get_instance_types_data()).is_equal_to({})
 
+    def test_instance_types_prefetch(self, aws_api_mock):
+        cluster_config = SlurmClusterConfig(
+            cluster_name="clustername",
+            image=Image("alinux2"),
+            head_node=HeadNode("c5.xlarge", HeadNodeNetworking("subnet")),
+            login_nodes=LoginNodes(
+                pools=[
+                    LoginNodesPool(
+                        name="pool",
+                        instance_type="t3.xlarge",
+                        networking=LoginNodesNetworking(subnet_ids=["subnet"]),
+                        ssh=LoginNodesSsh(key_name="mykey"),
+                    )
+                ]
+            ),
+            scheduling=SlurmScheduling(
+                [
+                    SlurmQueue(
+                        name="queue0",
+                        networking=SlurmQueueNetworking(subnet_ids=["subnet"]),
+                        compute_resources=[
+                            SlurmComputeResource(name="compute_resource_1", instance_type="c5.xlarge"),
+                            SlurmFlexibleComputeResource(
+                                [
+                                    FlexibleInstanceType(instance_type="c5n.9xlarge"),
+                                    FlexibleInstanceType("c5n.18xlarge"),
+                                ],
+                                name="compute_resource_2",
+                            ),
+                        ],
+                    ),
+                    SlurmQueue(
+                        name="queue1",
+                        networking=SlurmQueueNetworking(subnet_ids=["subnet"]),
+                        compute_resources=[SlurmComputeResource(name="compute_resource_1", instance_type="t3.xlarge")],
+                    ),
+                ]
+            ),
+        )
+
+        expected_instance_types = ["c5.xlarge", "t3.xlarge", "c5n.9xlarge", "c5n.18xlarge"]
+        assert_that(cluster_config.all_instance_types).is_equal_to(expected_instance_types)
+        # All the instance types are described together when the config is created
+        aws_api_mock.ec2.describe_instance_types.assert_called_once_with(expected_instance_types)
+
+    @pytest.mark.parametrize(
+        "changes, expected_resources",
+        [
+            (
+                [
+                    Change(
+                        ["Scheduling", "SlurmQueues[queue1]", "ComputeResources[cr1]"], "MaxCount", 10, 20, None, False
+                    ),
+                    Change(["Scheduling", "SlurmQueues[queue1]"], "CustomActions", None, {}, None, False),
+                ],
+                ["queue1"],
+            ),
+            (
+                [
+                    Change(["Scheduling"], "SlurmQueues", None, {"Name": "queue0"}, None, True),
+                    Change(["LoginNodes", "Pools[pool]"], "Count", 1, 2, None, False),
+                ],
+                ["queue0", "pool"],
+            ),
+            ([Change(["HeadNode"], "InstanceType", "c5.xlarge", "c5.2xlarge", None, False)], None),
+            ([Change(["Scheduling", "SlurmSettings"], "ScaledownIdletime", 10, 20, None, False)], None),
+            ([Change(["Scheduling"], "SlurmQueues", {"Name": "queue2"}, None, None, True)], None),
+            ([Change(["Scheduling", "SlurmQueues[unknown]"], "AllocationStrategy", None, "x", None, False)], None),
+        ],
+    )
+    def test_get_changed_resources(self, aws_api_mock, changes, expected_resources):
+        cluster_config = SlurmClusterConfig(
+            cluster_name="clustername",
+            image=Image("alinux2"),
+            head_node=HeadNode("c5.xlarge", HeadNodeNetworking("subnet")),
+            login_nodes=LoginNodes(
+                pools=[
+                    LoginNodesPool(
+                        name="pool",
+                        instance_type="t3.xlarge",
+                        networking=LoginNodesNetworking(subnet_ids=["subnet"]),
+                        ssh=LoginNodesSsh(key_name="mykey"),
+                    )
+                ]
+            ),
+            scheduling=SlurmScheduling(
+                [
+                    SlurmQueue(
+                        name=queue_name,
+                        networking=SlurmQueueNetworking(subnet_ids=["subnet"]),
+                        compute_resources=[SlurmComputeResource(name="cr1", instance_type="c5.xlarge")],
+                    )
+                    for queue_name in ["queue0", "queue1"]
+                ]
+            ),
+        )
+
+        changed_resources = cluster_config.get_changed_resources(changes)
+
+        if expected_resources is None:
+            assert_that(changed_resources).is_none()
+        else:
+            assert_that([resource.name for resource in changed_resources]).is_equal_to(expected_resources)
+
     @pytest.mark.parametrize(
         "queue_parameters, expected_result",
         [
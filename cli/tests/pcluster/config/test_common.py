@@ -9,6 +9,9 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import os
+import threading
+import time
 from typing import List
 from unittest.mock import MagicMock
 
@@ -181,7 +184,7 @@ def test_async_resource_validation_waited_at_top_level():
             super().__init__()
             self.fake_attribute = f"fake-{name}"
             self.other_attribute = f"other-{name}"
-            self._await_async_validators = MagicMock(wraps=self._await_async_validators)
+            self._run_scheduled_validators = MagicMock(wraps=self._run_scheduled_validators)
 
         def _register_validators(self, context: ValidatorContext = None):
             self._register_validator(FakeErrorValidator, param=self.fake_attribute)
@@ -199,9 +202,9 @@ def test_async_resource_validation_waited_at_top_level():
         ]
     )
 
-    fake_resource._await_async_validators.assert_called_once()
-    fake_resource.nested1._await_async_validators.assert_not_called()
-    fake_resource.nested2._await_async_validators.assert_not_called()
+    fake_resource._run_scheduled_validators.assert_called_once()
+    fake_resource.nested1._run_scheduled_validators.assert_not_called()
+    fake_resource.nested2._run_scheduled_validators.assert_not_called()
 
     assert_validation_result(validation_failures[0], FailureLevel.ERROR, "Error fake-nested1.")
     assert_validation_result(validation_failures[1], FailureLevel.ERROR, "Error fake-nested2.")
@@ -326,6 +329,162 @@ def test_nested_resource_validate():
     assert_validation_result(validation_failures[2], FailureLevel.INFO, "Wrong value other-value.")
 
 
+class FakeSlowValidator(Validator):
+    """Dummy validator simulating a slow AWS call."""
+
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def _validate(self, param, duration=0.3):
+        with FakeSlowValidator.lock:
+            FakeSlowValidator.running += 1
+            FakeSlowValidator.max_running = max(FakeSlowValidator.max_running, FakeSlowValidator.running)
+        time.sleep(duration)
+        with FakeSlowValidator.lock:
+            FakeSlowValidator.running -= 1
+        self._add_failure(f"Slow {param}.", FailureLevel.INFO)
+
+
+class FakeSlowResource(Resource):
+    """Fake resource class registering slow validators."""
+
+    def __init__(self, fake_values, duration=0.3):
+        super().__init__()
+        self.fake_values = fake_values
+        self.duration = duration
+
+    def _register_validators(self, context: ValidatorContext = None):
+        for param in self.fake_values:
+            self._register_validator(FakeSlowValidator, param=param, duration=self.duration)
+
+
+@pytest.mark.parametrize("max_concurrency, expected_max_running", [("1", 1), ("3", 3), ("10", 6)])
+def test_validators_concurrent_execution(mocker, max_concurrency, expected_max_running):
+    """Verify that sync validators are executed concurrently within the concurrency limit, keeping results order."""
+    mocker.patch.dict(os.environ, {"PCLUSTER_VALIDATION_MAX_CONCURRENCY": max_concurrency})
+    FakeSlowValidator.max_running = 0
+    fake_resource = FakeSlowResource(["root"], duration=0.2)
+    fake_resource.nested = [FakeSlowResource([f"nested{index}"], duration=0.2) for index in range(5)]
+
+    validation_failures = fake_resource.validate()
+
+    assert_that(FakeSlowValidator.max_running).is_equal_to(expected_max_running)
+    assert_that([failure.message for failure in validation_failures]).is_equal_to(
+        [f"Slow nested{index}." for index in range(5)] + ["Slow root."]
+    )
+
+
+def test_validators_global_timeout(mocker):
+    """Verify that validators still running when the global timeout expires are reported as warnings."""
+    mocker.patch.dict(os.environ, {"PCLUSTER_VALIDATION_TIMEOUT": "0.5"})
+    fake_resource = FakeSlowResource(["slow"], duration=2)
+    fake_resource.nested = FakeSlowResource(["fast"], duration=0)
+
+    start = time.time()
+    validation_failures = fake_resource.validate()
+
+    assert_that(time.time() - start).is_less_than(2)
+    assert_validation_result(validation_failures[0], FailureLevel.INFO, "Slow fast.")
+    assert_validation_result(validation_failures[1], FailureLevel.WARNING, "Validation timed out after 0.5 seconds.")
+    assert_that(validation_failures[1].validator_type).is_equal_to("FakeSlowValidator")
+
+
+class FakeCountingValidator(Validator):
+    """Dummy validator counting its executions."""
+
+    executions = []
+
+    def _validate(self, subnet_ids, settings=None):
+        FakeCountingValidator.executions.append(subnet_ids)
+        self._add_failure(f"Subnets {subnet_ids}.", FailureLevel.WARNING)
+
+
+def test_duplicate_validators_executed_once():
+    """Verify that identical validator invocations are executed once and their results returned for each of them."""
+
+    class FakeQueue(Resource):
+        """Fake resource class registering the same validator of its siblings."""
+
+        def __init__(self, subnet_ids, settings):
+            super().__init__()
+            self.subnet_ids = subnet_ids
+            self.settings = settings
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeCountingValidator, subnet_ids=self.subnet_ids, settings=self.settings)
+
+    class FakeScheduling(Resource):
+        """Fake resource class with a list of nested resources."""
+
+        def __init__(self, queues):
+            super().__init__()
+            self.queues = queues
+
+    shared_settings = object()
+    FakeCountingValidator.executions.clear()
+    fake_resource = FakeScheduling(
+        [
+            FakeQueue(["subnet-1", "subnet-2"], {"Key": ["value"]}),
+            FakeQueue(["subnet-1", "subnet-2"], {"Key": ["value"]}),
+            FakeQueue(["subnet-2", "subnet-1"], {"Key": ["value"]}),
+            # Objects are compared by identity
+            FakeQueue(["subnet-3"], shared_settings),
+            FakeQueue(["subnet-3"], shared_settings),
+            FakeQueue(["subnet-3"], object()),
+        ]
+    )
+    validation_failures = fake_resource.validate()
+
+    assert_that(FakeCountingValidator.executions).is_equal_to(
+        [["subnet-1", "subnet-2"], ["subnet-2", "subnet-1"], ["subnet-3"], ["subnet-3"]]
+    )
+    assert_that([failure.message for failure in validation_failures]).is_equal_to(
+        ["Subnets ['subnet-1', 'subnet-2']."] * 2
+        + ["Subnets ['subnet-2', 'subnet-1']."]
+        + ["Subnets ['subnet-3']."] * 3
+    )
+
+
+class FakeTreeResource(Resource):
+    """Fake resource class registering an info validator with its name and containing nested resources."""
+
+    def __init__(self, name, children=None):
+        super().__init__()
+        self.name = name
+        self.children = children or []
+
+    def _register_validators(self, context: ValidatorContext = None):
+        self._register_validator(FakeInfoValidator, param=self.name)
+
+
+@pytest.mark.parametrize(
+    "changed_resource_names, expected_validated_names",
+    [
+        (None, ["queue1-cr", "queue1", "queue2-cr", "queue2", "scheduling", "headnode", "root"]),
+        (["queue2"], ["queue2-cr", "queue2", "scheduling", "root"]),
+        (["queue1-cr", "headnode"], ["queue1-cr", "queue1", "scheduling", "headnode", "root"]),
+        ([], ["root"]),
+    ],
+)
+def test_incremental_validation(changed_resource_names, expected_validated_names):
+    """Verify that only changed resources, their nested resources and their ancestors are validated."""
+    resources = {name: FakeTreeResource(name) for name in ["queue1-cr", "queue2-cr", "headnode"]}
+    resources["queue1"] = FakeTreeResource("queue1", [resources["queue1-cr"]])
+    resources["queue2"] = FakeTreeResource("queue2", [resources["queue2-cr"]])
+    resources["scheduling"] = FakeTreeResource("scheduling", [resources["queue1"], resources["queue2"]])
+    root = FakeTreeResource("root", [resources["scheduling"], resources["headnode"]])
+
+    changed_resources = (
+        [resources[name] for name in changed_resource_names] if changed_resource_names is not None else None
+    )
+    validation_failures = root.validate(changed_resources=changed_resources)
+
+    assert_that([failure.message for failure in validation_failures]).is_equal_to(
+        [f"Wrong value {name}." for name in expected_validated_names]
+    )
+
+
 @pytest.mark.parametrize(
     "value, default, expected_value, expected_implied",
     [
@@ -8,8 +8,10 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import os
 import shutil
+import time
 
 import pytest
 from assertpy import assert_that
@@ -17,6 +19,7 @@ from assertpy import assert_that
 from pcluster.config.cluster_config import QueueUpdateStrategy
 from pcluster.config.config_patch import Change, ConfigPatch
 from pcluster.config.update_policy import UpdatePolicy
+from pcluster.config.update_policy_utils import ClusterStateSnapshot
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.utils import load_yaml_dict
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -1133,3 +1136,126 @@ def test_patch_check_cluster_resource_bucket(
         line = ["{0}".format(element) if isinstance(element, str) else element for element in line]
         assert_that(expected_message_rows).contains(line)
     assert_that(patch_allowed).is_equal_to(not expected_error_row)
+
+
+class _QuadraticListConfigPatch(ConfigPatch):
+    """ConfigPatch comparing lists with the former nested scan, used as reference by the benchmark."""
+
+    def _compare_list(self, base_section, target_section, param_path, data_key, field_obj, change_update_policy):
+        update_key = field_obj.metadata.get("update_key")
+        for target_nested_section in target_section.get(data_key, []):
+            update_key_value = target_nested_section.get(update_key)
+            base_nested_section = next(
+                (
+                    nested_section
+                    for nested_section in base_section.get(data_key, [])
+                    if nested_section.get(update_key) == update_key_value
+                ),
+                None,
+            )
+            if base_nested_section:
+                nested_path = copy.deepcopy(list(param_path))
+                nested_path.append(f"{data_key}[{update_key_value}]")
+                self._compare_section(base_nested_section, target_nested_section, field_obj.schema, tuple(nested_path))
+                base_nested_section["visited"] = True
+            else:
+                self.changes.append(
+                    Change(list(param_path), data_key, None, target_nested_section, change_update_policy, True)
+                )
+        if base_section:
+            for base_nested_section in base_section.get(data_key, []):
+                if not base_nested_section.get("visited", False):
+                    self.changes.append(
+                        Change(list(param_path), data_key, base_nested_section, None, change_update_policy, True)
+                    )
+
+
+def _synthetic_config(queues, compute_resources, max_count):
+    return {
+        "Image": {"Os": "alinux2"},
+        "HeadNode": {"InstanceType": "t3.micro", "Networking": {"SubnetId": "subnet-12345678"}},
+        "Scheduling": {
+            "Scheduler": "slurm",
+            "SlurmQueues": [
+                {
+                    "Name": f"queue{queue}",
+                    "Networking": {"SubnetIds": ["subnet-12345678"]},
+                    "ComputeResources": [
+                        {"Name": f"cr{resource}", "InstanceType": "c5.xlarge", "MinCount": 0, "MaxCount": max_count}
+                        for resource in range(compute_resources)
+                    ],
+                }
+                for queue in range(queues)
+            ],
+        },
+    }
+
+
+def test_compare_list_benchmark():
+    """
+    Compare the changes and the time of the keyed list comparison with the former nested scan on 200 queues.
+
+    The changes are always checked. The times are reported and checked only when the
+    PCLUSTER_CONFIG_PATCH_BENCHMARK environment variable is set to true, e.g.:
+
+        PCLUSTER_CONFIG_PATCH_BENCHMARK=true pytest -s tests/pcluster/config/test_config_patch.py -k benchmark
+    """
+    base_config = _synthetic_config(queues=200, compute_resources=10, max_count=10)
+    target_config = _synthetic_config(queues=200, compute_resources=10, max_count=20)
+    # Remove, add and reorder queues
+    target_config["Scheduling"]["SlurmQueues"].pop(0)
+    target_config["Scheduling"]["SlurmQueues"].append(_synthetic_config(1, 1, 10)["Scheduling"]["SlurmQueues"][0])
+    target_config["Scheduling"]["SlurmQueues"][-1]["Name"] = "new-queue"
+    target_config["Scheduling"]["SlurmQueues"].reverse()
+    original_base_config = copy.deepcopy(base_config)
+
+    times = {}
+    changes = {}
+    for patch_class in [_QuadraticListConfigPatch, ConfigPatch]:
+        patch = patch_class(dummy_cluster(), base_config=base_config, target_config=target_config)
+        changes[patch_class] = patch.changes
+        # Best of 5 comparisons of the already copied configurations
+        times[patch_class] = float("inf")
+        for _ in range(5):
+            patch = patch_class(dummy_cluster(), base_config=base_config, target_config=target_config)
+            patch.changes = []
+            start_time = time.perf_counter()
+            patch._compare()
+            times[patch_class] = min(times[patch_class], time.perf_counter() - start_time)
+
+    assert_that(changes[ConfigPatch]).is_length(199 * 10 + 2)
+    assert_that(changes[ConfigPatch]).is_equal_to(changes[_QuadraticListConfigPatch])
+    assert_that(base_config).is_equal_to(original_base_config)
+    if os.environ.get("PCLUSTER_CONFIG_PATCH_BENCHMARK", "false").lower() == "true":
+        print(f"nested scan: {times[_QuadraticListConfigPatch]:.3f} s, keyed index: {times[ConfigPatch]:.3f} s")
+        assert_that(times[ConfigPatch]).is_less_than(times[_QuadraticListConfigPatch])
+
+
+@pytest.mark.parametrize("has_running_capacity", [True, False])
+def test_check_with_cluster_state_snapshot(mocker, has_running_capacity):
+    cluster = dummy_cluster()
+    has_running_capacity_mock = mocker.patch.object(cluster, "has_running_capacity", return_value=has_running_capacity)
+    base_config = _synthetic_config(queues=20, compute_resources=2, max_count=10)
+    target_config = _synthetic_config(queues=20, compute_resources=2, max_count=10)
+    target_config["Scheduling"]["SlurmQueues"].pop()
+    for queue in target_config["Scheduling"]["SlurmQueues"]:
+        queue["ComputeResources"][0]["InstanceType"] = "c5.2xlarge"
+
+    patch = ConfigPatch(cluster, base_config=base_config, target_config=target_config)
+    patch_allowed, rows = patch.check()
+
+    # The state of the cluster is retrieved once for all the changes
+    assert_that(patch_allowed).is_equal_to(not has_running_capacity)
+    assert_that(rows).is_length(21)
+    has_running_capacity_mock.assert_called_once()
+
+    # A snapshot provided in advance is used in place of the live cluster state
+    has_running_capacity_mock.reset_mock()
+    patch = ConfigPatch(
+        cluster,
+        base_config=base_config,
+        target_config=target_config,
+        cluster_state=ClusterStateSnapshot(has_running_capacity=not has_running_capacity),
+    )
+    assert_that(patch.check()[0]).is_equal_to(has_running_capacity)
+    has_running_capacity_mock.assert_not_called()
@@ -22,6 +22,7 @@ from pcluster.config.update_policy import (
     fail_reason_managed_placement_group,
     is_managed_placement_group_deletion,
 )
+from pcluster.config.update_policy_utils import ClusterStateSnapshot
 from pcluster.models.cluster import Cluster
 from tests.pcluster.test_utils import dummy_cluster
 
@@ -465,6 +466,7 @@ def test_condition_checker_resize_update_strategy_on_remove(
 
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     patch_mock.target_config = (
         {"Scheduling": {"SlurmSettings": {"QueueUpdateStrategy": update_strategy}}}
         if update_strategy
@@ -716,6 +718,7 @@ def test_queue_update_strategy_condition_checker(
 
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     patch_mock.target_config = (
         {"Scheduling": {"SlurmSettings": {"QueueUpdateStrategy": update_strategy}}}
         if update_strategy
@@ -784,6 +787,7 @@ def test_condition_checker_compute_fleet_stop_on_remove(
 
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
 
     change_mock = mocker.MagicMock()
     change_mock.path = path
@@ -818,6 +822,7 @@ def test_queue_update_strategy_fail_reason_and_actions_needed(
     cluster = dummy_cluster()
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     change_mock = mocker.MagicMock()
     change_mock.path = path
     change_mock.key = key
@@ -856,6 +861,7 @@ def test_compute_fleet_stop_on_remove_fail_reason_and_actions_needed(
     cluster = dummy_cluster()
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     change_mock = mocker.MagicMock()
     change_mock.path = path
     change_mock.key = key
@@ -897,6 +903,7 @@ def test_compute_fleet_stop_fail_reason_and_actions_needed(
     cluster = dummy_cluster()
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     change_mock = mocker.MagicMock()
     change_mock.path = path
     change_mock.key = key
@@ -1534,6 +1541,7 @@ def test_shared_storage_update_policy_condition_checker(
     )
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     if scheduler == "slurm":
         patch_mock.target_config = (
             {"Scheduling": {"SlurmSettings": {"QueueUpdateStrategy": update_strategy}}}
@@ -2461,6 +2469,7 @@ def test_login_nodes_pools_policy(
 
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     change_mock = mocker.MagicMock()
     change_mock.path = path
     change_mock.key = key
@@ -2748,6 +2757,7 @@ def test_home_change_policy(
     change_mock.key = "SharedStorage"
 
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     assert_that(UpdatePolicy.SHARED_STORAGE_UPDATE_POLICY.condition_checker(change_mock, patch_mock)).is_equal_to(
         expected_condition
     )
@@ -2758,3 +2768,40 @@ def test_home_change_policy(
         assert_that(UpdatePolicy.SHARED_STORAGE_UPDATE_POLICY.action_needed(change_mock, patch_mock)).is_equal_to(
             expected_action_needed
         )
+
+
+def test_cluster_state_snapshot(mocker):
+    cluster = dummy_cluster()
+    has_running_capacity_mock = mocker.patch.object(cluster, "has_running_capacity", return_value=True)
+    has_running_login_nodes_mock = mocker.patch.object(
+        cluster, "has_running_login_nodes", side_effect=lambda pool_name=None: pool_name != "pool2"
+    )
+    head_node_instance_mock = mocker.patch.object(
+        Cluster, "head_node_instance", new_callable=mocker.PropertyMock, return_value=mocker.MagicMock(state="stopped")
+    )
+
+    cluster_state = ClusterStateSnapshot(cluster)
+    for _ in range(3):
+        assert_that(cluster_state.has_running_capacity()).is_true()
+        assert_that(cluster_state.has_running_login_nodes()).is_true()
+        assert_that(cluster_state.has_running_login_nodes(pool_name="pool1")).is_true()
+        assert_that(cluster_state.has_running_login_nodes(pool_name="pool2")).is_false()
+        assert_that(cluster_state.get_head_node_state()).is_equal_to("stopped")
+
+    # Every fact is retrieved only once
+    has_running_capacity_mock.assert_called_once()
+    assert_that(has_running_login_nodes_mock.call_count).is_equal_to(3)
+    head_node_instance_mock.assert_called_once()
+
+
+def test_cluster_state_snapshot_without_cluster():
+    cluster_state = ClusterStateSnapshot(
+        has_running_capacity=False, has_running_login_nodes={"pool1": False, "pool2": True}, head_node_state="running"
+    )
+    assert_that(cluster_state.has_running_capacity()).is_false()
+    assert_that(cluster_state.has_running_login_nodes()).is_true()
+    assert_that(cluster_state.has_running_login_nodes(pool_name="pool1")).is_false()
+    assert_that(cluster_state.get_head_node_state()).is_equal_to("running")
+    assert_that(ClusterStateSnapshot(has_running_login_nodes=False).has_running_login_nodes("pool1")).is_false()
+    with pytest.raises(ValueError, match="running_capacity"):
+        cluster_state.get_running_capacity()
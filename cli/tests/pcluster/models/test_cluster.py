@@ -10,6 +10,7 @@
 # limitations under the License.
 import datetime
 import json
+import os
 from copy import deepcopy
 from unittest.mock import PropertyMock
 
@@ -20,8 +21,8 @@ from dateutil import tz
 
 from pcluster.api.models import ClusterStatus
 from pcluster.aws.aws_resources import ImageInfo
-from pcluster.aws.common import AWSClientError
-from pcluster.config.cluster_config import Tag
+from pcluster.aws.common import AWSClientError, LimitExceededError
+from pcluster.config.cluster_config import SlurmClusterConfig, Tag
 from pcluster.config.common import AllValidatorsSuppressor
 from pcluster.config.update_policy import UpdatePolicy
 from pcluster.constants import PCLUSTER_CLUSTER_NAME_TAG, PCLUSTER_NODE_TYPE_TAG, PCLUSTER_VERSION_TAG
@@ -502,7 +503,6 @@ class TestCluster:
             cluster.export_logs(**kwargs)
             # check archive steps
             download_stack_events_mock.assert_called()
-            create_logs_archive_mock.assert_called()
 
             # check preliminary steps
             stack_exists_mock.assert_called_with(cluster.stack_name)
@@ -514,8 +514,11 @@ class TestCluster:
                 cw_logs_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
 
-            if "output_file" not in kwargs:
-                print("kwargs", kwargs)
+            if "output_file" in kwargs:
+                create_logs_archive_mock.assert_called()
+                upload_archive_mock.assert_not_called()
+            else:
+                create_logs_archive_mock.assert_not_called()
                 upload_archive_mock.assert_called()
                 presign_mock.assert_called()
 
@@ -623,7 +626,16 @@ class TestCluster:
         )
         mocker.patch(
             "pcluster.aws.ec2.Ec2Client.describe_instances",
-            return_value=([{"InstanceId": "i-123456789"}], None),
+            return_value=(
+                [
+                    {
+                        "InstanceId": "i-123456789",
+                        "State": {"Name": "running"},
+                        "Tags": [{"Key": PCLUSTER_NODE_TYPE_TAG, "Value": "HeadNode"}],
+                    }
+                ],
+                None,
+            ),
             expected_params=[
                 {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": ["WHATEVER-CLUSTER-NAME"]},
                 {"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": ["HeadNode"]},
@@ -659,6 +671,63 @@ class TestCluster:
                     force=force,
                 )
 
+    @pytest.mark.parametrize(
+        "incremental_validation, config_edit, expected_changed_resources",
+        [
+            ("true", ("MaxCount: 11", "MaxCount: 12"), ["queue2"]),
+            ("false", ("MaxCount: 11", "MaxCount: 12"), None),
+            ("true", ("InstanceType: t3.micro", "InstanceType: t3.small"), None),
+        ],
+    )
+    def test_validate_update_request_incremental(
+        self, mocker, incremental_validation, config_edit, expected_changed_resources
+    ):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_image",
+            return_value=ImageInfo({"BlockDeviceMappings": [{"Ebs": {"VolumeSize": 35}}]}),
+        )
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            return_value=(
+                [
+                    {
+                        "InstanceId": "i-123456789",
+                        "State": {"Name": "running"},
+                        "Tags": [{"Key": PCLUSTER_NODE_TYPE_TAG, "Value": "HeadNode"}],
+                    }
+                ],
+                None,
+            ),
+        )
+        mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=True)
+        mocker.patch.dict(os.environ, {"PCLUSTER_VALIDATION_INCREMENTAL": incremental_validation})
+        validate_spy = mocker.spy(SlurmClusterConfig, "validate")
+        cluster = Cluster(
+            FAKE_NAME,
+            stack=ClusterStack(
+                {
+                    "StackName": FAKE_NAME,
+                    "CreationTime": "2021-06-04 10:23:20.199000+00:00",
+                    "StackStatus": ClusterStatus.CREATE_COMPLETE,
+                    "Tags": [{"Key": PCLUSTER_VERSION_TAG, "Value": FAKE_VERSION}],
+                }
+            ),
+            config=OLD_CONFIGURATION,
+        )
+
+        cluster.validate_update_request(
+            target_source_config=OLD_CONFIGURATION.replace(*config_edit),
+            validator_suppressors={AllValidatorsSuppressor()},
+            force=True,
+        )
+
+        changed_resources = validate_spy.call_args[1]["changed_resources"]
+        if expected_changed_resources is None:
+            assert_that(changed_resources).is_none()
+        else:
+            assert_that([resource.name for resource in changed_resources]).is_equal_to(expected_changed_resources)
+
     def test_upload_config(self, mocker, cluster):
         mock_aws_api(mocker)
         mock_bucket(mocker)
@@ -837,6 +906,145 @@ class TestCluster:
         mocker.patch("pcluster.models.login_nodes_status.LoginNodesStatus.get_unhealthy_nodes", return_value=unhealthy)
         assert_that(cluster.has_running_login_nodes()).is_equal_to(expected_result)
 
+    def test_has_running_login_nodes_by_pool(self, mocker, cluster):
+        login_nodes_status = mocker.MagicMock()
+        login_nodes_status.get_healthy_nodes.side_effect = lambda pool_name=None: 0 if pool_name == "pool2" else 1
+        login_nodes_status.get_unhealthy_nodes.return_value = 0
+        login_nodes_status_mock = mocker.patch.object(
+            Cluster, "login_nodes_status", new_callable=mocker.PropertyMock, return_value=login_nodes_status
+        )
+
+        # The value is cached per pool
+        for _ in range(2):
+            assert_that(cluster.has_running_login_nodes()).is_true()
+            assert_that(cluster.has_running_login_nodes(pool_name="pool2")).is_false()
+        assert_that(login_nodes_status_mock.call_count).is_equal_to(2)
+
+    @pytest.mark.parametrize("cluster_size, expected_calls", [(3, 2), (2000, 4)], ids=["small", "large"])
+    def test_indexed_instances(self, mocker, cluster, cluster_size, expected_calls):
+        mock_aws_api(mocker)
+        instances = [_instance_data("i-head", "HeadNode"), _instance_data("i-login", "LoginNode")] + [
+            _instance_data(f"i-compute{index}", "Compute") for index in range(cluster_size - 2)
+        ]
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances", side_effect=_paginated_describe_instances(instances)
+        )
+
+        with cluster.indexed_instances():
+            # Repeated lookups are memoized
+            for _ in range(2):
+                assert_that(cluster.head_node_instance.id).is_equal_to("i-head")
+            assert_that(describe_instances_mock.call_count).is_equal_to(1)
+            # The lookup of a second node type lists the cluster, indexed only if it fits in a single page
+            compute_instances, _ = cluster.describe_instances(node_type=NodeType.COMPUTE)
+            assert_that([instance.id for instance in cluster.login_node_instances]).is_equal_to(["i-login"])
+        assert_that(describe_instances_mock.call_count).is_equal_to(expected_calls)
+        # Results are the same as outside of the indexed operation
+        assert_that(compute_instances).is_length(min(cluster_size - 2, 1000))
+
+        # Lookups outside the operation filter the instances on the EC2 side
+        assert_that(cluster.head_node_instance.id).is_equal_to("i-head")
+        assert_that(describe_instances_mock.call_count).is_equal_to(expected_calls + 1)
+
+    def test_validate_update_request_instance_lookups(self, mocker):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_image",
+            return_value=ImageInfo({"BlockDeviceMappings": [{"Ebs": {"VolumeSize": 35}}]}),
+        )
+        instances = [_instance_data("i-head", "HeadNode")] + [
+            _instance_data(f"i-compute{index}", "Compute") for index in range(5000)
+        ]
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances", side_effect=_paginated_describe_instances(instances)
+        )
+        mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=True)
+        mocker.patch("pcluster.models.cluster.ClusterStack.scheduler", new_callable=PropertyMock(return_value="slurm"))
+        cluster = Cluster(
+            FAKE_NAME,
+            stack=ClusterStack(
+                {
+                    "StackName": FAKE_NAME,
+                    "CreationTime": "2021-06-04 10:23:20.199000+00:00",
+                    "StackStatus": ClusterStatus.CREATE_COMPLETE,
+                    "Tags": [{"Key": PCLUSTER_VERSION_TAG, "Value": FAKE_VERSION}],
+                }
+            ),
+            config=OLD_CONFIGURATION,
+        )
+
+        cluster.validate_update_request(
+            target_source_config=OLD_CONFIGURATION.replace("MaxCount: 11", "MaxCount: 12"),
+            validator_suppressors={AllValidatorsSuppressor()},
+            force=True,
+        )
+
+        # Only the head node is retrieved, the compute nodes of the cluster are never listed
+        assert_that(describe_instances_mock.call_count).is_equal_to(1)
+        filters = describe_instances_mock.call_args[0][0]
+        assert_that(filters).contains({"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": ["HeadNode"]})
+
+    @pytest.mark.parametrize("failing_batch", [None, 1])
+    def test_terminate_nodes(self, mocker, cluster, failing_batch):
+        mock_aws_api(mocker)
+        instance_ids = [f"i-{index:017d}" for index in range(250)]
+        mocker.patch("pcluster.aws.ec2.Ec2Client.list_instance_ids", return_value=instance_ids)
+
+        def _terminate_instances(batch):
+            if failing_batch is not None and batch[0] == instance_ids[failing_batch * 100]:
+                raise AWSClientError("terminate_instances", "error")
+
+        terminate_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.terminate_instances", side_effect=_terminate_instances
+        )
+
+        if failing_batch is None:
+            cluster.terminate_nodes()
+        else:
+            with pytest.raises(ClusterActionError, match="Unable to delete running EC2 instances with error: error"):
+                cluster.terminate_nodes()
+
+        # All the batches are terminated, even when one of them fails
+        terminated_batches = {call.args[0] for call in terminate_instances_mock.call_args_list}
+        assert_that(terminated_batches).is_equal_to(
+            {tuple(instance_ids[0:100]), tuple(instance_ids[100:200]), tuple(instance_ids[200:250])}
+        )
+        assert_that(terminate_instances_mock.call_count).is_equal_to(3)
+
+    def test_terminate_nodes_throttled(self, mocker, cluster):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.aws.ec2.Ec2Client.list_instance_ids", return_value=["i-1"])
+        terminate_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.terminate_instances",
+            side_effect=LimitExceededError("terminate_instances", "Request limit exceeded.", "RequestLimitExceeded"),
+        )
+
+        # The throttled requests are retried by the rate limiter of the client, they are not retried again
+        with pytest.raises(ClusterActionError, match="Request limit exceeded"):
+            cluster.terminate_nodes()
+        assert_that(terminate_instances_mock.call_count).is_equal_to(1)
+
+    @pytest.mark.parametrize("terminated", [True, False])
+    def test_wait_nodes_termination(self, mocker, cluster, terminated):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.cluster.time.sleep")
+        mocker.patch("pcluster.models.cluster.time.monotonic", side_effect=[0, 5, 10, 30])
+        list_instance_ids_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.list_instance_ids",
+            side_effect=[["i-1", "i-2"], ["i-1"], [] if terminated else ["i-1"]],
+        )
+
+        if terminated:
+            cluster.wait_nodes_termination(timeout=20)
+        else:
+            with pytest.raises(ClusterActionError, match="termination of 1 compute nodes after 20 seconds"):
+                cluster.wait_nodes_termination(timeout=20)
+        assert_that(list_instance_ids_mock.call_count).is_equal_to(3)
+        filters = list_instance_ids_mock.call_args[0][0]
+        assert_that(filters).contains(
+            {"Name": "instance-state-name", "Values": ["pending", "running", "shutting-down", "stopping", "stopped"]}
+        )
+
     def test_login_nodes_on_batch(self, mocker, cluster):
         mocker.patch("pcluster.models.cluster_resources.ClusterStack.scheduler", return_value="awsbatch")
         lns = cluster.login_nodes_status
@@ -878,3 +1086,26 @@ class _MockExportClusterLogsFiltersParser:
 class _MockListClusterLogsFiltersParser:
     def __init__(self):
         self.log_stream_prefix = None
+
+
+def _instance_data(instance_id, node_type):
+    return {
+        "InstanceId": instance_id,
+        "State": {"Name": "running"},
+        "Tags": [{"Key": PCLUSTER_NODE_TYPE_TAG, "Value": node_type}],
+    }
+
+
+def _paginated_describe_instances(instances, page_size=1000):
+    """Return a fake Ec2Client.describe_instances, filtering the instances by node type and paginating them."""
+
+    def _describe_instances(filters, next_token=None):
+        node_types = [f["Values"] for f in filters if f["Name"] == f"tag:{PCLUSTER_NODE_TYPE_TAG}"]
+        matches = [
+            instance for instance in instances if not node_types or instance["Tags"][0]["Value"] in node_types[0]
+        ]
+        start = int(next_token or 0)
+        next_start = start + page_size
+        return matches[start:next_start], str(next_start) if next_start < len(matches) else None
+
+    return _describe_instances
@@ -17,6 +17,7 @@ from assertpy import assert_that
 
 from pcluster.models.cluster_resources import (
     ClusterInstance,
+    ClusterInstanceIndex,
     ClusterLogsFiltersParser,
     ExportClusterLogsFiltersParser,
     FiltersParserError,
@@ -208,3 +209,36 @@ class TestExportClusterLogsFiltersParser:
             if "start_time" not in attrs:
                 describe_log_group_mock.assert_called_with(log_group_name)
                 assert_that(export_logs_filters.start_time).is_equal_to(creation_time_mock)
+
+
+def _cluster_instance(instance_id, node_type, state="running", queue_name=None, pool_name=None):
+    tags = [{"Key": "parallelcluster:node-type", "Value": node_type}]
+    if queue_name:
+        tags.append({"Key": "parallelcluster:queue-name", "Value": queue_name})
+    if pool_name:
+        tags.append({"Key": "parallelcluster:login-nodes-pool-name", "Value": pool_name})
+    return ClusterInstance({"InstanceId": instance_id, "State": {"Name": state}, "Tags": tags})
+
+
+def test_cluster_instance_index():
+    index = ClusterInstanceIndex(
+        [
+            _cluster_instance("i-head", "HeadNode"),
+            _cluster_instance("i-compute1", "Compute", queue_name="queue1"),
+            _cluster_instance("i-compute2", "Compute", state="stopped", queue_name="queue2"),
+            _cluster_instance("i-compute3", "Compute", state="pending", queue_name="queue1"),
+            _cluster_instance("i-login1", "LoginNode", pool_name="pool1"),
+        ]
+    )
+
+    def _ids(**criteria):
+        return [instance.id for instance in index.get_instances(**criteria)]
+
+    assert_that(index).is_length(5)
+    assert_that(_ids()).is_equal_to(["i-head", "i-compute1", "i-compute2", "i-compute3", "i-login1"])
+    assert_that(_ids(node_type="HeadNode")).is_equal_to(["i-head"])
+    assert_that(_ids(node_type="Compute")).is_equal_to(["i-compute1", "i-compute2", "i-compute3"])
+    assert_that(_ids(node_type="Compute", queue_name="queue1")).is_equal_to(["i-compute1", "i-compute3"])
+    assert_that(_ids(node_type="LoginNode")).is_equal_to(["i-login1"])
+    assert_that(_ids(node_type="LoginNode", queue_name="queue1")).is_empty()
+    assert_that(_ids(queue_name="unknown")).is_empty()
@@ -9,7 +9,10 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import gzip
+import io
 import os
+import tarfile
 import time
 
 import pytest
@@ -17,10 +20,13 @@ from assertpy import assert_that
 
 from pcluster.aws.common import AWSClientError
 from pcluster.models.common import (
+    BadRequest,
     CloudWatchLogsExporter,
     FiltersParserError,
     LogGroupTimeFiltersParser,
     LogsExporterError,
+    create_logs_archive,
+    upload_archive,
 )
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
@@ -326,3 +332,136 @@ class TestCloudWatchLogsExporter:
         else:
             task_id = cw_logs_exporter._export_logs_to_s3("log_group_name", "bucket")
             wait_for_completion_mock.assert_called_with(task_id)
+
+    @pytest.mark.parametrize("download_concurrency", [1, 4])
+    def test_download_s3_objects_with_prefix(self, cw_logs_exporter, mocker, tmpdir, download_concurrency):
+        """Verify that exported objects are decompressed into one file per log stream, preserving their order."""
+        mock_aws_api(mocker)
+        prefix = f"{cw_logs_exporter.bucket_prefix}/task_id"
+        objects_content = {
+            f"{prefix}/ip-10-0-0-1.i-123.slurmd/000001.gz": b"second chunk\n",
+            f"{prefix}/ip-10-0-0-1.i-123.slurmd/000000.gz": b"first chunk\n",
+            f"{prefix}/ip-10-0-0-2.i-456.slurmd/000000.gz": b"other stream\n" * 100000,
+        }
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[mocker.MagicMock(key=key) for key in objects_content],
+        )
+        get_object_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": io.BytesIO(gzip.compress(objects_content[key]))},
+        )
+        cw_logs_exporter.download_concurrency = download_concurrency
+
+        cw_logs_exporter._download_s3_objects_with_prefix("task_id", str(tmpdir))
+
+        assert_that(get_object_mock.call_count).is_equal_to(3)
+        assert_that((tmpdir / "ip-10-0-0-1.i-123.slurmd").read_binary()).is_equal_to(b"first chunk\nsecond chunk\n")
+        assert_that((tmpdir / "ip-10-0-0-2.i-456.slurmd").read_binary()).is_equal_to(b"other stream\n" * 100000)
+
+    def test_download_s3_objects_with_prefix_error(self, cw_logs_exporter, mocker, tmpdir):
+        """Verify that a failed download is propagated."""
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[mocker.MagicMock(key=f"{cw_logs_exporter.bucket_prefix}/task_id/stream/000000.gz")],
+        )
+        mocker.patch("pcluster.aws.s3.S3Client.get_object", side_effect=AWSClientError("get_object", "denied"))
+
+        with pytest.raises(AWSClientError, match="denied"):
+            cw_logs_exporter._download_s3_objects_with_prefix("task_id", str(tmpdir))
+
+
+def _read_tar_archive(archive_data: bytes):
+    """Return the content of the files in the given tar.gz archive, by path."""
+    with tarfile.open(fileobj=io.BytesIO(archive_data), mode="r:gz") as tar:
+        return {member.name: tar.extractfile(member).read() for member in tar.getmembers() if member.isfile()}
+
+
+@pytest.fixture()
+def logs_directory(tmpdir):
+    logs_dir = tmpdir.mkdir("clustername-logs-202601010000")
+    logs_dir.mkdir("cloudwatch-logs").join("ip-10-0-0-1.slurmd").write_binary(os.urandom(3 * 1024 * 1024))
+    logs_dir.join("clustername-cfn-events").write_text("[]", encoding="utf-8")
+    return str(logs_dir)
+
+
+def test_create_logs_archive(logs_directory):
+    archive_path = create_logs_archive(logs_directory)
+
+    assert_that(archive_path).is_equal_to(f"{logs_directory}.tar.gz")
+    with open(archive_path, "rb") as archive_file:
+        archive_content = _read_tar_archive(archive_file.read())
+    assert_that(archive_content).contains_key(
+        "clustername-logs-202601010000/cloudwatch-logs/ip-10-0-0-1.slurmd",
+        "clustername-logs-202601010000/clustername-cfn-events",
+    )
+
+
+@pytest.mark.parametrize("bucket_prefix", [None, "prefix"])
+def test_upload_archive(mocker, logs_directory, bucket_prefix):
+    """Verify that the archive is streamed to S3 while it is being created, without writing it on disk."""
+    mock_aws_api(mocker)
+    uploaded_data = io.BytesIO()
+
+    def _upload_fileobj(bucket_name, file_obj, key):
+        assert_that(hasattr(file_obj, "seek")).is_false()
+        while True:
+            chunk = file_obj.read(1024 * 1024)
+            if not chunk:
+                break
+            uploaded_data.write(chunk)
+
+    upload_mock = mocker.patch("pcluster.aws.s3.S3Client.upload_fileobj", side_effect=_upload_fileobj)
+
+    s3_path = upload_archive("bucket_name", bucket_prefix, logs_directory)
+
+    expected_key = "clustername-logs-202601010000.tar.gz"
+    expected_key = f"{bucket_prefix}/{expected_key}" if bucket_prefix else expected_key
+    assert_that(s3_path).is_equal_to(f"s3://bucket_name/{expected_key}")
+    assert_that(upload_mock.call_args[0][2]).is_equal_to(expected_key)
+    assert_that(os.path.exists(f"{logs_directory}.tar.gz")).is_false()
+    with open(os.path.join(logs_directory, "cloudwatch-logs", "ip-10-0-0-1.slurmd"), "rb") as log_file:
+        assert_that(_read_tar_archive(uploaded_data.getvalue())).contains_entry(
+            {"clustername-logs-202601010000/cloudwatch-logs/ip-10-0-0-1.slurmd": log_file.read()}
+        )
+
+
+def test_upload_archive_errors(mocker, logs_directory):
+    mock_aws_api(mocker)
+
+    # An error while creating the archive fails the upload
+    mocker.patch(
+        "pcluster.aws.s3.S3Client.upload_fileobj", side_effect=lambda bucket_name, file_obj, key: file_obj.read()
+    )
+    mocker.patch("pcluster.models.common.tarfile.TarFile.add", side_effect=OSError("disk error"))
+    with pytest.raises(OSError, match="disk error"):
+        upload_archive("bucket_name", None, logs_directory)
+
+    # An upload error interrupts the creation of the archive
+    mocker.stopall()
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.aws.s3.S3Client.upload_fileobj", side_effect=AWSClientError("upload_fileobj", "denied"))
+    with pytest.raises(AWSClientError, match="denied"):
+        upload_archive("bucket_name", None, logs_directory)
+
+
+def test_zstd_compression(mocker, logs_directory):
+    mocker.patch.dict("sys.modules", {"zstandard": None})
+    with pytest.raises(BadRequest, match="requires the zstandard Python package"):
+        create_logs_archive(logs_directory, compression="zstd")
+    with pytest.raises(BadRequest, match="Unsupported compression bzip2"):
+        create_logs_archive(logs_directory, compression="bzip2")
+
+
+def test_create_zstd_logs_archive(logs_directory):
+    zstandard = pytest.importorskip("zstandard")
+
+    archive_path = create_logs_archive(logs_directory, compression="zstd")
+
+    assert_that(archive_path).is_equal_to(f"{logs_directory}.tar.zst")
+    with open(archive_path, "rb") as archive_file, zstandard.ZstdDecompressor().stream_reader(archive_file) as reader:
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
+            assert_that([member.name for member in tar]).contains(
+                "clustername-logs-202601010000/clustername-cfn-events"
+            )
@@ -4,6 +4,7 @@ import os
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSClientError
 from pcluster.models.compute_fleet_status_manager import (
     ComputeFleetStatus,
     ComputeFleetStatusManager,
@@ -177,3 +178,42 @@ class TestComputeFleetStatusManager:
     def test_get_manager(self, version, expected_compute_fleet_status_manager_instance):
         compute_fleet_status_manager = ComputeFleetStatusManager.get_manager("cluster-name", version)
         assert_that(compute_fleet_status_manager).is_instance_of(expected_compute_fleet_status_manager_instance)
+
+    @pytest.mark.parametrize("batch_error", [False, True])
+    def test_get_status_with_last_updated_time_by_cluster(self, mocker, batch_error):
+        ddb_resource_mock = mocker.patch("pcluster.aws.aws_api.AWSApi.instance").return_value.ddb_resource
+        items = {
+            "parallelcluster-json-cluster": [
+                {"Id": "COMPUTE_FLEET", "Data": {"status": "RUNNING", "lastStatusUpdatedTime": "2022-01-01"}}
+            ],
+            "parallelcluster-plain-cluster": [
+                {"Id": "COMPUTE_FLEET", "Status": "STOPPED", "LastUpdatedTime": "2021-01-01"}
+            ],
+            "parallelcluster-invalid-cluster": [{"Id": "COMPUTE_FLEET", "Data": {"status": "INVALID"}}],
+        }
+        if batch_error:
+            ddb_resource_mock.batch_get_items.side_effect = AWSClientError("batch_get_items", "Table not found")
+            ddb_resource_mock.get_item.side_effect = lambda table_name, _: {"Item": items[table_name][0]}
+        else:
+            ddb_resource_mock.batch_get_items.return_value = items
+
+        statuses = ComputeFleetStatusManager.get_status_with_last_updated_time_by_cluster(
+            {"json-cluster": "3.2.0", "plain-cluster": "3.1.1", "invalid-cluster": "3.2.0"}
+        )
+
+        assert_that(statuses).is_equal_to(
+            {
+                "json-cluster": (ComputeFleetStatus.RUNNING, "2022-01-01"),
+                "plain-cluster": (ComputeFleetStatus.STOPPED, "2021-01-01"),
+                "invalid-cluster": (ComputeFleetStatus.UNKNOWN, None),
+            }
+        )
+        ddb_resource_mock.batch_get_items.assert_called_once_with(
+            {
+                "parallelcluster-json-cluster": [{"Id": "COMPUTE_FLEET"}],
+                "parallelcluster-plain-cluster": [{"Id": "COMPUTE_FLEET"}],
+                "parallelcluster-invalid-cluster": [{"Id": "COMPUTE_FLEET"}],
+            }
+        )
+        # Items are retrieved one by one only when the batch request fails
+        assert_that(ddb_resource_mock.get_item.call_count).is_equal_to(3 if batch_error else 0)
@@ -584,11 +584,14 @@ class TestImageBuilder:
             else:
                 cw_logs_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
-            create_logs_archive_mock.assert_called()
 
-        if "output_file" not in kwargs:
-            upload_archive_mock.assert_called()
-            presign_mock.assert_called()
+            if "output_file" in kwargs:
+                create_logs_archive_mock.assert_called()
+                upload_archive_mock.assert_not_called()
+            else:
+                create_logs_archive_mock.assert_not_called()
+                upload_archive_mock.assert_called()
+                presign_mock.assert_called()
 
     @pytest.mark.parametrize(
         "log_group_exists, client_error, expected_error",
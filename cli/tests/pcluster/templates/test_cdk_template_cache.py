@@ -0,0 +1,153 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import hashlib
+import json
+import os
+import re
+import time
+
+import pytest
+from assertpy import assert_that
+from freezegun import freeze_time
+
+from pcluster.templates import cluster_stack
+from pcluster.templates.cdk_builder import CDKTemplateBuilder
+from pcluster.templates.cdk_template_cache import CDKTemplateCache
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket, mock_bucket_object_utils
+from tests.pcluster.utils import load_cluster_model_from_yaml
+
+TEMPLATE = {"Resources": {"HeadNodeWaitCondition20260101000000": {"Properties": {"Key": "clusters/abc/config.yaml"}}}}
+ASSETS = [
+    {
+        "id": "asset-1",
+        "metadata": {"s3_object_key_parameter": {"value": "clusters/abc/assets/asset-1"}, "content": {"Resources": {}}},
+    }
+]
+
+
+@pytest.fixture()
+def template_cache(tmpdir):
+    return CDKTemplateCache(cache_dir=str(tmpdir / "templates"))
+
+
+def test_put_and_get(template_cache):
+    assert_that(
+        template_cache.put(
+            "key", "cluster", TEMPLATE, ASSETS, {"Timestamp": "20260101000000", "Directory": "clusters/abc"}
+        )
+    ).is_true()
+
+    template, assets = template_cache.get("key", {"Timestamp": "20260202000000", "Directory": "clusters/xyz"})
+    assert_that(template).is_equal_to(
+        {"Resources": {"HeadNodeWaitCondition20260202000000": {"Properties": {"Key": "clusters/xyz/config.yaml"}}}}
+    )
+    # Assets are renamed after the hash of their content
+    content_hash = hashlib.sha256(json.dumps({"Resources": {}}).encode("utf-8")).hexdigest()
+    assert_that(assets[0]["id"]).is_equal_to(content_hash)
+    assert_that(assets[0]["metadata"]["s3_object_key_parameter"]["value"]).is_equal_to(
+        f"clusters/xyz/assets/{content_hash}"
+    )
+
+    # Volatile values must match the ones of the stored entry
+    assert_that(template_cache.get("key", {"Timestamp": "20260202000000"})).is_none()
+    assert_that(template_cache.get("other-key", {"Timestamp": "20260202000000", "Directory": "clusters/xyz"})).is_none()
+
+
+def test_put_overlapping_volatile_values(template_cache):
+    assert_that(
+        template_cache.put("key", "cluster", TEMPLATE, ASSETS, {"Name": "clusters", "Directory": "clusters/abc"})
+    ).is_false()
+    assert_that(template_cache.list_entries()).is_empty()
+
+
+@pytest.mark.parametrize(
+    "volatile_values",
+    [
+        {"ConfigVersion": "null", "Directory": "clusters/abc"},
+        {"Timestamp": "2026010100", "Directory": "clusters/abc"},
+        {"Directory": "clusters/ab"},
+    ],
+    ids=["too_short", "part_of_longer_number", "part_of_longer_word"],
+)
+def test_put_ambiguous_volatile_values(template_cache, volatile_values):
+    # Substituting these values back would also change the other numbers and words containing them
+    assert_that(template_cache.put("key", "cluster", TEMPLATE, ASSETS, volatile_values)).is_false()
+    assert_that(template_cache.list_entries()).is_empty()
+
+
+def test_expired_entry(template_cache):
+    template_cache.put("key", "cluster", TEMPLATE, ASSETS, {"Directory": "clusters/abc"})
+    template_cache.ttl = 0
+    time.sleep(0.01)
+
+    assert_that(template_cache.get("key", {"Directory": "clusters/abc"})).is_none()
+    assert_that(template_cache.list_entries()).is_empty()
+
+
+def test_list_purge_and_evict(template_cache):
+    template_cache.max_entries = 2
+    for index, cluster_name in enumerate(["cluster1", "cluster2", "cluster2"]):
+        template_cache.put(f"key{index}", cluster_name, TEMPLATE, ASSETS, {})
+        os.utime(template_cache._entry_path(f"key{index}"), (index, index))
+
+    # The least recently used entry is evicted
+    entries = template_cache.list_entries()
+    assert_that([entry["key"] for entry in entries]).is_equal_to(["key2", "key1"])
+    assert_that(entries[0]).contains_entry({"clusterName": "cluster2"}, {"expired": False})
+
+    assert_that(template_cache.purge("cluster1")).is_equal_to(0)
+    assert_that(template_cache.purge("cluster2")).is_equal_to(2)
+    assert_that(template_cache.list_entries()).is_empty()
+
+
+def test_build_cluster_template_with_cache(mocker, tmpdir):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    upload_cfn_asset_mock = mock_bucket_object_utils(mocker)["upload_cfn_asset"]
+    mocker.patch.dict(
+        os.environ,
+        {"PCLUSTER_TEMPLATE_CACHE_ENABLED": "true", "PCLUSTER_TEMPLATE_CACHE_PATH": str(tmpdir / "templates")},
+    )
+    cluster_stack_spy = mocker.spy(cluster_stack, "ClusterCdkStack")
+
+    def _build_template(config_version, artifact_directory):
+        _, cluster = load_cluster_model_from_yaml("slurm.required.yaml")
+        cluster.config_version = config_version
+        return CDKTemplateBuilder().build_cluster_template(
+            cluster_config=cluster,
+            bucket=dummy_cluster_bucket(artifact_directory=artifact_directory),
+            stack_name="clustername",
+        )
+
+    with freeze_time("2026-01-01T01:01:01"):
+        _build_template("config-version-1", "parallelcluster/clusters/clustername-directory1")
+    assert_that(cluster_stack_spy.call_count).is_equal_to(1)
+
+    with freeze_time("2026-01-01T02:02:02"):
+        upload_cfn_asset_mock.reset_mock()
+        cached_template, cached_assets = _build_template(
+            "config-version-2", "parallelcluster/clusters/clustername-directory2"
+        )
+        assert_that(cluster_stack_spy.call_count).is_equal_to(1)
+        assert_that(upload_cfn_asset_mock.call_count).is_equal_to(len(cached_assets))
+
+        mocker.patch.dict(os.environ, {"PCLUSTER_TEMPLATE_CACHE_ENABLED": "false"})
+        template, assets = _build_template("config-version-2", "parallelcluster/clusters/clustername-directory2")
+        assert_that(cluster_stack_spy.call_count).is_equal_to(2)
+
+    # Cached assets are named after the hash of their content instead of the CDK asset hash
+    assert_that(_normalize_asset_ids([cached_template, cached_assets])).is_equal_to(
+        _normalize_asset_ids([template, assets])
+    )
+    assert_that(json.dumps(cached_template)).contains("20260101020202", "config-version-2", "clustername-directory2")
+
+
+def _normalize_asset_ids(result):
+    result = re.sub(r"(ArtifactHash|S3Bucket|S3VersionKey)[0-9A-F]{8}", r"\1", json.dumps(result))
+    return json.loads(re.sub(r"[0-9a-f]{64}", "AssetId", result))
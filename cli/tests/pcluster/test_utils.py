@@ -178,6 +178,122 @@ class TestCache:
 
         assert_that(self.invocations).is_length(4)
 
+    @staticmethod
+    @Cache.cached(max_size=2)
+    def _bounded_cached_method(arg):
+        TestCache.invocations.append(arg)
+        return arg
+
+    @staticmethod
+    @Cache.cached(ttl=60)
+    def _expiring_cached_method(arg):
+        TestCache.invocations.append(arg)
+        return arg
+
+    @staticmethod
+    @Cache.cached(persistent=True)
+    def _persistent_cached_method(arg):
+        TestCache.invocations.append(arg)
+        return {"value": arg}
+
+    def test_lru_eviction(self):
+        for arg in [1, 2, 1, 3, 1, 2]:
+            self._bounded_cached_method(arg)
+
+        # 2 is evicted when 3 is added, because 1 was used more recently
+        assert_that(self.invocations).is_equal_to([1, 2, 3, 2])
+        stats = Cache.get_stats()[f"{__name__}.TestCache._bounded_cached_method"]
+        assert_that(stats).contains_entry({"hits": 2}, {"misses": 4}, {"evictions": 2})
+
+    def test_ttl_expiration(self, mocker):
+        time_mock = mocker.patch("pcluster.aws.common.time.time", return_value=1000)
+        self._expiring_cached_method(1)
+        time_mock.return_value = 1059
+        self._expiring_cached_method(1)
+        time_mock.return_value = 1060
+        self._expiring_cached_method(1)
+
+        assert_that(self.invocations).is_length(2)
+        stats = Cache.get_stats()[f"{__name__}.TestCache._expiring_cached_method"]
+        assert_that(stats).contains_entry({"hits": 1}, {"expirations": 1})
+
+    @pytest.mark.parametrize("persistent_cache_enabled", ["true", "false"])
+    def test_persistent_cache(self, mocker, tmp_path, persistent_cache_enabled):
+        mocker.patch.dict(os.environ, {"PCLUSTER_PERSISTENT_CACHE_ENABLED": persistent_cache_enabled})
+        mocker.patch("pcluster.aws.common._get_caller_account", return_value="123456789012")
+        Cache.set_persistent_backend(pcluster.aws.common.SqliteCacheBackend(str(tmp_path / "cache.sqlite")))
+        try:
+            assert_that(self._persistent_cached_method("a")).is_equal_to({"value": "a"})
+            # Simulate a new CLI invocation by clearing the in-memory caches
+            Cache.clear_all()
+            assert_that(self._persistent_cached_method("a")).is_equal_to({"value": "a"})
+
+            expected_invocations = 1 if persistent_cache_enabled == "true" else 2
+            assert_that(self.invocations).is_length(expected_invocations)
+
+            Cache.clear_all(persistent=True)
+            self._persistent_cached_method("a")
+            assert_that(self.invocations).is_length(expected_invocations + 1)
+        finally:
+            Cache.set_persistent_backend(None)
+
+    def test_persistent_cache_account(self, mocker, tmp_path):
+        mocker.patch.dict(os.environ, {"PCLUSTER_PERSISTENT_CACHE_ENABLED": "true"})
+        get_caller_account_mock = mocker.patch("pcluster.aws.common._get_caller_account", return_value="123456789012")
+        Cache.set_persistent_backend(pcluster.aws.common.SqliteCacheBackend(str(tmp_path / "cache.sqlite")))
+        try:
+            self._persistent_cached_method("a")
+            Cache.clear_all()
+
+            # Results cached with the credentials of another account are not reused
+            get_caller_account_mock.return_value = "210987654321"
+            self._persistent_cached_method("a")
+            assert_that(self.invocations).is_length(2)
+
+            # Nothing is persisted when the account cannot be resolved
+            get_caller_account_mock.return_value = None
+            Cache.clear_all()
+            self._persistent_cached_method("a")
+            Cache.clear_all()
+            self._persistent_cached_method("a")
+            assert_that(self.invocations).is_length(4)
+        finally:
+            Cache.set_persistent_backend(None)
+
+    def test_get_caller_account(self, mocker):
+        pcluster.aws.common._CALLER_ACCOUNTS.clear()
+        session_mock = mocker.patch("pcluster.aws.common.boto3.session.Session")
+        client_mock = mocker.patch("pcluster.aws.common.boto3.client")
+        client_mock.return_value.get_caller_identity.return_value = {"Account": "123456789012"}
+        try:
+            for access_key in ["key1", "key1", "key2"]:
+                session_mock.return_value.get_credentials.return_value.access_key = access_key
+                assert_that(pcluster.aws.common._get_caller_account("us-east-1")).is_equal_to("123456789012")
+            # The account is resolved once per access key
+            assert_that(client_mock.return_value.get_caller_identity.call_count).is_equal_to(2)
+        finally:
+            pcluster.aws.common._CALLER_ACCOUNTS.clear()
+
+    def test_sqlite_backend(self, mocker, tmp_path):
+        time_mock = mocker.patch("pcluster.aws.common.time.time", return_value=1000)
+        backend = pcluster.aws.common.SqliteCacheBackend(str(tmp_path / "nested" / "cache.sqlite"), max_size=2)
+        backend.set("key1", {"a": 1}, ttl=10)
+        time_mock.return_value = 1001
+        backend.set("key2", [1, 2])
+        time_mock.return_value = 1002
+        assert_that(backend.get("key1")).is_equal_to((True, {"a": 1}))
+        time_mock.return_value = 1003
+        # Not JSON serializable values are not stored
+        backend.set("key3", object())
+        assert_that(backend.get("key3")).is_equal_to((False, None))
+        backend.set("key3", "value3")
+        assert_that(backend.get("key2")).is_equal_to((False, None))
+        time_mock.return_value = 1010
+        assert_that(backend.get("key1")).is_equal_to((False, None))
+        assert_that(backend.get("key3")).is_equal_to((True, "value3"))
+        assert_that(backend.stats.to_dict()).is_equal_to({"hits": 2, "misses": 3, "evictions": 1, "expirations": 1})
+        backend.close()
+
 
 def test_init_from_instance_type(mocker, caplog):
     mock_aws_api(mocker, mock_instance_type_info=False)
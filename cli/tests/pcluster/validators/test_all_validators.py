@@ -8,8 +8,10 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import os
 from unittest.mock import PropertyMock, call
 
+import pytest
 from assertpy import assert_that
 
 from pcluster.aws.aws_resources import ImageInfo
@@ -37,6 +39,12 @@ from pcluster.validators.common import AsyncValidator, Validator, ValidatorConte
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
 
+@pytest.fixture(autouse=True)
+def sequential_validation(mocker):
+    """Execute validators one at a time, so that the order of the calls to the mocked validators is deterministic."""
+    mocker.patch.dict(os.environ, {"PCLUSTER_VALIDATION_MAX_CONCURRENCY": "1"})
+
+
 def _is_validator_of_type(cls, name, validator_type):
     return (
         isinstance(cls, type)
@@ -298,12 +306,10 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
     scheduler_os_validator.assert_has_calls([call(os="alinux2", scheduler="slurm")])
     compute_resource_size_validator.assert_has_calls(
         [
-            # Defaults of min_count=0, max_count=10
-            call(min_count=0, max_count=10, capacity_type=CapacityType.SPOT),
+            # Defaults of min_count=0, max_count=10. Identical invocations are executed only once.
             call(min_count=0, max_count=10, capacity_type=CapacityType.SPOT),
             call(min_count=0, max_count=5, capacity_type=CapacityType.ONDEMAND),
             call(min_count=0, max_count=10, capacity_type=CapacityType.ONDEMAND),
-            call(min_count=0, max_count=10, capacity_type=CapacityType.ONDEMAND),
             call(min_count=5, max_count=5, capacity_type=CapacityType.CAPACITY_BLOCK),
             call(min_count=3, max_count=3, capacity_type=CapacityType.CAPACITY_BLOCK),
         ],
@@ -315,7 +321,6 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
             call(resources_length=7, max_length=50, resource_name="ComputeResources per Cluster"),
             call(resources_length=3, max_length=50, resource_name="ComputeResources per Queue"),
             call(resources_length=2, max_length=50, resource_name="ComputeResources per Queue"),
-            call(resources_length=2, max_length=50, resource_name="ComputeResources per Queue"),
         ],
         any_order=True,
     )
@@ -327,8 +332,6 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
             call(instance_type="t3.large", image="ami-12345678"),
             call(instance_type="c4.2xlarge", image="ami-12345678"),
             call(instance_type="c5.4xlarge", image="ami-12345678"),
-            call(instance_type="c5d.xlarge", image="ami-12345678"),
-            call(instance_type="t3.large", image="ami-12345678"),
             call(instance_type="t3.xlarge", image="ami-12345678"),
         ],
         any_order=True,
@@ -340,9 +343,7 @@ def test_slurm_validators_are_called_with_correct_argument(test_datadir, mocker)
             call(queue_name="queue2", subnet_ids=["subnet-23456789"]),
         ]
     )
-    security_groups_validator.assert_has_calls(
-        [call(security_group_ids=None), call(security_group_ids=None)], any_order=True
-    )
+    security_groups_validator.assert_has_calls([call(security_group_ids=None)])
     architecture_os_validator.assert_has_calls([call(os="alinux2", architecture="x86_64")])
     _assert_instance_architecture(
         expected_instance_architecture_validator_input=[
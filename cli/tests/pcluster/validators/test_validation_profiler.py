@@ -0,0 +1,111 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import asyncio
+import json
+import os
+
+import pytest
+from assertpy import assert_that
+from botocore.stub import Stubber
+
+from pcluster.aws.common import Boto3Client, Cache
+from pcluster.validators.common import AsyncValidator, FailureLevel, ValidationScheduler, Validator
+from pcluster.validators.validation_profiler import ValidationProfiler
+
+
+class _FakeEc2Client(Boto3Client):
+    def __init__(self):
+        super().__init__("ec2")
+        self.stubber = Stubber(self._client)
+
+    @Cache.cached
+    def describe_vpc(self, vpc_id):
+        return self._client.describe_vpcs(VpcIds=[vpc_id])["Vpcs"][0]
+
+
+class FakeAwsValidator(Validator):
+    """Dummy validator describing the same VPC twice, the second time from the cache."""
+
+    def _validate(self, client, vpc_id):
+        client.describe_vpc(vpc_id)
+        client.describe_vpc(vpc_id)
+
+
+class FakeSleepValidator(AsyncValidator):
+    """Dummy async validator waiting for the given time."""
+
+    async def _validate_async(self, duration):
+        await asyncio.sleep(duration)
+        self._add_failure("Slept.", FailureLevel.INFO)
+
+
+@pytest.fixture()
+def ec2_client(mocker):
+    mocker.patch.dict(os.environ, {"AWS_DEFAULT_REGION": "us-east-1"})
+    client = _FakeEc2Client()
+    client.stubber.add_response(
+        "describe_vpcs", {"Vpcs": [{"VpcId": "vpc-123"}]}, expected_params={"VpcIds": ["vpc-123"]}
+    )
+    client.stubber.activate()
+    yield client
+    client.stubber.deactivate()
+    Cache.clear_all()
+
+
+def test_validation_profiler_report(mocker, ec2_client):
+    profiler = ValidationProfiler("json")
+    write_report_mock = mocker.patch.object(profiler, "write_report")
+
+    failures = ValidationScheduler(profiler=profiler).run(
+        [
+            (FakeAwsValidator(), {"client": ec2_client, "vpc_id": "vpc-123"}),
+            (FakeSleepValidator(), {"duration": 0.2}),
+            (FakeSleepValidator(), {"duration": 0.1}),
+        ]
+    )
+
+    write_report_mock.assert_called_once()
+    assert_that([failure.message for failure in failures]).is_equal_to(["Slept.", "Slept."])
+    report = {entry["validator"]: entry for entry in profiler.report()}
+    assert_that(report).contains_only("FakeSleepValidator", "FakeAwsValidator")
+    assert_that(report["FakeSleepValidator"]).contains_entry({"executions": 2}, {"boto3Calls": 0}, {"cacheHits": 0})
+    assert_that(report["FakeSleepValidator"]["maxTime"]).is_greater_than_or_equal_to(0.2)
+    assert_that(report["FakeSleepValidator"]["totalTime"]).is_greater_than_or_equal_to(0.3)
+    assert_that(report["FakeAwsValidator"]).contains_entry({"executions": 1}, {"boto3Calls": 1}, {"cacheHits": 1})
+
+
+@pytest.mark.parametrize(
+    "output_format, expected_content",
+    [
+        ("json", '"validator": "FakeSleepValidator"'),
+        ("table", "FakeSleepValidator"),
+        ("unsupported", "Total time (s)"),
+    ],
+)
+def test_validation_profiler_from_environment(mocker, tmpdir, output_format, expected_content):
+    output_file = str(tmpdir / "profile.txt")
+    mocker.patch.dict(
+        os.environ, {"PCLUSTER_VALIDATION_PROFILE": output_format, "PCLUSTER_VALIDATION_PROFILE_FILE": output_file}
+    )
+
+    ValidationScheduler().run([(FakeSleepValidator(), {"duration": 0})])
+
+    with open(output_file, encoding="utf-8") as output:
+        content = output.read()
+    assert_that(content).contains(expected_content)
+    if output_format == "json":
+        assert_that(json.loads(content)["validators"][0]).contains_entry({"executions": 1})
+
+
+def test_validation_profiler_disabled(mocker):
+    mocker.patch.dict(os.environ, {"PCLUSTER_VALIDATION_PROFILE": ""})
+    assert_that(ValidationProfiler.from_environment()).is_none()
+    assert_that(ValidationScheduler().profiler).is_none()